@@ -0,0 +1,81 @@
+"""Throughput of alphabet encoded identifier generation and parsing.
+
+Run from the repository root:
+
+    python benchmarks/bench_alphabet.py
+"""
+
+from __future__ import print_function
+
+import timeit
+
+from openrange.alphabet import AlphabetRange, BASE62, HEX
+
+# ----------------------------------------------------------------------------
+
+ITEMS = 1000000
+
+WIDTH = 8
+
+# ----------------------------------------------------------------------------
+def bench(label, func, number, items=ITEMS):
+    seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print("{l:<40} {s:>10.3f} ms {r:>10.1f} M items/s".format(
+        l=label, s=seconds * 1000, r=items / seconds / 1e6))
+
+# ----------------------------------------------------------------------------
+def naive_encode(num, alphabet, width):
+    digits = ''
+    while num:
+        (num, digit) = divmod(num, len(alphabet))
+        digits = alphabet[digit] + digits
+    return digits.rjust(width, alphabet[0])
+
+# ----------------------------------------------------------------------------
+def naive_decode(item, alphabet):
+    num = 0
+    for symbol in item:
+        num = num * len(alphabet) + alphabet.index(symbol)
+    return num
+
+# ----------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    start = 10 ** 9
+
+    print("hex, width {w}".format(w=WIDTH))
+
+    rng = AlphabetRange(HEX, start, start + ITEMS - 1, width=WIDTH)
+    items = list(rng)
+
+    bench("format per item (baseline)",
+          lambda: ["{n:08x}".format(n=n) for n in range(start, start + ITEMS)],
+          1)
+    bench("list(rng)", lambda: list(rng), 1)
+    bench("rng.to_array()", rng.to_array, 1)
+    bench("int(s, 16) per item (baseline)",
+          lambda: [int(s, 16) for s in items[:100000]], 1, items=100000)
+    bench("rng.decode(s)",
+          lambda: [rng.decode(s) for s in items[:100000]], 1, items=100000)
+
+    print("base62, width {w}".format(w=WIDTH))
+
+    rng = AlphabetRange(BASE62, start, start + ITEMS - 1, width=WIDTH)
+    items = list(rng)
+
+    bench("divmod per item (baseline)",
+          lambda: [naive_encode(n, BASE62, WIDTH)
+                   for n in range(start, start + ITEMS)], 1)
+    bench("rng.encode(n)",
+          lambda: [rng.encode(n) for n in range(start, start + ITEMS)], 1)
+    bench("list(rng)", lambda: list(rng), 1)
+    bench("list(rng[::3])", lambda: list(rng[::3]), 1,
+          items=rng[::3].length)
+    bench("rng.to_array()", rng.to_array, 1)
+    bench("index per item (baseline)",
+          lambda: [naive_decode(s, BASE62) for s in items[:100000]], 1,
+          items=100000)
+    bench("rng.decode(s)",
+          lambda: [rng.decode(s) for s in items[:100000]], 1, items=100000)
+    bench("s in rng",
+          lambda: [s in rng for s in items[:100000]], 1, items=100000)
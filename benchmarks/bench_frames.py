@@ -0,0 +1,48 @@
+"""Throughput of frame spec parsing and formatting.
+
+Run from the repository root:
+
+    python benchmarks/bench_frames.py
+"""
+
+from __future__ import print_function
+
+import timeit
+
+from openrange.frames import format_frame_spec, parse_frame_spec
+
+# ----------------------------------------------------------------------------
+
+FRAMES = 100000
+
+# every other frame of a 100k frame shot, plus one extra frame per chunk
+SPEC = ",".join(
+    "{a}-{b}x2,{c}".format(a=n, b=n + 98, c=n + 99)
+    for n in range(1, FRAMES, 100)
+)
+
+# ----------------------------------------------------------------------------
+def bench(label, func, number):
+    seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print("{l:<40} {s:>10.3f} ms".format(l=label, s=seconds * 1000))
+
+# ----------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    ranges = parse_frame_spec(SPEC)
+    frames = [frame for rng in ranges for frame in rng]
+    tokens = len(ranges)
+
+    print("{t} tokens, {f} frames".format(t=tokens, f=len(frames)))
+
+    bench("parse_frame_spec", lambda: parse_frame_spec(SPEC), 20)
+    bench("format_frame_spec (ranges)",
+          lambda: format_frame_spec(ranges), 20)
+    bench("format_frame_spec (frame list)",
+          lambda: format_frame_spec(frames), 5)
+
+    # baselines: enumerating and re-joining every frame
+    bench("baseline: expand spec to int list",
+          lambda: [f for rng in parse_frame_spec(SPEC) for f in rng], 5)
+    bench("baseline: join every frame",
+          lambda: ",".join(str(f) for f in frames), 5)
@@ -0,0 +1,60 @@
+"""Throughput of merging many overlapping datetime schedules.
+
+Run from the repository root:
+
+    python benchmarks/bench_merge.py
+"""
+
+from __future__ import print_function
+
+from datetime import datetime, timedelta
+import random
+import timeit
+
+from openrange.dt import DatetimeRange
+from openrange.merging import merge, merge_arrays
+
+# ----------------------------------------------------------------------------
+
+SCHEDULES = 300
+
+START = datetime(2024, 1, 1)
+
+# ----------------------------------------------------------------------------
+def schedules(seed=0):
+    rand = random.Random(seed)
+    ranges = []
+    for _ in range(SCHEDULES):
+        first = START + timedelta(minutes=rand.randint(0, 24 * 60))
+        step = timedelta(minutes=rand.choice([5, 15, 30, 60]))
+        ranges.append(DatetimeRange(first, first + timedelta(days=7), step))
+    return ranges
+
+# ----------------------------------------------------------------------------
+def bench(label, func, number):
+    seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print("{l:<40} {s:>10.3f} ms".format(l=label, s=seconds * 1000))
+
+# ----------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    ranges = schedules()
+    total = sum(rng.length for rng in ranges)
+    unique = sum(1 for _ in merge(*ranges))
+
+    print("{s} schedules, {t} items, {u} unique".format(
+        s=SCHEDULES, t=total, u=unique))
+
+    bench("sorted(set(chain))",
+          lambda: sorted(set(item for rng in ranges for item in rng)), 1)
+    bench("merge", lambda: sum(1 for _ in merge(*ranges)), 1)
+    bench("merge (dedup=False)",
+          lambda: sum(1 for _ in merge(*ranges, dedup=False)), 1)
+
+    try:
+        import numpy
+    except ImportError:
+        print("numpy is not installed, skipping merge_arrays")
+    else:
+        bench("merge_arrays",
+              lambda: sum(len(a) for a in merge_arrays(*ranges)), 3)
@@ -0,0 +1,46 @@
+"""Throughput of frame path sequence formatting and parsing.
+
+Run from the repository root:
+
+    python benchmarks/bench_paths.py
+"""
+
+from __future__ import print_function
+
+import timeit
+
+from openrange.paths import PathSequenceRange
+
+# ----------------------------------------------------------------------------
+
+FRAMES = 1000000
+
+TEMPLATE = "/jobs/show/shot_010/render/beauty.%04d.exr"
+
+# ----------------------------------------------------------------------------
+def bench(label, func, number, items=FRAMES):
+    seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print("{l:<40} {s:>10.3f} ms {r:>10.1f} M paths/s".format(
+        l=label, s=seconds * 1000, r=items / seconds / 1e6))
+
+# ----------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    rng = PathSequenceRange(TEMPLATE, 1001, 1000 + FRAMES)
+    every_other = rng[::2]
+    paths = list(rng)
+
+    print("{f} frames of {t}".format(f=FRAMES, t=TEMPLATE))
+
+    bench("printf per frame (baseline)",
+          lambda: [TEMPLATE % n for n in range(1001, 1001 + FRAMES)], 1)
+    bench("_num_to_item per frame",
+          lambda: [rng._num_to_item(n) for n in range(1001, 1001 + FRAMES)],
+          1)
+    bench("list(rng)", lambda: list(rng), 1)
+    bench("list(rng[::2])", lambda: list(every_other), 1,
+          items=every_other.length)
+    bench("rng.frame(path)",
+          lambda: [rng.frame(p) for p in paths[:100000]], 1, items=100000)
+    bench("path in rng",
+          lambda: [p in rng for p in paths[:100000]], 1, items=100000)
@@ -1,12 +1,88 @@
 
-from pkg_resources import get_distribution, DistributionNotFound
+"""Build custom arithmetic progression objects.
 
-from .base import BaseRange
+Importing the package is deliberately cheap: the progression classes and
+helpers listed in __all__ are imported from their submodules the first time
+they are accessed, and __version__ is read from the installed distribution
+metadata on first access as well.
+"""
 
 # ----------------------------------------------------------------------------
 
-try:
-    __version__ = get_distribution(__name__).version
-except DistributionNotFound:
-    __version__ = 'unknown'
+import importlib
+import sys
 
+# ----------------------------------------------------------------------------
+
+# public name -> submodule that defines it
+_LAZY_ATTRS = {
+    'AlphabetRange': 'alphabet',
+    'BaseRange': 'base',
+    'ChainRange': 'chain',
+    'DateRange': 'dt',
+    'DatetimeRange': 'dt',
+    'GeometricRange': 'geom',
+    'MappedRange': 'views',
+    'PathSequenceRange': 'paths',
+    'ProductRange': 'product',
+    'Range': 'rng',
+    'RangeArray': 'array',
+    'RangeIndex': 'index',
+    'TimeRange': 'dt',
+    'WindowedRange': 'views',
+    'format_frame_spec': 'frames',
+    'from_sequence': 'compress',
+    'merge': 'merging',
+    'merge_arrays': 'merging',
+    'parse_frame_spec': 'frames',
+}
+
+__all__ = sorted(_LAZY_ATTRS)
+
+# ----------------------------------------------------------------------------
+def __getattr__(name):
+    """Import public attributes on first access (PEP 562)."""
+
+    if name == '__version__':
+        value = _get_version()
+    elif name in _LAZY_ATTRS:
+        module = importlib.import_module(
+            '.' + _LAZY_ATTRS[name], __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(
+            "module {m!r} has no attribute {n!r}".format(m=__name__, n=name))
+
+    # cache on the module so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+# ----------------------------------------------------------------------------
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | {'__version__'})
+
+# ----------------------------------------------------------------------------
+def _get_version():
+    """Returns the installed version, or 'unknown' if not installed."""
+
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:
+        # python < 3.8
+        from pkg_resources import get_distribution, DistributionNotFound
+        try:
+            return get_distribution(__name__).version
+        except DistributionNotFound:
+            return 'unknown'
+
+    try:
+        return version(__name__)
+    except PackageNotFoundError:
+        return 'unknown'
+
+# ----------------------------------------------------------------------------
+
+# module level __getattr__ requires python 3.7, import eagerly before that
+if sys.version_info < (3, 7):
+    for _name in __all__ + ['__version__']:
+        __getattr__(_name)
@@ -0,0 +1,70 @@
+
+"""Helpers for optional third-party dependencies."""
+
+# ----------------------------------------------------------------------------
+
+__all__ = [
+    'gcd',
+    'import_numpy',
+    'import_pandas',
+    'import_thread_pool',
+]
+
+try:
+    from math import gcd
+except ImportError:
+    # python 2. Only called with non-negative ints, where the results agree.
+    from fractions import gcd
+
+# ----------------------------------------------------------------------------
+def import_numpy():
+    """Import and return numpy, which is required for vectorized methods.
+
+    The import is deferred until a vectorized method is actually called so
+    that numpy remains an optional dependency.
+
+    Raises:
+        ImportError: if numpy is not installed.
+    """
+
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("This feature requires numpy to be installed.")
+
+    return numpy
+
+# ----------------------------------------------------------------------------
+def import_pandas():
+    """Import and return pandas, which is required for pandas conversions.
+
+    Raises:
+        ImportError: if pandas is not installed.
+    """
+
+    try:
+        import pandas
+    except ImportError:
+        raise ImportError("This feature requires pandas to be installed.")
+
+    return pandas
+
+# ----------------------------------------------------------------------------
+def import_thread_pool():
+    """Import and return concurrent.futures.ThreadPoolExecutor.
+
+    concurrent.futures is part of the standard library since python 3.2. On
+    python 2, it is provided by the futures backport.
+
+    Raises:
+        ImportError: if concurrent.futures is not available.
+    """
+
+    try:
+        from concurrent.futures import ThreadPoolExecutor
+    except ImportError:
+        raise ImportError(
+            "This feature requires concurrent.futures. On python 2, install "
+            "the futures package.")
+
+    return ThreadPoolExecutor
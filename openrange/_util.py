@@ -0,0 +1,134 @@
+
+"""Numeric and sequence helpers shared by the openrange modules."""
+
+# ----------------------------------------------------------------------------
+
+from ._compat import import_numpy
+
+# ----------------------------------------------------------------------------
+
+__all__ = [
+    'aligned_array',
+    'floor_array',
+    'floor_div',
+    'range_length',
+    'rounding_tol',
+    'seq_length',
+]
+
+# float values are integral and exact as int64 below this bound
+_INT64_FLOAT_BOUND = 2.0 ** 62
+
+# units in the last place allowed for float rounding, see rounding_tol()
+_ULPS = 4
+
+# ----------------------------------------------------------------------------
+def aligned_array(nums, starts, steps):
+    """Returns (quot, aligned) numpy arrays for values in progressions.
+
+    quot is the nearest whole number of steps from each start to each
+    value, as int64, and aligned tells whether the value lies on that step.
+    Integral values in integral progressions are checked exactly, and
+    non-integral values never lie on them. Otherwise float rounding of the
+    operands is allowed for, see rounding_tol().
+    """
+
+    numpy = import_numpy()
+
+    (nums, starts, steps) = numpy.broadcast_arrays(
+        numpy.asarray(nums), numpy.asarray(starts), numpy.asarray(steps))
+
+    if starts.dtype.kind in 'iu' and steps.dtype.kind in 'iu':
+
+        integral = numpy.ones(nums.shape, dtype=bool)
+
+        if nums.dtype.kind == 'f':
+            integral = numpy.isfinite(nums) & (nums == numpy.floor(nums)) & \
+                (numpy.abs(nums) < _INT64_FLOAT_BOUND)
+            nums = numpy.where(integral, nums, 0).astype(numpy.int64)
+
+        if nums.dtype.kind in 'iu':
+            diff = nums - starts
+            return (diff // steps, integral & (diff % steps == 0))
+
+    exact = (nums - starts) / steps
+    quot = numpy.rint(exact)
+    aligned = numpy.abs(exact - quot) <= rounding_tol(
+        numpy.maximum(numpy.abs(nums), numpy.abs(starts)), steps)
+
+    return (quot.astype(numpy.int64), aligned)
+
+# ----------------------------------------------------------------------------
+def floor_array(quot, tol):
+    """Returns the floor of a numpy float array as int64.
+
+    Values within tol of an integer are snapped to it first, so that float
+    rounding in the computation of quot does not push exact multiples
+    down. tol is a scalar or an array like quot, see rounding_tol().
+    """
+
+    numpy = import_numpy()
+
+    nearest = numpy.rint(quot)
+    close = numpy.abs(quot - nearest) <= tol
+
+    return numpy.floor(numpy.where(close, nearest, quot)).astype(numpy.int64)
+
+# ----------------------------------------------------------------------------
+def floor_div(num, den):
+    """Returns floor(num / den) as an int without rounding errors.
+
+    Works for ints, Fractions, and Decimals. Decimal's // operator truncates
+    towards zero, so the quotient is corrected for mixed signs.
+    """
+
+    quot = num // den
+
+    if (den > 0 and quot * den > num) or (den < 0 and quot * den < num):
+        quot -= 1
+
+    return int(quot)
+
+# ----------------------------------------------------------------------------
+def range_length(start, stop, step):
+    """Returns the length of range(start, stop, step), even beyond sys.maxsize.
+
+    Only the arguments are used, so no range object is built. On python 2,
+    xrange() neither accepts longs nor exposes its arguments.
+    """
+
+    if step > 0:
+        span = stop - start + step - 1
+    else:
+        span = stop - start + step + 1
+
+    return max(0, span // step)
+
+# ----------------------------------------------------------------------------
+def rounding_tol(mag, den):
+    """Returns the float rounding tolerance of quotients (x - y) / den.
+
+    mag is the magnitude max(|x|, |y|) of the operands, as a scalar or an
+    array. The tolerance is a few units in the last place of the operands,
+    relative to the step den. A tolerance relative to the quotient would
+    grow with it and snap values well inside a step to the next one.
+    """
+
+    numpy = import_numpy()
+
+    eps = numpy.finfo(numpy.float64).eps
+    return _ULPS * eps * numpy.asarray(mag, dtype=float) / \
+        numpy.abs(numpy.asarray(den, dtype=float))
+
+# ----------------------------------------------------------------------------
+def seq_length(seq):
+    """Returns the length of a sequence, even beyond sys.maxsize.
+
+    Progressions and views that may exceed sys.maxsize items expose a length
+    property; other sequences fall back to len().
+    """
+
+    try:
+        return seq.length
+    except AttributeError:
+        return len(seq)
@@ -0,0 +1,485 @@
+
+"""Fixed width identifiers encoded in an arbitrary alphabet, e.g. base 36."""
+
+# ----------------------------------------------------------------------------
+
+import itertools
+import re
+import string
+
+from six import integer_types, string_types
+
+from ._compat import import_numpy
+from .base import BaseRange
+
+# ----------------------------------------------------------------------------
+
+__all__ = [
+    'AlphabetRange',
+    'BASE36',
+    'BASE62',
+    'HEX',
+]
+
+# common alphabets, in digit order
+HEX = string.digits + 'abcdef'
+BASE36 = string.digits + string.ascii_lowercase
+BASE62 = string.digits + string.ascii_uppercase + string.ascii_lowercase
+
+# the most entries a precomputed chunk table may hold
+_CHUNK_LIMIT = 4096
+
+# alphabet -> precomputed _Tables, shared by all ranges using the alphabet
+_TABLES = {}
+
+# ----------------------------------------------------------------------------
+class AlphabetRange(BaseRange):
+    """Progression of integers encoded as strings in a positional alphabet.
+
+    The alphabet lists the digit symbols in order, so HEX counts
+    0, 1, ..., f, 10 and the lowercase letters count a, b, ..., z, ba.
+    Encoded items are padded on the left with the zero symbol, the first
+    in the alphabet, to at least width symbols: with width 2 the lowercase
+    letters count aa, ab, ..., zz.
+
+    start and stop may be given as ints or encoded strings, and the step is
+    an int. Encoding and decoding use lookup tables computed once per
+    alphabet: values are encoded a chunk of symbols at a time, and
+    iteration builds items in blocks that share their leading symbols. The
+    shared head is advanced with an incremental carry, so each item costs a
+    single string concatenation.
+    """
+
+    # ------------------------------------------------------------------------
+    def __init__(self, alphabet, *args, **kwargs):
+        """Constructor.
+
+        Args:
+            alphabet: string of unique digit symbols, zero first.
+            args: start, stop, and step as for BaseRange. start and stop
+                may be ints or encoded strings. The step is an int.
+            width: the minimum number of symbols per item (default: 1).
+
+        Raises:
+            TypeError: on unexpected keyword arguments.
+            ValueError: if the alphabet has fewer than two symbols or
+                repeats a symbol, or if width is negative.
+        """
+
+        width = kwargs.pop('width', 1)
+
+        if kwargs:
+            raise TypeError(
+                "Unexpected keyword arguments: {k}".format(
+                    k=", ".join(sorted(kwargs))))
+
+        if width < 0:
+            raise ValueError(
+                "Width must not be negative: {w}".format(w=width))
+
+        self._tables = _tables(alphabet)
+        self._width = width
+
+        super(AlphabetRange, self).__init__(*args)
+
+    # ------------------------------------------------------------------------
+    def __contains__(self, item):
+        """Test for inclusion of an encoded string or int.
+
+        Strings that are not validly encoded are not included.
+        """
+
+        try:
+            num = self._item_to_num(item)
+        except (TypeError, ValueError):
+            return False
+
+        return self._index_num(num) is not None
+
+    # ------------------------------------------------------------------------
+    def __iter__(self):
+        """Generates all encoded items in the progression."""
+
+        return itertools.chain.from_iterable(self._item_blocks())
+
+    # ------------------------------------------------------------------------
+    def __repr__(self):
+        """Official string representation of the progression."""
+
+        return "{c}({a!r}, {s!r}, {o!r}, {t}, width={w})".format(
+            c=self.__class__.__name__,
+            a=self.alphabet,
+            s=self.start,
+            o=self.stop,
+            t=self._step,
+            w=self._width,
+        )
+
+    # ------------------------------------------------------------------------
+    @classmethod
+    def by_count(cls, start, stop, num):
+        """Not supported: evenly spaced values are generally fractional.
+
+        Raises:
+            TypeError: always.
+        """
+
+        raise TypeError(
+            "{c} does not support by_count()".format(c=cls.__name__))
+
+    # ------------------------------------------------------------------------
+    def decode(self, item):
+        """Returns the int value of a string encoded in the alphabet.
+
+        Raises:
+            ValueError: if the string is not validly encoded.
+        """
+
+        return self._item_to_num(item)
+
+    # ------------------------------------------------------------------------
+    def encode(self, num):
+        """Returns the encoded string of a non-negative int.
+
+        Raises:
+            ValueError: if num is negative.
+        """
+
+        return self._num_to_item(num)
+
+    # ------------------------------------------------------------------------
+    def scale(self, k, origin=None):
+        """Returns a new progression with the values scaled by k, in O(1).
+
+        See BaseRange.scale(). The scaled values must be whole numbers.
+
+        Raises:
+            TypeError: if any scaled value or the step is fractional.
+            ValueError: if k is 0.
+        """
+
+        new_range = super(AlphabetRange, self).scale(k, origin=origin)
+
+        if new_range._rational:
+            raise TypeError(
+                "{c} values must be whole numbers, cannot scale by "
+                "{k}".format(c=self.__class__.__name__, k=k))
+
+        return new_range
+
+    # ------------------------------------------------------------------------
+    @property
+    def alphabet(self):
+        """The digit symbols, zero first."""
+        return self._tables.alphabet
+
+    # ------------------------------------------------------------------------
+    @property
+    def base(self):
+        """The number of digit symbols."""
+        return self._tables.base
+
+    # ------------------------------------------------------------------------
+    @property
+    def width(self):
+        """The minimum number of symbols per item."""
+        return self._width
+
+    # ------------------------------------------------------------------------
+    def _item_blocks(self):
+        """Generates lists of consecutive encoded items.
+
+        Values are grouped by value // chunk, where chunk is the size of the
+        precomputed chunk table. A group's head, its leading symbols, is
+        joined once from a list of digits that is carried forward from the
+        previous group, and its items select a strided slice of the chunk
+        table.
+        """
+
+        length = self.length
+        if not length:
+            return
+
+        tables = self._tables
+        (chunks, size, digits) = (tables.chunks, tables.size, tables.digits)
+        (num, step, width) = (self._start, self._step, self._width)
+        zero = tables.alphabet[0]
+        encode = self._num_to_item
+
+        # digits of the last head, least significant first
+        (block, head_digits) = (None, None)
+
+        while length > 0:
+            (new_block, rem) = divmod(num, len(chunks))
+
+            if num < 0 or abs(step) >= len(chunks) or \
+               (new_block == 0 and width < size):
+                # no shared head, encode a single item
+                yield [encode(num)]
+                (num, length) = (num + step, length - 1)
+                continue
+
+            if block is None:
+                head_digits = _to_digits(new_block, tables.base)
+            else:
+                _carry(head_digits, new_block - block, tables.base)
+            block = new_block
+
+            head = ''.join(digits[d] for d in reversed(head_digits))
+            head = head.lstrip(zero).rjust(width - size, zero)
+
+            if step > 0:
+                count = min(length, (len(chunks) - 1 - rem) // step + 1)
+                selected = chunks[rem:rem + (count - 1) * step + 1:step]
+            else:
+                count = min(length, rem // -step + 1)
+                selected = chunks[rem::step][:count]
+
+            yield [head + chunk for chunk in selected]
+            (num, length) = (num + count * step, length - count)
+
+    # ------------------------------------------------------------------------
+    def _item_to_num(self, item):
+        """Decode a string or pass an int through.
+
+        Raises:
+            TypeError: if item is neither a string nor an int.
+            ValueError: if the string is not validly encoded or the int is
+                negative.
+        """
+
+        if isinstance(item, integer_types):
+            if item < 0:
+                raise ValueError(
+                    "Negative values cannot be encoded: {i}".format(i=item))
+            return item
+
+        if not isinstance(item, string_types):
+            raise TypeError(
+                "Invalid item type: {t}".format(t=type(item).__name__))
+
+        (tables, width) = (self._tables, self._width)
+
+        # padded to exactly the width, or longer without padding
+        if len(item) == max(width, 1) or \
+           (len(item) > width and item[0] != tables.zero):
+            num = tables.decode(item)
+            if num is not None:
+                return num
+
+        raise ValueError(
+            "Item {i!r} is not encoded in {a!r} with width {w}".format(
+                i=item, a=tables.alphabet, w=self._width))
+
+    # ------------------------------------------------------------------------
+    def _key(self):
+        """Canonical state: the numeric key, alphabet and width."""
+
+        return super(AlphabetRange, self)._key() + \
+            (self._tables.alphabet, self._width)
+
+    # ------------------------------------------------------------------------
+    def _num_array_to_items(self, nums):
+        """Convert an array of values to an array of encoded strings.
+
+        int64 values are split into digits with vectorized divisions and
+        mapped through the symbol table, one pass per digit position.
+        """
+
+        numpy = import_numpy()
+
+        if nums.dtype.kind not in 'iu' or not len(nums):
+            return numpy.array([self._num_to_item(n) for n in nums.tolist()])
+
+        if nums.min() < 0:
+            raise ValueError("Negative values cannot be encoded")
+
+        tables = self._tables
+        base = tables.base
+        positions = max(len(_to_digits(int(nums.max()), base)), self._width)
+
+        symbols = numpy.array(list(tables.alphabet))
+        columns = numpy.empty((len(nums), positions), dtype=symbols.dtype)
+        remaining = nums.astype(numpy.int64)
+        for position in range(positions - 1, -1, -1):
+            (remaining, digit) = numpy.divmod(remaining, base)
+            columns[:, position] = symbols[digit]
+
+        items = columns.view('U{p}'.format(p=positions)).ravel()
+
+        if positions > max(self._width, 1):
+            items = numpy.char.rjust(
+                numpy.char.lstrip(items, tables.zero), max(self._width, 1),
+                tables.zero)
+
+        return items
+
+    # ------------------------------------------------------------------------
+    def _num_to_item(self, num):
+        """Encode a value using the chunk table.
+
+        Raises:
+            ValueError: if num is negative or not a whole number, e.g. the
+                mean of an even number of consecutive values.
+        """
+
+        if not isinstance(num, integer_types):
+            raise ValueError(
+                "Value {n} is not a whole number".format(n=num))
+
+        if num < 0:
+            raise ValueError(
+                "Negative values cannot be encoded: {n}".format(n=num))
+
+        (chunks, zero) = (self._tables.chunks, self._tables.zero)
+        chunk_base = len(chunks)
+
+        item = ''
+        while num >= chunk_base:
+            (num, rem) = divmod(num, chunk_base)
+            item = chunks[rem] + item
+
+        item = (chunks[num] + item).lstrip(zero) or zero
+        return item.rjust(self._width, zero)
+
+    # ------------------------------------------------------------------------
+    def _num_to_step(self, num):
+        """Steps are ints."""
+
+        return num
+
+    # ------------------------------------------------------------------------
+    def _step_to_num(self, step):
+        """Steps are ints.
+
+        Raises:
+            TypeError: if step is not an int.
+        """
+
+        if not isinstance(step, integer_types):
+            raise TypeError(
+                "Invalid type for step argument: {t}".format(
+                    t=type(step).__name__))
+
+        return step
+
+# ----------------------------------------------------------------------------
+class _Tables(object):
+    """Lookup tables precomputed for an alphabet.
+
+    chunks lists the encoding of every value below base ** size, each
+    exactly size symbols wide, with size chosen so the table holds at most
+    _CHUNK_LIMIT entries. Alphabets of up to 36 symbols decode by
+    translating to the standard digits understood by int(); larger
+    alphabets accumulate the value of each symbol from a dict.
+    """
+
+    # ------------------------------------------------------------------------
+    def __init__(self, alphabet):
+
+        if not isinstance(alphabet, string_types):
+            raise TypeError(
+                "Invalid alphabet type: {t}".format(
+                    t=type(alphabet).__name__))
+
+        if len(alphabet) < 2 or len(set(alphabet)) != len(alphabet):
+            raise ValueError(
+                "Alphabet must hold at least two unique symbols: "
+                "{a!r}".format(a=alphabet))
+
+        self.alphabet = alphabet
+        self.base = len(alphabet)
+        self.digits = list(alphabet)
+        self.values = dict((s, d) for (d, s) in enumerate(alphabet))
+        self.zero = alphabet[0]
+
+        self.size = 1
+        while self.base ** (self.size + 1) <= _CHUNK_LIMIT:
+            self.size += 1
+
+        self.chunks = ['']
+        for _ in range(self.size):
+            self.chunks = [
+                chunk + symbol for chunk in self.chunks for symbol in alphabet]
+
+        # int() also accepts signs, whitespace, underscores and uppercase
+        self._pattern = re.compile(
+            '[{a}]+\\Z'.format(a=''.join(re.escape(s) for s in alphabet)))
+
+        # alphabets of standard digits need no translation
+        if self.base > 36 or alphabet == BASE36[:self.base]:
+            self._translation = None
+        else:
+            self._translation = dict(
+                (ord(s), BASE36[d]) for (d, s) in enumerate(alphabet))
+
+    # ------------------------------------------------------------------------
+    def decode(self, item):
+        """Returns the value of a string of symbols from the alphabet.
+
+        Returns None if the string is empty or holds other symbols.
+        """
+
+        if self.base <= 36:
+            if not self._pattern.match(item):
+                return None
+            if self._translation is not None:
+                item = _translate(item, self._translation)
+            return int(item, self.base)
+
+        (values, base) = (self.values, self.base)
+
+        num = 0
+        try:
+            for symbol in item:
+                num = num * base + values[symbol]
+        except KeyError:
+            return None
+
+        return num if item else None
+
+# ----------------------------------------------------------------------------
+def _carry(digits, delta, base):
+    """Add delta to a list of digits in place, least significant first.
+
+    Negative deltas borrow. The result must not be negative.
+    """
+
+    pos = 0
+    while delta:
+        if pos == len(digits):
+            digits.append(0)
+        (delta, digits[pos]) = divmod(digits[pos] + delta, base)
+        pos += 1
+
+# ----------------------------------------------------------------------------
+def _tables(alphabet):
+    """Returns the cached lookup tables for an alphabet."""
+
+    try:
+        return _TABLES[alphabet]
+    except KeyError:
+        return _TABLES.setdefault(alphabet, _Tables(alphabet))
+    except TypeError:
+        # unhashable, let _Tables report the type
+        return _Tables(alphabet)
+
+# ----------------------------------------------------------------------------
+def _to_digits(num, base):
+    """Returns the digits of a non-negative int, least significant first."""
+
+    digits = []
+    while num:
+        (num, digit) = divmod(num, base)
+        digits.append(digit)
+
+    return digits or [0]
+
+# ----------------------------------------------------------------------------
+def _translate(item, table):
+    """str.translate with a dict table on python 2 and 3."""
+
+    if not isinstance(item, type(u'')):
+        item = item.decode('ascii')
+
+    return item.translate(table)
@@ -0,0 +1,494 @@
+
+"""Columnar batches of many progressions of a single type."""
+
+# ----------------------------------------------------------------------------
+
+from fractions import Fraction
+
+from six import integer_types
+
+from ._compat import import_numpy
+from ._util import aligned_array
+from .base import BaseRange
+
+# ----------------------------------------------------------------------------
+
+__all__ = [
+    'RangeArray',
+]
+
+# int64 intermediates stay below this bound, otherwise python ints are used
+_INT64_BOUND = 2 ** 62
+
+# ----------------------------------------------------------------------------
+class RangeArray(object):
+    """Struct-of-arrays batch of independent progressions of one type.
+
+    Each row is a progression stored in three numpy columns: the numeric
+    start, the numeric step, and the length. Numeric values are in the space
+    used for vectorized calculations, e.g. microseconds for datetime
+    progressions. Queries such as contains() and getitem() evaluate every
+    row at once. BaseRange objects are only created when a single row is
+    indexed or when the rows are iterated.
+
+    Indexing with a slice, an array of row numbers, or a boolean mask
+    returns a new RangeArray of the selected rows, which is how rows are
+    filtered, e.g. rows[rows.contains(item)].
+
+    Only additive progressions are supported. Requires numpy.
+    """
+
+    # ------------------------------------------------------------------------
+    def __init__(self, range_type, starts, steps, lengths):
+        """Constructor.
+
+        Args:
+            range_type: the additive BaseRange subclass of every row, or a
+                progression of that type whose conversion settings (e.g.
+                the template of a PathSequenceRange) all rows share.
+            starts: the first item of each row, as an array of items (e.g.
+                datetime64) or of numeric values.
+            steps: the step of each row, as an array of step items (e.g.
+                timedelta64) or of numeric values.
+            lengths: the number of items in each row.
+
+        Raises:
+            TypeError: if range_type is not an additive BaseRange subclass,
+                or is a subclass whose conversions depend on instance state
+                and no progression is supplied.
+            ValueError: if the columns differ in length, a step is 0, or a
+                length is negative.
+        """
+
+        numpy = import_numpy()
+
+        if isinstance(range_type, BaseRange):
+            proto = range_type
+            range_type = type(proto)
+        else:
+            proto = None
+
+        if not (isinstance(range_type, type) and
+                issubclass(range_type, BaseRange)) or \
+           range_type._num_at is not BaseRange._num_at:
+            raise TypeError(
+                "{t} is not an additive BaseRange subclass".format(
+                    t=getattr(range_type, '__name__', range_type)))
+
+        if proto is None:
+            # subclasses extending _key() convert items with instance state
+            if range_type._key is not BaseRange._key:
+                raise TypeError(
+                    "{t} rows need conversion settings: supply a {t} "
+                    "progression or use from_ranges()".format(
+                        t=range_type.__name__))
+            proto = range_type.__new__(range_type)
+
+        starts = numpy.asarray(starts)
+        if starts.dtype.kind not in 'iuf':
+            starts = proto._item_array_to_nums(starts)
+
+        steps = numpy.asarray(steps)
+        if steps.dtype.kind == 'm':
+            steps = steps.astype('m8[us]').astype(numpy.int64)
+        elif steps.dtype.kind not in 'iuf':
+            steps = numpy.array([
+                proto._array_num(proto._step_to_num(step))
+                for step in steps.tolist()
+            ])
+
+        lengths = numpy.asarray(lengths, dtype=numpy.int64)
+
+        if not starts.shape == steps.shape == lengths.shape or \
+           starts.ndim != 1:
+            raise ValueError(
+                "Starts, steps, and lengths must be 1-d arrays of equal size.")
+
+        if numpy.any(steps == 0):
+            raise ValueError("Step cannot be 0.")
+
+        if numpy.any(lengths < 0):
+            raise ValueError("Length cannot be negative.")
+
+        self._proto = proto
+        self._starts = starts
+        self._steps = steps
+        self._lengths = lengths
+
+    # ------------------------------------------------------------------------
+    @classmethod
+    def from_ranges(cls, ranges):
+        """Returns a RangeArray with one row per supplied progression.
+
+        Conversion settings (e.g. exact rational steps) are taken from the
+        first progression.
+
+        Raises:
+            ValueError: if no progressions are supplied, or if their
+                conversion settings (e.g. path templates) differ.
+            TypeError: if the progressions are of different types.
+        """
+
+        numpy = import_numpy()
+
+        ranges = list(ranges)
+
+        if not ranges:
+            raise ValueError(
+                "Cannot infer the type of an empty list of progressions.")
+
+        range_type = type(ranges[0])
+
+        if any(type(rng) is not range_type for rng in ranges):
+            raise TypeError(
+                "All progressions must be of type {t}".format(
+                    t=range_type.__name__))
+
+        key = ranges[0]._conversion_key()
+
+        if any(rng._conversion_key() != key for rng in ranges):
+            raise ValueError(
+                "All progressions must share the conversion settings of the "
+                "first, e.g. the same template.")
+
+        return cls(
+            ranges[0],
+            numpy.array([rng._array_num(rng._start) for rng in ranges]),
+            numpy.array([rng._array_num(rng._step) for rng in ranges]),
+            numpy.array([rng.length for rng in ranges], dtype=numpy.int64),
+        )
+
+    # ------------------------------------------------------------------------
+    def __getitem__(self, index):
+        """Returns a row as a progression, or a RangeArray of several rows.
+
+        An int returns the progression of that row. A slice, an array of row
+        numbers, or a boolean mask selects rows.
+        """
+
+        if isinstance(index, integer_types):
+            rows = len(self)
+            if index < 0:
+                index += rows
+            if index < 0 or index >= rows:
+                raise IndexError(
+                    "Index '{i}' is out of range.".format(i=index))
+            return self._row(index)
+
+        return self._with_columns(
+            self._starts[index], self._steps[index], self._lengths[index])
+
+    # ------------------------------------------------------------------------
+    def __iter__(self):
+        """Generates the progression of each row."""
+
+        for index in range(len(self)):
+            yield self._row(index)
+
+    # ------------------------------------------------------------------------
+    def __len__(self):
+        """Returns the number of rows."""
+
+        return len(self._lengths)
+
+    # ------------------------------------------------------------------------
+    def __repr__(self):
+        """Official string representation of the batch."""
+
+        return "{c}(<{n} {t} rows>)".format(
+            c=self.__class__.__name__,
+            n=len(self),
+            t=self.range_type.__name__,
+        )
+
+    # ------------------------------------------------------------------------
+    def contains(self, item):
+        """Returns a boolean array: whether each row contains item."""
+
+        return self.index(item) >= 0
+
+    # ------------------------------------------------------------------------
+    def getitem(self, rows, indices):
+        """Returns an array of the items at the supplied rows and indices.
+
+        rows and indices are broadcast against each other, so a scalar row
+        with an array of indices reads several items of one row, and arrays
+        of both read one item per pair. Negative indices count from the end
+        of their row.
+
+        Raises:
+            IndexError: if any index is out of range for its row.
+        """
+
+        numpy = import_numpy()
+
+        (rows, indices) = numpy.broadcast_arrays(
+            numpy.asarray(rows, dtype=numpy.int64),
+            numpy.asarray(indices, dtype=numpy.int64),
+        )
+
+        lengths = self._lengths[rows]
+        indices = numpy.where(indices < 0, indices + lengths, indices)
+
+        if numpy.any((indices < 0) | (indices >= lengths)):
+            raise IndexError("Index out of range.")
+
+        nums = self._starts[rows] + indices * self._steps[rows]
+        return self._proto._num_array_to_items(nums)
+
+    # ------------------------------------------------------------------------
+    def index(self, item):
+        """Returns an int64 array: the index of item in each row, or -1."""
+
+        numpy = import_numpy()
+
+        proto = self._proto
+        num = proto._array_num(proto._item_to_num(item))
+        steps = self._steps
+
+        if proto._period is not None:
+            # like _wrap_num(), for every row: rows reaching past the period
+            # hold values below their start one period later
+            period = proto._array_num(proto._period)
+            last = self._starts + (self._lengths - 1) * steps
+            (lo, hi) = (numpy.minimum(self._starts, last),
+                        numpy.maximum(self._starts, last))
+            num = numpy.where(
+                (hi >= period) & (0 <= num) & (num < numpy.minimum(lo, period)),
+                num + period, num)
+
+        (quot, aligned) = aligned_array(num, self._starts, steps)
+
+        found = aligned & (quot >= 0) & (quot < self._lengths)
+
+        return numpy.where(found, quot, -1).astype(numpy.int64)
+
+    # ------------------------------------------------------------------------
+    def intersect(self, rng):
+        """Returns a RangeArray of each row intersected with a progression.
+
+        The items shared by a row and rng form a progression whose step is
+        the least common multiple of their steps. Its first item is found
+        for all rows at once with the Chinese remainder theorem, computed
+        with a vectorized extended Euclidean algorithm. Rows with no shared
+        items become empty. The resulting rows are ascending.
+
+        Raises:
+            TypeError: if rng is not of the row type, or the numeric values
+                are not integral (e.g. float progressions).
+        """
+
+        numpy = import_numpy()
+
+        if type(rng) is not self.range_type:
+            raise TypeError(
+                "Cannot intersect {t} rows with {r}".format(
+                    t=self.range_type.__name__, r=type(rng).__name__))
+
+        proto = self._proto
+        (b_first, b_step) = (
+            proto._array_num(rng._start), proto._array_num(rng._step))
+        b_len = rng.length
+
+        if self._starts.dtype.kind not in 'iu' or \
+           self._steps.dtype.kind not in 'iu' or \
+           not isinstance(b_first, integer_types) or \
+           not isinstance(b_step, integer_types):
+            raise TypeError("intersect() requires integral numeric values.")
+
+        if not len(self) or not b_len:
+            return self._with_columns(
+                self._starts, self._steps, numpy.zeros_like(self._lengths))
+
+        b_last = b_first + (b_len - 1) * b_step
+        (b_lo, b_hi, b) = (min(b_first, b_last), max(b_first, b_last),
+                           abs(b_step))
+
+        a = numpy.abs(self._steps)
+        last = self._starts + (self._lengths - 1) * self._steps
+        a_lo = numpy.minimum(self._starts, last)
+        a_hi = numpy.maximum(self._starts, last)
+
+        # work relative to the lowest item of rng, in units of the greatest
+        # common divisor of all steps, to keep the intermediates small
+        unit = int(numpy.gcd.reduce(numpy.append(a, b)))
+        rel_lo = a_lo - b_lo
+        rel_hi = a_hi - b_lo
+
+        if max(int(numpy.abs(rel_lo).max()), int(numpy.abs(rel_hi).max()),
+               b_hi - b_lo) + int(a.max()) * b // unit >= _INT64_BOUND or \
+           (b // unit) ** 2 >= _INT64_BOUND:
+            (a, rel_lo, rel_hi) = (
+                a.astype(object), rel_lo.astype(object),
+                rel_hi.astype(object))
+
+        solvable = (rel_lo % unit == 0) & (self._lengths > 0)
+
+        (a, b) = (a // unit, b // unit)
+        (rel_lo, rel_hi) = (rel_lo // unit, rel_hi // unit)
+        upper = numpy.minimum(rel_hi, (b_hi - b_lo) // unit)
+
+        # a * t = -rel_lo (mod b) has solutions iff gcd(a, b) divides rel_lo
+        gcd = numpy.gcd(a, b)
+        solvable &= rel_lo % gcd == 0
+        modulus = b // gcd
+
+        inverse = _mod_inverse(a // gcd, modulus, numpy)
+        t = ((-rel_lo // gcd) % modulus) * inverse % modulus
+
+        first = rel_lo + a * t
+        step = a * modulus
+
+        lower = numpy.maximum(rel_lo, 0)
+        first = first + numpy.maximum(-((first - lower) // step), 0) * step
+
+        lengths = numpy.where(
+            solvable & (first <= upper), (upper - first) // step + 1, 0)
+
+        # the step of a row with fewer than 2 items is arbitrary, and may be
+        # too large for int64, so those rows keep their own start and step
+        starts = numpy.where(lengths > 0, b_lo + first * unit, self._starts)
+        steps = numpy.where(
+            lengths > 1, step * unit, numpy.abs(self._steps))
+
+        return self._with_columns(
+            starts.astype(self._starts.dtype),
+            steps.astype(self._steps.dtype),
+            lengths.astype(numpy.int64),
+        )
+
+    # ------------------------------------------------------------------------
+    def scale(self, k, origin=None):
+        """Returns a RangeArray with every row scaled by k, in O(rows).
+
+        Vectorized BaseRange.scale(): the origin defaults to the start of
+        each row.
+
+        Raises:
+            ValueError: if k is 0, or if integral columns (e.g. ints or
+                microseconds) would not stay integral.
+        """
+
+        numpy = import_numpy()
+
+        if k == 0:
+            raise ValueError("Scale factor cannot be 0.")
+
+        steps = _scale_column(self._steps, k, numpy)
+
+        if origin is None:
+            starts = self._starts
+        else:
+            proto = self._proto
+            origin = proto._array_num(proto._item_to_num(origin))
+            starts = origin + _scale_column(self._starts - origin, k, numpy)
+
+        return self._with_columns(starts, steps, self._lengths)
+
+    # ------------------------------------------------------------------------
+    def shift(self, delta):
+        """Returns a RangeArray with every row offset by delta, in O(rows).
+
+        delta has the type of the step, e.g. a timedelta for datetime rows.
+        """
+
+        proto = self._proto
+        num = proto._array_num(proto._step_to_num(delta))
+
+        return self._with_columns(self._starts + num, self._steps, self._lengths)
+
+    # ------------------------------------------------------------------------
+    @property
+    def lengths(self):
+        """The number of items in each row, as an int64 array."""
+        return self._lengths
+
+    # ------------------------------------------------------------------------
+    @property
+    def range_type(self):
+        """The BaseRange subclass of the rows."""
+        return type(self._proto)
+
+    # ------------------------------------------------------------------------
+    @property
+    def starts(self):
+        """The numeric first value of each row."""
+        return self._starts
+
+    # ------------------------------------------------------------------------
+    @property
+    def steps(self):
+        """The numeric step of each row."""
+        return self._steps
+
+    # ------------------------------------------------------------------------
+    def _row(self, index):
+        """Returns the progression of a single row."""
+
+        proto = self._proto
+
+        start = proto._array_num_to_num(self._starts[index].item())
+        step = proto._array_num_to_num(self._steps[index].item())
+        stop = start + step * (int(self._lengths[index]) - 1)
+
+        return proto._from_nums(start, stop, step)
+
+    # ------------------------------------------------------------------------
+    def _with_columns(self, starts, steps, lengths):
+        """Returns a RangeArray of the same type with the supplied columns."""
+
+        array = self.__class__.__new__(self.__class__)
+        array._proto = self._proto
+        array._starts = starts
+        array._steps = steps
+        array._lengths = lengths
+
+        return array
+
+# ----------------------------------------------------------------------------
+def _mod_inverse(values, modulus, numpy):
+    """Returns the inverse of each value modulo its modulus.
+
+    Each value must be coprime to its modulus. A vectorized extended
+    Euclidean algorithm: every row takes the same sequence of steps, and
+    rows that have finished are left unchanged.
+    """
+
+    (old_r, r) = (values % modulus, modulus)
+    (old_s, s) = (numpy.ones_like(old_r), numpy.zeros_like(old_r))
+
+    while numpy.any(r != 0):
+        active = r != 0
+        quot = numpy.where(active, old_r // numpy.where(active, r, 1), 0)
+        (old_r, r) = (numpy.where(active, r, old_r),
+                      numpy.where(active, old_r - quot * r, r))
+        (old_s, s) = (numpy.where(active, s, old_s),
+                      numpy.where(active, old_s - quot * s, s))
+
+    return old_s % modulus
+
+# ----------------------------------------------------------------------------
+def _scale_column(column, k, numpy):
+    """Multiplies a numeric column by k.
+
+    Float columns are multiplied directly. Integral columns are multiplied
+    exactly and must stay integral.
+    """
+
+    if column.dtype.kind == 'f':
+        return column * float(k)
+
+    if isinstance(k, float):
+        k = Fraction(repr(k))
+    k = Fraction(k)
+
+    scaled = column * k.numerator
+
+    if k.denominator != 1:
+        if numpy.any(scaled % k.denominator != 0):
+            raise ValueError(
+                "Scaling by {k} does not keep the values integral.".format(
+                    k=k))
+        scaled = scaled // k.denominator
+
+    return scaled
@@ -3,13 +3,29 @@
 # ----------------------------------------------------------------------------
 
 from abc import ABCMeta, abstractmethod
-from collections import Sequence
+from collections import deque
+from decimal import Decimal
+from fractions import Fraction
+import itertools
 import random
+import sys
 
-from six import add_metaclass
+from six import add_metaclass, integer_types
+
+from ._compat import gcd, import_numpy, import_pandas, import_thread_pool
+from ._util import (
+    floor_array, floor_div, range_length, rounding_tol, seq_length)
+from .chain import ChainRange
+from .views import MappedRange, WindowedRange
 
 # ----------------------------------------------------------------------------
 
+try:
+    from collections.abc import Sequence
+except ImportError:
+    # python 2
+    from collections import Sequence
+
 try:
     built_in_range = xrange
 except NameError:
@@ -21,6 +37,15 @@ __all__ = [
     'BaseRange',
 ]
 
+# valid out_of_range values for bucketize()
+_OUT_OF_RANGE = ('mask', 'clip', 'raise')
+
+# valid modes for shard()
+_SHARD_MODES = ('contiguous', 'strided')
+
+# errors raised when an operand cannot be converted to a step
+_CONVERSION_ERRORS = (ArithmeticError, AttributeError, TypeError, ValueError)
+
 # ----------------------------------------------------------------------------
 @add_metaclass(ABCMeta)
 class BaseRange(Sequence):
@@ -45,27 +70,63 @@ class BaseRange(Sequence):
     _item_to_num() and _num_to_item() methods. 
     """
 
+    _frozen = False
+    _hash = None
+
+    # True for progressions built with exact Fraction numeric values, see
+    # by_count(). Subclasses whose numeric type does not mix with Fraction
+    # should return Fractions from _item_to_num() when this is set.
+    _rational = False
+
+    # Numeric length of a cyclic domain, e.g. the seconds of a day for times
+    # of day, or None. Looked up values may then lie one period later, see
+    # _wrap_num().
+    _period = None
+
     # ------------------------------------------------------------------------
-    def __contains__(self, item):
-        """Test for inclusion of the supplied item."""
+    def __add__(self, delta):
+        """Returns the progression shifted by a step-typed delta.
+
+        See shift().
+        """
 
-        num = self._item_to_num(item)
+        try:
+            num = self._step_to_num(delta)
+        except _CONVERSION_ERRORS:
+            return NotImplemented
 
-        if not self._in_range(num):
-            return False
+        return self._shifted(num)
+
+    # ------------------------------------------------------------------------
+    def __bool__(self):
+        """Returns True if the progression has items, even beyond sys.maxsize."""
+
+        return self.length > 0
+
+    # python 2
+    __nonzero__ = __bool__
+
+    # ------------------------------------------------------------------------
+    def __contains__(self, item):
+        """Test for inclusion of the supplied item."""
 
-        return ((num - self._start) % self._step) == 0
+        return self._index_num(self._lookup_num(item)) is not None
 
     # ------------------------------------------------------------------------
     def __eq__(self, other):
         """Test for equality with the supplied object.
 
         **Note**: This method may require evaluation of all items in each list.
+        Progressions of the same type are compared by their numeric
+        representation first, which avoids evaluating items when they match.
         """
 
-        _len = len(self)
+        if type(self) is type(other) and self._key() == other._key():
+            return True
+
+        _len = self.length
         
-        if _len != len(other):
+        if _len != seq_length(other):
             return False
 
         for i in built_in_range(0, _len):
@@ -83,26 +144,64 @@ class BaseRange(Sequence):
 
         return not self.__eq__(other)
 
+    # ------------------------------------------------------------------------
+    def __radd__(self, delta):
+        """Returns the progression shifted by a step-typed delta."""
+
+        return self.__add__(delta)
+
     # ------------------------------------------------------------------------
     def __getitem__(self, index):
-        """Retrieves item(s) from the progression for a given index or slice."""
+        """Retrieves item(s) from the progression for a given index or slice.
+
+        Slicing returns a new progression of the same type.
+        """
 
         if isinstance(index, slice):
-            return [self._num_to_item(self[i])
-                for i in built_in_range(*index.indices(len(self)))]
+            (start, stop, step) = index.indices(self.length)
+            count = range_length(start, stop, step)
+
+            new_range = self._from_nums(
+                self._num_at(start), self._start, self._step_multiple(step))
+            new_range._stop = new_range._num_at(count - 1)
+            return new_range
 
-        elif isinstance(index, int):
+        elif isinstance(index, integer_types):
+            _len = self.length
             if index < 0:
-                index += len(self)
-            if index >= len(self):
+                index += _len
+            if index < 0 or index >= _len:
                 raise IndexError(
                     "Index '{i}' is out of range.".format(i=index))
 
-            return self._num_to_item((index * self._step) + self._start)
+            return self._num_to_item(self._num_at(index))
         else:
             raise TypeError(
                 "Invalid index type: {t}".format(t=str(type(index))))
 
+    # ------------------------------------------------------------------------
+    def __hash__(self):
+        """Returns a hash consistent with item-wise equality.
+
+        Only frozen progressions are hashable. The hash is derived from the
+        length and the first two items, so it is computed in O(1).
+
+        Raises:
+            TypeError: if the progression is not frozen.
+        """
+
+        if not self._frozen:
+            raise TypeError(
+                "unhashable type: '{c}' (use freeze() first)".format(
+                    c=self.__class__.__name__))
+
+        if self._hash is None:
+            _len = self.length
+            self._hash = hash(
+                (_len,) + tuple(self[i] for i in built_in_range(min(_len, 2))))
+
+        return self._hash
+
     # ------------------------------------------------------------------------
     def __init__(self, *args):
         """Constructor. Arguments mimic python's built-in range().
@@ -160,9 +259,14 @@ class BaseRange(Sequence):
 
     # ------------------------------------------------------------------------
     def __len__(self):
-        """Returns the length of the progression."""
+        """Returns the length of the progression.
 
-        return int((self._stop - self._start) / self._step) + 1
+        Raises:
+            OverflowError: if the length exceeds sys.maxsize. Use the length
+                property for progressions of arbitrary size.
+        """
+
+        return self.length
 
     # ------------------------------------------------------------------------
     def __repr__(self):
@@ -186,35 +290,72 @@ class BaseRange(Sequence):
 
     # ------------------------------------------------------------------------
     def __reversed__(self):
-        """Returns a new instance with start, stop, and step reversed."""
+        """Returns a new instance holding the items in reverse order.
 
-        cls = self.__class__
-        new_range = cls(self.start, self.stop, self.step)
-        new_range.reverse()
-        return new_range
+        Equivalent to self[::-1], so the result starts from the last item
+        even if stop is not an item.
+        """
+
+        return self[::-1]
 
     # ------------------------------------------------------------------------
     def __str__(self):
         """Informal string representation of the progression."""
 
         return self.__repr__()
+
+    # ------------------------------------------------------------------------
+    def __sub__(self, delta):
+        """Returns the progression shifted back by a step-typed delta."""
+
+        try:
+            num = self._step_to_num(delta)
+        except _CONVERSION_ERRORS:
+            return NotImplemented
+
+        return self._shifted(-num)
     
+    # ------------------------------------------------------------------------
+    def histogram(self, values, out_of_range='mask'):
+        """Returns the number of values in each bucket as a numpy array.
+
+        The counts are aligned with the progression: count i is the number of
+        values assigned to item i by bucketize(). Out of range values are
+        dropped when out_of_range is 'mask'. Requires numpy.
+        """
+
+        numpy = import_numpy()
+
+        index = self.bucketize(values, out_of_range=out_of_range)
+        return numpy.bincount(index[index >= 0], minlength=self.length)
+
     # ------------------------------------------------------------------------
     def index(self, item):
         """Returns the index of the first item matching the supplied item."""
 
-        num = self._item_to_num(item)
+        index = self._index_num(self._lookup_num(item))
 
-        if not self._in_range(num):
-            raise ValueError(
-                "{i} is not in {c}".format(i=item, c=self.__class__.__name__))
-    
-        diff = abs(num - self._start)
-        if not ((num - self._start) % self._step) == 0:
+        if index is None:
             raise ValueError(
                 "{i} is not in {c}".format(i=item, c=self.__class__.__name__))
-            
-        return abs(int(diff / self._step))
+
+        return index
+
+    # ------------------------------------------------------------------------
+    def choice(self, seed=None):
+        """Returns a random item from the progression in O(1).
+
+        Raises:
+            IndexError: if the progression is empty.
+        """
+
+        length = self.length
+
+        if not length:
+            raise IndexError("Cannot choose from an empty progression.")
+
+        index = random.Random(seed).randrange(length)
+        return self._num_to_item(self._num_at(index))
 
     # ------------------------------------------------------------------------
     def count(self, item):
@@ -243,38 +384,679 @@ class BaseRange(Sequence):
     def excluding(self, iterable):
         """Iterate over progression excluding items in supplied iterable."""
 
-        excludes = [self._item_to_num(i) for i in iterable]
+        excludes = [self._lookup_num(i) for i in iterable]
         
         for i in self._iter():
             if i not in excludes:
                 yield self._num_to_item(i)
 
+    # ------------------------------------------------------------------------
+    def bucketize(self, values, out_of_range='mask'):
+        """Returns the bucket index of each supplied value as a numpy array.
+
+        Bucket i holds the values whose floor() is item i, i.e. the values
+        from item i up to (but excluding) the next larger item, with the
+        largest item's bucket extending by one step. All values are assigned
+        in a single vectorized pass. Requires numpy.
+
+        Args:
+            values: numpy array (e.g. datetime64 for datetime progressions)
+                or any iterable of items.
+            out_of_range: how to handle values outside of every bucket.
+                'mask' assigns -1, 'clip' assigns the nearest end bucket,
+                and 'raise' raises ValueError.
+
+        Raises:
+            ValueError: if out_of_range is invalid or, with 'raise', if any
+                value is out of range.
+        """
+
+        numpy = import_numpy()
+
+        if out_of_range not in _OUT_OF_RANGE:
+            raise ValueError(
+                "Invalid out_of_range value: {o!r}".format(o=out_of_range))
+
+        if not isinstance(values, numpy.ndarray):
+            values = numpy.asarray(list(values))
+
+        nums = self._wrap_num_array(self._item_array_to_nums(values))
+
+        if self._ascending():
+            index = self._index_floor_array(nums)
+        else:
+            index = self._index_ceil_array(nums)
+
+        length = self.length
+        outside = (index < 0) | (index >= length)
+
+        if outside.any():
+            if out_of_range == 'raise' or not length:
+                raise ValueError(
+                    "{n} values are out of range for {c}".format(
+                        n=int(outside.sum()), c=self.__class__.__name__))
+            elif out_of_range == 'clip':
+                index = numpy.clip(index, 0, length - 1)
+            else:
+                index = numpy.where(outside, -1, index)
+
+        return index
+
+    # ------------------------------------------------------------------------
+    @classmethod
+    def by_count(cls, start, stop, num):
+        """Returns a progression of num evenly spaced items from start to stop.
+
+        Like numpy.linspace(), both endpoints are included. The numeric step
+        is stored as an exact Fraction, so the length is always num and the
+        last item is exactly stop, whatever the spacing. Items rounded on
+        conversion, e.g. to a float, are still found by index() and
+        inclusion tests. A progression of a single item contains only start.
+
+        Raises:
+            ValueError: if num is negative, or if start equals stop and num
+                is greater than 1.
+        """
+
+        if num < 0:
+            raise ValueError("Number of items must be >= 0.")
+
+        new_range = cls.__new__(cls)
+        new_range._rational = True
+
+        start = Fraction(new_range._item_to_num(start))
+        stop = Fraction(new_range._item_to_num(stop))
+
+        if num > 1:
+            step = (stop - start) / (num - 1)
+            if step == 0:
+                raise ValueError("Step cannot be 0.")
+        else:
+            step = Fraction(1)
+            stop = start + (num - 1) * step
+
+        return new_range._from_nums(start, stop, step)
+
+    # ------------------------------------------------------------------------
+    @classmethod
+    def from_pandas(cls, index):
+        """Returns a progression with the same items as a regular pandas index.
+
+        The index values are checked for a constant step in a vectorized
+        pass (see openrange.compress.from_sequence()). Requires pandas.
+
+        Raises:
+            ValueError: if the index is empty, timezone aware, or not evenly
+                spaced.
+        """
+
+        # imported here to avoid a circular import
+        from .compress import from_sequence
+
+        if getattr(index, 'tz', None) is not None:
+            raise ValueError(
+                "Timezone aware indexes are not supported by {c}".format(
+                    c=cls.__name__))
+
+        ranges = from_sequence(index.to_numpy(), cls=cls)
+
+        if len(ranges) != 1:
+            raise ValueError(
+                "Index is empty or not evenly spaced, cannot convert to "
+                "{c}".format(c=cls.__name__))
+
+        return ranges[0]
+
+    # ------------------------------------------------------------------------
+    def ceil(self, item):
+        """Returns the smallest item in the progression >= the supplied item.
+
+        Raises:
+            ValueError: if every item in the progression is smaller.
+        """
+
+        return self._num_to_item(self._num_at(self.ceil_index(item)))
+
+    # ------------------------------------------------------------------------
+    def ceil_index(self, item):
+        """Returns the index of the smallest item >= the supplied item.
+
+        The supplied item does not need to be in the progression. The index
+        is computed in O(1) for ascending and descending progressions.
+
+        Raises:
+            ValueError: if every item in the progression is smaller.
+        """
+
+        index = self._bound_index(self._lookup_num(item), below=False)
+
+        if index is None:
+            raise ValueError(
+                "No item >= {i} in {c}".format(
+                    i=item, c=self.__class__.__name__))
+
+        return index
+
+    # ------------------------------------------------------------------------
+    def floor(self, item):
+        """Returns the largest item in the progression <= the supplied item.
+
+        Raises:
+            ValueError: if every item in the progression is larger.
+        """
+
+        return self._num_to_item(self._num_at(self.floor_index(item)))
+
+    # ------------------------------------------------------------------------
+    def floor_index(self, item):
+        """Returns the index of the largest item <= the supplied item.
+
+        The supplied item does not need to be in the progression. The index
+        is computed in O(1) for ascending and descending progressions.
+
+        Raises:
+            ValueError: if every item in the progression is larger.
+        """
+
+        index = self._bound_index(self._lookup_num(item), below=True)
+
+        if index is None:
+            raise ValueError(
+                "No item <= {i} in {c}".format(
+                    i=item, c=self.__class__.__name__))
+
+        return index
+
+    # ------------------------------------------------------------------------
+    def nearest(self, item):
+        """Returns the item in the progression closest to the supplied item.
+
+        Raises:
+            ValueError: if the progression is empty.
+        """
+
+        return self._num_to_item(self._num_at(self.nearest_index(item)))
+
+    # ------------------------------------------------------------------------
+    def nearest_index(self, item):
+        """Returns the index of the item closest to the supplied item.
+
+        Items outside the progression snap to the nearest end. Ties resolve
+        to the item that comes first in the progression.
+
+        Raises:
+            ValueError: if the progression is empty.
+        """
+
+        num = self._lookup_num(item)
+        lower = self._bound_index(num, below=True)
+        upper = self._bound_index(num, below=False)
+
+        if lower is None and upper is None:
+            raise ValueError(
+                "{c} is empty".format(c=self.__class__.__name__))
+        elif lower is None:
+            return upper
+        elif upper is None:
+            return lower
+
+        below = num - self._num_at(lower)
+        above = self._num_at(upper) - num
+
+        if below == above:
+            return min(lower, upper)
+
+        return lower if below < above else upper
+
+    # ------------------------------------------------------------------------
+    def max(self):
+        """Returns the largest item in the progression in O(1).
+
+        Raises:
+            ValueError: if the progression is empty.
+        """
+
+        return self._num_to_item(self._sorted_num(self._nonempty_length() - 1))
+
+    # ------------------------------------------------------------------------
+    def mean(self):
+        """Returns the arithmetic mean of the items in O(1).
+
+        The mean is computed exactly from the first and last numeric values,
+        then converted to the item type, e.g. a datetime for datetime
+        progressions.
+
+        Raises:
+            ValueError: if the progression is empty.
+        """
+
+        length = self._nonempty_length()
+        total = _exact(self._num_at(0)) + _exact(self._num_at(length - 1))
+
+        return self._num_to_item(self._exact_to_num(Fraction(total) / 2))
+
+    # ------------------------------------------------------------------------
+    def median(self):
+        """Returns the median of the items in O(1).
+
+        The two middle items are averaged for progressions of even length.
+
+        Raises:
+            ValueError: if the progression is empty.
+        """
+
+        return self.percentile(50)
+
+    # ------------------------------------------------------------------------
+    def min(self):
+        """Returns the smallest item in the progression in O(1).
+
+        Raises:
+            ValueError: if the progression is empty.
+        """
+
+        self._nonempty_length()
+        return self._num_to_item(self._sorted_num(0))
+
+    # ------------------------------------------------------------------------
+    def percentile(self, q):
+        """Returns the q-th percentile of the items in O(1).
+
+        Matches the default linear interpolation of numpy.percentile(): the
+        result lies at fractional position q / 100 * (len - 1) of the sorted
+        items. It is computed exactly and converted to the item type.
+
+        Raises:
+            ValueError: if q is not between 0 and 100.
+            ValueError: if the progression is empty.
+        """
+
+        q = _exact(q)
+
+        if not 0 <= q <= 100:
+            raise ValueError("Percentile must be between 0 and 100.")
+
+        length = self._nonempty_length()
+
+        position = Fraction(q) * (length - 1) / 100
+        lower = int(position)
+        lower_num = _exact(self._sorted_num(lower))
+
+        if position == lower:
+            return self._num_to_item(self._sorted_num(lower))
+
+        upper_num = _exact(self._sorted_num(lower + 1))
+
+        return self._num_to_item(self._exact_to_num(
+            lower_num + (upper_num - lower_num) * (position - lower)))
+
+    # ------------------------------------------------------------------------
+    def sum(self):
+        """Returns the sum of the items in O(1).
+
+        The sum is computed exactly from the arithmetic series formula and
+        converted to the item type. The sum of an empty progression is 0.
+        """
+
+        length = self.length
+
+        if not length:
+            return 0
+
+        first = _exact(self._num_at(0))
+        step = _exact(self._step)
+
+        return self._num_to_item(self._exact_to_num(
+            first * length + step * (length * (length - 1) // 2)))
+
+    # ------------------------------------------------------------------------
+    def fingerprint(self):
+        """Returns a stable hex digest identifying the progression.
+
+        Unlike hash(), the fingerprint is identical across processes and
+        python versions, so it can be used for on-disk cache keys.
+        Progressions of the same type with the same items share a
+        fingerprint.
+        """
+
+        # imported here to keep importing openrange cheap
+        import hashlib
+
+        parts = [type(self).__module__, type(self).__name__]
+        for value in self._fingerprint_key():
+            try:
+                parts.append(str(Fraction(value)))
+            except (TypeError, ValueError):
+                parts.append(repr(value))
+
+        return hashlib.sha256("|".join(parts).encode('utf-8')).hexdigest()
+
+    # ------------------------------------------------------------------------
+    def freeze(self):
+        """Makes the progression immutable and hashable. Returns self.
+
+        Frozen progressions cannot be reversed in place, so they are safe to
+        share between threads and to use as dict keys. Use reversed() to
+        obtain a reversed copy.
+        """
+
+        self._frozen = True
+        return self
+
+    # ------------------------------------------------------------------------
+    def iter_prefetch(self, workers=4, buffer=None):
+        """Generates all items, converting upcoming items on a thread pool.
+
+        Useful when _num_to_item() is slow or I/O bound. Items are yielded in
+        order. At most buffer items (default: twice the number of workers)
+        are converted ahead of the consumer. An exception raised while
+        converting an item is raised when that item is reached. Pending
+        conversions are cancelled and the pool is shut down when the
+        generator finishes or is closed early.
+
+        Raises:
+            ImportError: if concurrent.futures is not available, see
+                import_thread_pool().
+            ValueError: if workers or buffer is less than 1.
+        """
+
+        # imported here to keep importing openrange cheap
+        ThreadPoolExecutor = import_thread_pool()
+
+        if workers < 1:
+            raise ValueError("Number of workers must be >= 1.")
+
+        if buffer is None:
+            buffer = 2 * workers
+        elif buffer < 1:
+            raise ValueError("Buffer size must be >= 1.")
+
+        nums = self._iter()
+        pending = deque()
+        executor = ThreadPoolExecutor(max_workers=workers)
+
+        try:
+            for num in itertools.islice(nums, buffer):
+                pending.append(executor.submit(self._num_to_item, num))
+
+            while pending:
+                item = pending.popleft().result()
+
+                for num in itertools.islice(nums, 1):
+                    pending.append(executor.submit(self._num_to_item, num))
+
+                yield item
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    # ------------------------------------------------------------------------
+    def map(self, func, cache=None):
+        """Returns a lazy sequence of func applied to each item.
+
+        The returned view has the same length as the progression. Values are
+        only computed when indexed or iterated, and slicing the view returns
+        another lazy view. If cache is a positive int, up to that many
+        computed values are retained for repeated access.
+        """
+
+        return MappedRange(self, func, cache=cache)
+
+    # ------------------------------------------------------------------------
+    def map_batch(self, func, cache=None):
+        """Returns a lazy sequence of a vectorized func applied to the items.
+
+        Like map(), but func receives a numpy array of items and returns a
+        sequence of values of the same length, so whole blocks of items are
+        converted and mapped at once. Requires numpy.
+        """
+
+        return MappedRange(self, func, cache=cache, batch=True)
+
     # ------------------------------------------------------------------------
     def repeat(self, times=2):
-        """Iterate over the progression multiple times in sequence."""
+        """Returns a lazy sequence of the progression repeated times in a row.
 
-        if times < 1:
-            raise ValueError("Repeat value must be > 1.")
-        
-        for t in range(times):
-            for i in self._iter():
-                yield self._num_to_item(i)
+        The result is a ChainRange view, so besides iteration it supports
+        len(), indexing, and slicing without materializing any items.
+
+        Raises:
+            ValueError: if times is less than 1.
+        """
+
+        return ChainRange(self).repeat(times)
 
     # ------------------------------------------------------------------------
     def random(self):
         """Generate the items in the progression in a random order.
-        
+
+        Progressions with more than sys.maxsize items cannot be shuffled in
+        memory. They are instead visited in the order of a random affine
+        permutation of the indices, which costs O(1) per item.
         """
-        # randomize the indecies, then yield the corresponding item
-        for i in random.sample(built_in_range(0, len(self)), len(self)):
-            yield self[i]
+
+        _len = self.length
+
+        if _len <= sys.maxsize:
+            # randomize the indecies, then yield the corresponding item
+            for i in random.sample(built_in_range(0, _len), _len):
+                yield self[i]
+            return
+
+        while True:
+            mult = random.randrange(1, _len)
+            if gcd(mult, _len) == 1:
+                break
+        offset = random.randrange(_len)
+
+        for i in built_in_range(_len):
+            yield self[(mult * i + offset) % _len]
 
     # ------------------------------------------------------------------------
     def reverse(self):
-        """Reverses the range in place."""
-        (self._start, self._stop) = (self._stop, self._start)
+        """Reverses the range in place.
+
+        The reversed progression starts from the last item rather than from
+        stop, which need not be an item, so it holds the same items, like
+        reversed().
+
+        Raises:
+            TypeError: if the progression is frozen.
+        """
+
+        self._check_mutable()
+
+        length = self.length
+        last = self._num_at(length - 1) if length else self._stop
+
+        (self._start, self._stop) = (last, self._start)
         self._step *= -1
 
+    # ------------------------------------------------------------------------
+    def sample(self, k, seed=None):
+        """Returns a list of k distinct items chosen at random.
+
+        Unlike random.sample(self, k), this never builds a list of every
+        index: it costs O(k) time and memory regardless of the length of
+        the progression. Pass seed for reproducible samples.
+
+        Raises:
+            ValueError: if k is negative or larger than the progression.
+        """
+
+        indices = _sample_indices(random.Random(seed), self.length, k)
+        return [self._num_to_item(self._num_at(i)) for i in indices]
+
+    # ------------------------------------------------------------------------
+    def sample_array(self, k, seed=None):
+        """Returns a numpy array of k distinct items chosen at random.
+
+        The indices are drawn with numpy and the items are converted in a
+        single vectorized pass. Requires numpy.
+
+        Raises:
+            ValueError: if k is negative or larger than the progression.
+        """
+
+        numpy = import_numpy()
+
+        length = self.length
+
+        if k < 0 or k > length:
+            raise ValueError("Sample larger than population or is negative.")
+
+        if length < 2 ** 63:
+            generator = numpy.random.default_rng(seed)
+            indices = generator.choice(length, size=k, replace=False)
+        else:
+            indices = numpy.array(
+                _sample_indices(random.Random(seed), length, k), dtype=object)
+
+        return self._num_array_to_items(self._num_array(indices))
+
+    # ------------------------------------------------------------------------
+    def scale(self, k, origin=None):
+        """Returns a new progression with the items scaled by k, in O(1).
+
+        Each item x maps to origin + k * (x - origin) and the step is
+        multiplied by k, so a negative k reverses the direction. The origin
+        is an item and defaults to the start of the progression; e.g. use
+        origin=0 to retime frame numbers for a new frame rate. Computed with
+        exact arithmetic on the numeric values.
+
+        Raises:
+            ValueError: if k is 0.
+        """
+
+        if k == 0:
+            raise ValueError("Scale factor cannot be 0.")
+
+        if origin is None:
+            origin = self._start
+        else:
+            origin = self._item_to_num(origin)
+
+        (k, origin) = (_exact(k), _exact(origin))
+
+        (start, stop, step) = [
+            self._exact_to_num(num) for num in (
+                origin + k * (_exact(self._start) - origin),
+                origin + k * (_exact(self._stop) - origin),
+                k * _exact(self._step),
+            )
+        ]
+
+        new_range = self._from_nums(start, stop, step)
+
+        if any(isinstance(n, Fraction) for n in (start, stop, step)):
+            new_range._rational = True
+
+        return new_range
+
+    # ------------------------------------------------------------------------
+    def shift(self, delta):
+        """Returns a new progression with every item offset by delta, in O(1).
+
+        delta has the type of the step, e.g. a timedelta for datetime
+        progressions. range + delta and range - delta are equivalent to
+        shift(delta) and shift(-delta).
+        """
+
+        return self._shifted(self._step_to_num(delta))
+
+    # ------------------------------------------------------------------------
+    def shard(self, i, n, mode='contiguous'):
+        """Returns the i-th of n disjoint sub-progressions in O(1).
+
+        Together, the n shards contain every item exactly once and their
+        lengths differ by at most one. Each shard is a progression of the
+        same type, so a worker needs only the original progression and its
+        shard number.
+
+        Args:
+            i: the shard number, 0 <= i < n.
+            n: the total number of shards.
+            mode: 'contiguous' splits the progression into consecutive
+                blocks. 'strided' takes every n-th item starting at item i.
+
+        Raises:
+            ValueError: if n < 1, i is out of bounds, or mode is invalid.
+        """
+
+        if n < 1:
+            raise ValueError("Number of shards must be >= 1.")
+
+        if not 0 <= i < n:
+            raise ValueError(
+                "Shard '{i}' is out of range for {n} shards.".format(i=i, n=n))
+
+        if mode == 'strided':
+            return self[i::n]
+
+        elif mode == 'contiguous':
+            (size, extra) = divmod(self.length, n)
+            start = i * size + min(i, extra)
+            stop = start + size + (1 if i < extra else 0)
+            return self[start:stop]
+
+        else:
+            raise ValueError(
+                "Invalid shard mode: {m!r}. Expected one of: {v}".format(
+                    m=mode, v=", ".join(_SHARD_MODES)))
+
+    # ------------------------------------------------------------------------
+    def to_array(self):
+        """Returns a numpy array containing all items in the progression.
+
+        The numeric values are computed in a single vectorized pass rather
+        than by converting each item individually. Requires numpy.
+        """
+
+        numpy = import_numpy()
+        nums = self._num_array(numpy.arange(self.length))
+        return self._num_array_to_items(nums)
+
+    # ------------------------------------------------------------------------
+    def to_pandas(self):
+        """Returns a pandas Index containing all items in the progression.
+
+        The default builds the index from to_array(), so no python object is
+        created per item. Subclasses map onto specialized pandas indexes
+        where possible. Requires numpy and pandas.
+        """
+
+        pandas = import_pandas()
+        return pandas.Index(self.to_array())
+
+    # ------------------------------------------------------------------------
+    def windows(self, size, stride=None, partial=True):
+        """Returns a lazy sequence of windows of size items each.
+
+        Each window is a sub-progression of the same type, built in O(1)
+        when indexed. Windows start every stride items (default: size, for
+        non-overlapping windows). A final window with fewer than size items
+        is included unless partial is False. For example, windows(2, 1)
+        holds each pair of consecutive items.
+        """
+
+        return WindowedRange(self, size, stride=stride, partial=partial)
+
+    # ------------------------------------------------------------------------
+    @property
+    def frozen(self):
+        """True if the progression is immutable and hashable."""
+        return self._frozen
+
+    # ------------------------------------------------------------------------
+    @property
+    def length(self):
+        """The number of items in the progression.
+
+        Unlike len(), this is not limited to sys.maxsize.
+        """
+        return max(0, floor_div(self._stop - self._start, self._step) + 1)
+
     # ------------------------------------------------------------------------
     @property
     def start(self):
@@ -302,6 +1084,333 @@ class BaseRange(Sequence):
             yield i
             i += self._step
 
+    # ------------------------------------------------------------------------
+    def _array_num(self, num):
+        """Convert a numeric value to a scalar for vectorized calculations.
+
+        Must be consistent with the values returned by _item_array_to_nums().
+        The default returns integral values as ints and others as floats.
+        """
+
+        try:
+            frac = Fraction(num)
+        except TypeError:
+            return num
+
+        if frac.denominator == 1:
+            return int(frac)
+
+        return float(frac)
+
+    # ------------------------------------------------------------------------
+    def _array_num_to_num(self, value):
+        """Convert a python scalar from _array_num() back to a numeric value.
+
+        The inverse of _array_num(). The default returns the value as is.
+        """
+
+        return value
+
+    # ------------------------------------------------------------------------
+    def _ascending(self):
+        """True if items increase along the progression."""
+
+        return self._step > 0
+
+    # ------------------------------------------------------------------------
+    def _bound_index(self, num, below):
+        """Index of the closest item below (or above) num, or None.
+
+        Items exactly equal to num count as both below and above it.
+        """
+
+        length = self.length
+
+        if self._ascending() == below:
+            index = min(self._index_floor(num), length - 1)
+            return index if index >= 0 else None
+        else:
+            index = max(self._index_ceil(num), 0)
+            return index if index < length else None
+
+    # ------------------------------------------------------------------------
+    def _check_mutable(self):
+        """Raise TypeError if the progression is frozen."""
+
+        if self._frozen:
+            raise TypeError(
+                "Frozen {c} cannot be modified.".format(
+                    c=self.__class__.__name__))
+
+    # ------------------------------------------------------------------------
+    def _conversion_key(self):
+        """Instance state that item conversions depend on, as a tuple.
+
+        Numeric values are only comparable between progressions of the same
+        type with equal conversion keys, e.g. paths of the same template.
+        This is the state subclasses add to _key().
+        """
+
+        return self._key()[3:]
+
+    # ------------------------------------------------------------------------
+    def _exact_to_num(self, value):
+        """Converts an exact int or Fraction result to a numeric value.
+
+        Progressions of int or Fraction values get integral results as
+        ints. Other values, e.g. the Decimals of float Ranges, keep their
+        type, so the result converts to the same item type as the items.
+        """
+
+        num = self._start + self._step
+
+        if isinstance(num, integer_types + (Fraction,)):
+            return _simplify(value)
+
+        if isinstance(num, Decimal):
+            return Decimal(repr(float(value)))
+
+        return type(num)(value)
+
+    # ------------------------------------------------------------------------
+    def _fingerprint_key(self):
+        """Canonical state hashed by fingerprint(). Defaults to _key().
+
+        Subclasses whose numeric values depend on the environment, e.g. on
+        the local timezone, should return an equivalent environment
+        independent key.
+        """
+
+        return self._key()
+
+    # ------------------------------------------------------------------------
+    def _from_nums(self, start, stop, step):
+        """Returns a new, unfrozen progression with the supplied numeric state.
+
+        This is the internal constructor for derived progressions. It skips
+        item conversion and argument validation, and copies any additional
+        instance state (e.g. conversion settings) from self.
+        """
+
+        new_range = self.__class__.__new__(self.__class__)
+        new_range.__dict__.update(self.__dict__)
+        new_range.__dict__.pop('_frozen', None)
+        new_range.__dict__.pop('_hash', None)
+
+        new_range._start = start
+        new_range._stop = stop
+        new_range._step = step
+
+        return new_range
+
+    # ------------------------------------------------------------------------
+    def _index_ceil_array(self, nums):
+        """Vectorized _index_ceil() for an array from _item_array_to_nums()."""
+
+        return -self._index_floor_array(nums, negate=True)
+
+    # ------------------------------------------------------------------------
+    def _index_floor_array(self, nums, negate=False):
+        """Vectorized _index_floor() for an array from _item_array_to_nums().
+
+        If negate is True, the floor of the negated fractional index is
+        returned instead.
+        """
+
+        numpy = import_numpy()
+
+        start = self._array_num(self._start)
+        step = self._array_num(self._step)
+
+        if nums.dtype.kind == 'f' and isinstance(start, integer_types) and \
+           isinstance(step, integer_types):
+            # in integral progressions, the floor of the fractional index
+            # only depends on the floor (or ceiling) of a value, so it can
+            # be computed exactly. Not taken for nan, inf or huge values.
+            if (step > 0) != negate:
+                rounded = numpy.floor(nums)
+            else:
+                rounded = numpy.ceil(nums)
+            if numpy.all(numpy.abs(rounded) < 2.0 ** 62):
+                nums = rounded.astype(numpy.int64)
+
+        diff = (start - nums) if negate else (nums - start)
+
+        if diff.dtype.kind in 'iu' and isinstance(step, integer_types):
+            return numpy.floor_divide(diff, step)
+
+        mag = numpy.maximum(numpy.abs(nums), abs(float(start)))
+        return floor_array(diff / step, rounding_tol(mag, float(step)))
+
+    # ------------------------------------------------------------------------
+    def _index_ceil(self, num):
+        """Returns the ceiling of the fractional index of num.
+
+        The result is not clamped to the bounds of the progression.
+        """
+
+        index = self._snapped_index(num)
+        if index is not None:
+            return index
+
+        return -floor_div(self._start - num, self._step)
+
+    # ------------------------------------------------------------------------
+    def _index_floor(self, num):
+        """Returns the floor of the fractional index of num.
+
+        The result is not clamped to the bounds of the progression.
+        """
+
+        index = self._snapped_index(num)
+        if index is not None:
+            return index
+
+        return floor_div(num - self._start, self._step)
+
+    # ------------------------------------------------------------------------
+    def _index_num(self, num):
+        """Returns the index of the supplied numeric value or None.
+
+        Together with _num_at(), this defines the stepping model of the
+        progression. Non-additive progressions override both.
+        """
+
+        if self._rational:
+            index = self._snapped_index(num)
+            if index is None or not 0 <= index < self.length:
+                return None
+            return index
+
+        if not self._in_range(num):
+            return None
+
+        diff = num - self._start
+        if not (diff % self._step) == 0:
+            return None
+
+        return int(diff // self._step)
+
+    # ------------------------------------------------------------------------
+    def _item_array_to_nums(self, values):
+        """Convert a numpy array of items to an array of numeric values.
+
+        The values are in the space used by _array_num(). By default,
+        numeric arrays are assumed to hold numeric values already and other
+        arrays are converted item by item via _item_to_num().
+        """
+
+        numpy = import_numpy()
+
+        if values.dtype.kind in 'iuf':
+            return values
+
+        return numpy.array(
+            [self._array_num(self._item_to_num(v)) for v in values.tolist()])
+
+    # ------------------------------------------------------------------------
+    def _key(self):
+        """Canonical numeric state: length, first value, and step.
+
+        Two progressions of the same type with equal keys contain the same
+        items. Subclasses whose conversions depend on additional instance
+        state should extend the key with that state.
+        """
+
+        _len = self.length
+        return (
+            _len,
+            self._start if _len > 0 else None,
+            self._step if _len > 1 else None,
+        )
+
+    # ------------------------------------------------------------------------
+    def _lookup_num(self, item):
+        """Convert an item looked up in the progression to a numeric value."""
+
+        return self._wrap_num(self._item_to_num(item))
+
+    # ------------------------------------------------------------------------
+    def _nonempty_length(self):
+        """Returns the length, raising ValueError if it is 0."""
+
+        length = self.length
+
+        if not length:
+            raise ValueError(
+                "{c} is empty".format(c=self.__class__.__name__))
+
+        return length
+
+    # ------------------------------------------------------------------------
+    def _num_at(self, index):
+        """Returns the numeric value at the supplied non-negative index."""
+
+        return self._start + index * self._step
+
+    # ------------------------------------------------------------------------
+    def _shifted(self, num):
+        """Returns a new progression with the numeric values offset by num."""
+
+        return self._from_nums(self._start + num, self._stop + num, self._step)
+
+    # ------------------------------------------------------------------------
+    def _snapped_index(self, num):
+        """Returns the index of the grid value num converts like, or None.
+
+        Items of rational progressions (see by_count()) are rounded when
+        converted, e.g. to a float or to whole microseconds, so an item
+        converted back to a numeric value generally lies just off the exact
+        grid. Such values match the nearest grid index if both convert to
+        the same item. Always None for other progressions.
+        """
+
+        if not self._rational:
+            return None
+
+        diff = Fraction(num) - Fraction(self._start)
+        index = floor_div(2 * diff + self._step, 2 * self._step)
+
+        try:
+            grid_item = self._num_to_item(self._num_at(index))
+            item = self._num_to_item(num)
+        except (OverflowError, ValueError):
+            # beyond the range of the item type, e.g. datetime.max
+            return None
+
+        return index if grid_item == item else None
+
+    # ------------------------------------------------------------------------
+    def _sorted_num(self, index):
+        """Returns the numeric value at an index of the sorted items."""
+
+        if not self._ascending():
+            index = self.length - 1 - index
+
+        return self._num_at(index)
+
+    # ------------------------------------------------------------------------
+    def _step_multiple(self, count):
+        """Returns the numeric step spanning count steps of the progression."""
+
+        return self._step * count
+
+    # ------------------------------------------------------------------------
+    def _wrap_num(self, num):
+        """Map a looked up numeric value into the span of the progression.
+
+        Progressions over a cyclic domain, like times of day, override this.
+        The default returns num unchanged.
+        """
+
+        return num
+
+    # ------------------------------------------------------------------------
+    def _wrap_num_array(self, nums):
+        """Vectorized _wrap_num() for an array from _item_array_to_nums()."""
+
+        return nums
+
     # ------------------------------------------------------------------------
     @abstractmethod
     def _item_to_num(self, item):
@@ -322,6 +1431,58 @@ class BaseRange(Sequence):
         """Convert supplied numeric value to a step item."""
         return self._num_to_item(num)
 
+    # ------------------------------------------------------------------------
+    def _num_array(self, indices):
+        """Convert a numpy array of indices to an array of numeric values.
+
+        Integral progressions produce an int64 array, or an object array of
+        python ints if the values would overflow. Fractional progressions are
+        evaluated exactly over a common denominator and rounded once, so each
+        value matches float() of the corresponding scalar numeric value.
+        """
+
+        numpy = import_numpy()
+
+        try:
+            start = Fraction(self._start)
+            step = Fraction(self._step)
+        except TypeError:
+            return numpy.array(
+                [self._start + i * self._step for i in indices.tolist()],
+                dtype=object,
+            )
+
+        denom = start.denominator * step.denominator // \
+            gcd(start.denominator, step.denominator)
+        first = start.numerator * (denom // start.denominator)
+        incr = step.numerator * (denom // step.denominator)
+
+        # int64 values must also survive the conversion to float64 when the
+        # progression is fractional.
+        limit = 2 ** 63 if denom == 1 else 2 ** 53
+        count = int(indices.max()) + 1 if len(indices) else 0
+
+        if abs(first) + abs(incr) * count < limit:
+            nums = first + indices.astype(numpy.int64) * incr
+        else:
+            nums = first + indices.astype(object) * incr
+
+        if denom == 1:
+            return nums
+
+        return (nums / denom).astype(numpy.float64)
+
+    # ------------------------------------------------------------------------
+    def _num_array_to_items(self, nums):
+        """Convert a numpy array of numeric values to an array of items.
+
+        The default implementation converts each value via _num_to_item().
+        Subclasses whose items map onto a numpy dtype should override this
+        with a vectorized conversion.
+        """
+
+        numpy = import_numpy()
+        return numpy.array([self._num_to_item(n) for n in nums.tolist()])
 
     # ------------------------------------------------------------------------
     def _in_range(self, num):
@@ -331,3 +1492,51 @@ class BaseRange(Sequence):
         else:
             return num <= self._start and num >= self._stop
 
+# ----------------------------------------------------------------------------
+def _exact(num):
+    """Converts a numeric value to a Fraction for exact arithmetic.
+
+    Floats are converted via their repr, like Range items, so 0.1 is 1/10.
+    """
+
+    if isinstance(num, integer_types + (Fraction,)):
+        return num
+
+    if isinstance(num, float):
+        num = Decimal(repr(num))
+
+    return Fraction(num)
+
+# ----------------------------------------------------------------------------
+def _sample_indices(rand, length, k):
+    """Returns k distinct random indices below length in O(k)."""
+
+    if k < 0 or k > length:
+        raise ValueError("Sample larger than population or is negative.")
+
+    if 2 * k > length:
+        # dense samples: exclude a sparse sample and shuffle the rest, which
+        # is still O(k) since k is at least half the length
+        excluded = set(_sample_indices(rand, length, length - k))
+        indices = [i for i in built_in_range(length) if i not in excluded]
+        rand.shuffle(indices)
+        return indices
+
+    chosen = set()
+    indices = []
+    while len(indices) < k:
+        index = rand.randrange(length)
+        if index not in chosen:
+            chosen.add(index)
+            indices.append(index)
+
+    return indices
+
+# ----------------------------------------------------------------------------
+def _simplify(num):
+    """Returns integral Fractions as ints."""
+
+    if isinstance(num, Fraction) and num.denominator == 1:
+        return num.numerator
+
+    return num
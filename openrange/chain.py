@@ -0,0 +1,289 @@
+
+"""Concatenated progressions with random access."""
+
+# ----------------------------------------------------------------------------
+
+import bisect
+import copy
+import itertools
+
+from six import integer_types
+
+from ._compat import gcd
+from ._util import range_length, seq_length
+
+# ----------------------------------------------------------------------------
+
+try:
+    from collections.abc import Sequence
+except ImportError:
+    # python 2
+    from collections import Sequence
+
+# ----------------------------------------------------------------------------
+
+__all__ = [
+    'ChainRange',
+]
+
+# ----------------------------------------------------------------------------
+class ChainRange(Sequence):
+    """Several progressions concatenated end to end.
+
+    Unlike itertools.chain(), the chain has a length and supports indexing,
+    index(), and inclusion tests. An item is located by a binary search of
+    the cumulative lengths of the progressions in O(log k). Slicing returns
+    another chain of sliced progressions without evaluating any items.
+    repeat() returns a view of the chain repeated several times in O(1).
+    Parts are typically BaseRange instances, but any sequence will do.
+    """
+
+    # ------------------------------------------------------------------------
+    def __bool__(self):
+        """Returns True if the chain has items, even beyond sys.maxsize."""
+
+        return self.length > 0
+
+    # python 2
+    __nonzero__ = __bool__
+
+    # ------------------------------------------------------------------------
+    def __contains__(self, item):
+        """Test for inclusion of the supplied item."""
+
+        for rng in self._ranges:
+            if item in rng:
+                return True
+
+        return False
+
+    # ------------------------------------------------------------------------
+    def __getitem__(self, index):
+        """Retrieves item(s) from the chain for a given index or slice.
+
+        Slicing returns a new chain.
+        """
+
+        if isinstance(index, slice):
+            return self._slice(index)
+
+        elif isinstance(index, integer_types):
+            _len = self.length
+            if index < 0:
+                index += _len
+            if index < 0 or index >= _len:
+                raise IndexError(
+                    "Index '{i}' is out of range.".format(i=index))
+
+            part = self._locate(index)
+            return self._part(part)[index - self._part_offset(part)]
+
+        else:
+            raise TypeError(
+                "Invalid index type: {t}".format(t=str(type(index))))
+
+    # ------------------------------------------------------------------------
+    def __init__(self, *ranges):
+        """Constructor.
+
+        Args:
+            ranges: the progressions to concatenate, in order.
+        """
+
+        self._ranges = tuple(ranges)
+        self._times = 1
+
+        # cumulative lengths: part k starts at self._offsets[k]
+        self._offsets = [0]
+        for rng in self._ranges:
+            self._offsets.append(self._offsets[-1] + seq_length(rng))
+
+    # ------------------------------------------------------------------------
+    def __iter__(self):
+        """Generates all items in the chain."""
+
+        for _ in range(self._times):
+            for item in itertools.chain(*self._ranges):
+                yield item
+
+    # ------------------------------------------------------------------------
+    def __len__(self):
+        """Returns the number of items in the chain.
+
+        Raises:
+            OverflowError: if the length exceeds sys.maxsize. Use the length
+                property for chains of arbitrary size.
+        """
+
+        return self.length
+
+    # ------------------------------------------------------------------------
+    def __repr__(self):
+        """Official string representation of the chain."""
+
+        rpr = "{c}({r})".format(
+            c=self.__class__.__name__,
+            r=", ".join([repr(rng) for rng in self._ranges]),
+        )
+
+        if self._times != 1:
+            rpr += ".repeat({t})".format(t=self._times)
+
+        return rpr
+
+    # ------------------------------------------------------------------------
+    def __str__(self):
+        """Informal string representation of the chain."""
+
+        return self.__repr__()
+
+    # ------------------------------------------------------------------------
+    def count(self, item):
+        """Returns the number of times item appears in the chain."""
+
+        return self._times * sum(rng.count(item) for rng in self._ranges)
+
+    # ------------------------------------------------------------------------
+    def index(self, item):
+        """Returns the index of the first item matching the supplied item."""
+
+        for (offset, rng) in zip(self._offsets, self._ranges):
+            if item in rng:
+                return offset + rng.index(item)
+
+        raise ValueError(
+            "{i} is not in {c}".format(i=item, c=self.__class__.__name__))
+
+    # ------------------------------------------------------------------------
+    def repeat(self, times=2):
+        """Returns a view of the chain repeated times in a row, in O(1).
+
+        Raises:
+            ValueError: if times is less than 1.
+        """
+
+        if times < 1:
+            raise ValueError("Repeat value must be >= 1.")
+
+        view = copy.copy(self)
+        view._times = self._times * times
+        return view
+
+    # ------------------------------------------------------------------------
+    @property
+    def length(self):
+        """The number of items in the chain, which may exceed sys.maxsize."""
+        return self._offsets[-1] * self._times
+
+    # ------------------------------------------------------------------------
+    @property
+    def ranges(self):
+        """The concatenated progressions, for a single repetition."""
+        return self._ranges
+
+    # ------------------------------------------------------------------------
+    def _locate(self, index):
+        """Returns the number of the part holding a non-negative index.
+
+        Parts are numbered across repetitions: part n is progression
+        n % len(ranges) in repetition n // len(ranges).
+        """
+
+        (cycle, index) = divmod(index, self._offsets[-1])
+
+        # empty progressions share their offset with the next one, so take
+        # the last progression starting at or before the index
+        k = bisect.bisect_right(self._offsets, index) - 1
+        return cycle * len(self._ranges) + k
+
+    # ------------------------------------------------------------------------
+    def _part(self, part):
+        """Returns the progression for a part number."""
+        return self._ranges[part % len(self._ranges)]
+
+    # ------------------------------------------------------------------------
+    def _part_offset(self, part):
+        """Returns the index of the first item of a part number."""
+
+        (cycle, k) = divmod(part, len(self._ranges))
+        return cycle * self._offsets[-1] + self._offsets[k]
+
+    # ------------------------------------------------------------------------
+    def _slice(self, index):
+        """Returns a new chain of the sliced parts touched by a slice.
+
+        The selected items of a repeated chain are periodic: a slice step
+        spans whole cycles every cycle length / gcd(cycle length, step)
+        items. Longer slices are returned as one period of sliced parts,
+        repeated, followed by the first items of the period that remain, so
+        the result stays O(1) in the number of repetitions.
+        """
+
+        (start, stop, step) = index.indices(self.length)
+        count = range_length(start, stop, step)
+
+        if not count:
+            return self.__class__()
+
+        cycle = self._offsets[-1]
+        period = cycle // gcd(cycle, abs(step))
+
+        if count <= period:
+            return self.__class__(*self._sliced_parts(start, step, count))
+
+        body = self.__class__(*self._sliced_parts(start, step, period))
+        (cycles, rest) = divmod(count, period)
+
+        repeated = body.repeat(cycles)
+        if not rest:
+            return repeated
+
+        return self.__class__(repeated, *body[:rest].ranges)
+
+    # ------------------------------------------------------------------------
+    def _sliced_parts(self, start, step, count):
+        """Returns the sliced parts holding start + p * step, 0 <= p < count.
+
+        Parts without selected items are skipped: after each part, the
+        search continues at the part holding the next selected index.
+        """
+
+        sliced = []
+        p = 0
+
+        while p < count:
+            part = self._locate(start + p * step)
+            rng = self._part(part)
+            (sub, p) = _slice_part(
+                rng, self._part_offset(part), seq_length(rng), start, step,
+                count)
+            sliced.append(sub)
+
+        return sliced
+
+# ----------------------------------------------------------------------------
+def _slice_part(rng, offset, length, start, step, count):
+    """Slice the items of a part that belong to a sliced chain.
+
+    The chain slice selects indices start + p * step for 0 <= p < count.
+    The part holds the chain indices offset to offset + length - 1 and at
+    least one selected index. Returns the slice of the part and the first p
+    beyond the part.
+    """
+
+    (lo, hi) = (offset, offset + length)
+
+    # range of p for which the chain index falls within the part
+    if step > 0:
+        p_lo = -((start - lo) // step)
+        p_hi = -((start - hi) // step)
+    else:
+        p_lo = -((start - hi + 1) // step)
+        p_hi = (lo - start) // step + 1
+
+    (p_lo, p_hi) = (max(p_lo, 0), min(p_hi, count))
+
+    local = start + p_lo * step - offset
+    local_stop = local + (p_hi - p_lo) * step
+
+    return (rng[local:local_stop if local_stop >= 0 else None:step], p_hi)
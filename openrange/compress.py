@@ -0,0 +1,176 @@
+
+"""Compress sequences of values into arithmetic progressions."""
+
+# ----------------------------------------------------------------------------
+
+from ._compat import import_numpy
+from .rng import Range
+
+# ----------------------------------------------------------------------------
+
+__all__ = [
+    'from_sequence',
+]
+
+# ----------------------------------------------------------------------------
+def from_sequence(iterable, cls=Range):
+    """Returns a list of progressions containing the supplied values in order.
+
+    The values are split into maximal arithmetic runs in a single greedy
+    pass. Each run becomes one progression of type cls. Only the current
+    run's first value, last value, step, and length are kept while
+    scanning, so iterators of any size can be compressed. A value equal to
+    its predecessor always starts a new run, since a progression cannot have
+    a step of 0.
+
+    Integer, datetime64, and timedelta64 numpy arrays take a vectorized
+    path. It finds the runs from the differences between neighbouring
+    values, so only run boundaries are converted individually. Both paths
+    return the same progressions.
+
+    Args:
+        iterable: the values to compress, e.g. ints, floats, datetimes, or
+            a numpy array of them.
+        cls: an additive BaseRange subclass, e.g. Range or DatetimeRange,
+            whose items are the supplied values.
+    """
+
+    proto = cls.__new__(cls)
+
+    try:
+        numpy = import_numpy()
+    except ImportError:
+        numpy = None
+
+    if numpy is not None and isinstance(iterable, numpy.ndarray):
+        if iterable.dtype.kind == 'M':
+            iterable = iterable.astype('M8[us]')
+        elif iterable.dtype.kind == 'm':
+            iterable = iterable.astype('m8[us]')
+
+        nums = _array_nums(proto, iterable)
+        if nums is not None:
+            return _from_array(proto, iterable, nums)
+
+        # other arrays are scanned as python objects
+        iterable = iterable.tolist()
+
+    blocks = ((proto._item_to_num(item), None, 1) for item in iterable)
+    return [_make_range(proto, *run) for run in _greedy_runs(blocks)]
+
+# ----------------------------------------------------------------------------
+def _array_nums(proto, values):
+    """Returns int64 numeric values for the vectorized path, or None.
+
+    Only arrays whose numeric values are exact integers and whose
+    differences cannot overflow are eligible.
+    """
+
+    if values.ndim != 1 or values.dtype.kind not in 'iMm' or len(values) < 2:
+        return None
+
+    nums = proto._item_array_to_nums(values)
+    if nums.dtype.kind != 'i':
+        return None
+
+    if int(nums.max()) - int(nums.min()) >= 2 ** 63:
+        return None
+
+    return nums
+
+# ----------------------------------------------------------------------------
+def _from_array(proto, values, nums):
+    """Vectorized from_sequence() for integer and datetime-like arrays."""
+
+    numpy = import_numpy()
+
+    # split the differences into blocks of equal values. Each block is an
+    # arithmetic sequence that the greedy pass can consume in O(1).
+    diffs = numpy.diff(nums)
+    bounds = numpy.flatnonzero(diffs[1:] != diffs[:-1]) + 1
+    starts = numpy.concatenate(([0], bounds))
+    sizes = numpy.diff(numpy.concatenate((starts, [len(diffs)])))
+
+    blocks = [(int(nums[0]), None, 1)]
+    blocks.extend(zip(
+        nums[starts + 1].tolist(), diffs[starts].tolist(), sizes.tolist()))
+
+    def item_num(position):
+        return proto._item_to_num(values[position].item())
+
+    # runs are contiguous, so each run starts where the previous one ended.
+    # Convert the original items at the run boundaries to numeric values.
+    ranges = []
+    position = 0
+    for (_, _, count) in _greedy_runs(blocks):
+        first = item_num(position)
+        if count > 1:
+            step = item_num(position + 1) - first
+            ranges.append(_make_range(proto, first, step, count))
+        else:
+            ranges.append(_make_range(proto, first, None, 1))
+        position += count
+
+    return ranges
+
+# ----------------------------------------------------------------------------
+def _greedy_runs(blocks):
+    """Generates (first, step, count) for each maximal arithmetic run.
+
+    The input is a stream of (first, step, count) blocks, each standing for
+    count values in arithmetic progression. The result is the same as
+    pushing every value of every block in turn, but a block that continues
+    the current run is absorbed in O(1). Single values have a step of None.
+
+    A run of two values is not kept until a third value matches it: if the
+    next value breaks the step, the second value starts a new run with it
+    instead, since a pair is no better than two single values.
+    """
+
+    (first, step, last, count) = (None, None, None, 0)
+
+    for (value, incr, size) in blocks:
+        while size:
+
+            if count >= 2 and value == last + step and \
+               (size == 1 or incr == step):
+                count += size
+                last = value + (size - 1) * step
+                break
+
+            if count == 0:
+                (first, last, count) = (value, value, 1)
+
+            elif count == 1:
+                if value != first:
+                    (step, last, count) = (value - first, value, 2)
+                else:
+                    yield (first, None, 1)
+                    (first, last) = (value, value)
+
+            elif value == last + step:
+                (last, count) = (value, count + 1)
+
+            elif count == 2 and value != last:
+                yield (first, None, 1)
+                (first, step, last) = (last, value - last, value)
+
+            else:
+                yield (first, step, count)
+                (first, step, last, count) = (value, None, value, 1)
+
+            size -= 1
+            if size:
+                value += incr
+
+    if count:
+        yield (first, step, count)
+
+# ----------------------------------------------------------------------------
+def _make_range(proto, first, step, count):
+    """Build a progression from a numeric run."""
+
+    if count == 1:
+        return proto._from_nums(first, first, 1)
+
+    return proto._from_nums(first, first + (count - 1) * step, step)
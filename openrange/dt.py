@@ -1,8 +1,13 @@
 
 from datetime import date, datetime, time, timedelta
+from fractions import Fraction
 import re
+import sys
 from time import gmtime, localtime, mktime
 
+from six import integer_types
+
+from ._compat import gcd, import_numpy, import_pandas
 from .base import BaseRange
 
 # ----------------------------------------------------------------------------
@@ -13,8 +18,8 @@ __all__ = [
     'TimeRange',
 ]
 
-# epoch relative to local time.
-EPOCH = datetime.fromtimestamp(mktime(localtime(0)))
+# epoch relative to local time. Computed on first use, see _epoch().
+_EPOCH = None
 
 # ----------------------------------------------------------------------------
 class DateRange(BaseRange):
@@ -36,17 +41,28 @@ class DateRange(BaseRange):
 
         super(DateRange, self).__init__(start, stop, step)
 
+    # ------------------------------------------------------------------------
+    def sum(self):
+        """Not supported: dates cannot be added together.
+
+        Raises:
+            TypeError: always.
+        """
+
+        raise TypeError(
+            "{c} does not support sum()".format(c=self.__class__.__name__))
+
     # ------------------------------------------------------------------------
     def _item_to_num(self, item):
         """Convert items to seconds since the epoch."""
         seconds = _delta_to_seconds(
-            datetime.combine(item, datetime.min.time()) - EPOCH)
+            datetime.combine(item, datetime.min.time()) - _epoch())
         return seconds
 
     # ------------------------------------------------------------------------
     def _num_to_item(self, num):
         """Convert seconds to a date object."""
-        return date.fromtimestamp(num)
+        return (_epoch() + _seconds_to_delta(num)).date()
 
     # ------------------------------------------------------------------------
     def _step_to_num(self, step):
@@ -56,7 +72,55 @@ class DateRange(BaseRange):
     # ------------------------------------------------------------------------
     def _num_to_step(self, num):
         """Convert seconds to timedelta object."""
-        return timedelta(seconds=num)
+        return _seconds_to_delta(num)
+
+    # ------------------------------------------------------------------------
+    def _array_num(self, num):
+        """Convert seconds to microseconds for vectorized calculations."""
+        return _seconds_to_micros(num)
+
+    # ------------------------------------------------------------------------
+    def _array_num_to_num(self, value):
+        """Convert microseconds back to seconds."""
+        return _micros_to_seconds(value)
+
+    # ------------------------------------------------------------------------
+    def _item_array_to_nums(self, values):
+        """Convert datetime64 values or date objects to microseconds."""
+        return _datetime_array_to_micros(values)
+
+    # ------------------------------------------------------------------------
+    def _fingerprint_key(self):
+        """Key independent of the local timezone, see _wall_clock_key()."""
+        return _wall_clock_key(self)
+
+    # ------------------------------------------------------------------------
+    def to_pandas(self):
+        """Returns a pandas DatetimeIndex of the dates at midnight.
+
+        Steps of whole days map onto pandas.date_range(). Other steps are
+        exported with to_array(). Requires pandas.
+        """
+
+        pandas = import_pandas()
+
+        step = _exact_micros(self._step)
+        if step is not None and step % (86400 * 10 ** 6) == 0:
+            return pandas.date_range(
+                self.start, periods=self.length,
+                freq=pandas.Timedelta(microseconds=step))
+
+        return pandas.DatetimeIndex(self.to_array())
+
+    # ------------------------------------------------------------------------
+    def _num_array(self, indices):
+        """Convert indices to an int64 array of microseconds."""
+        return _micros_array(self._start, self._step, indices)
+
+    # ------------------------------------------------------------------------
+    def _num_array_to_items(self, nums):
+        """Convert microseconds to a datetime64[D] array."""
+        return _micros_to_datetime64(nums).astype('M8[D]')
 
 # ----------------------------------------------------------------------------
 class DatetimeRange(BaseRange):
@@ -78,18 +142,28 @@ class DatetimeRange(BaseRange):
 
         super(DatetimeRange, self).__init__(start, stop, step)
 
+    # ------------------------------------------------------------------------
+    def sum(self):
+        """Not supported: datetimes cannot be added together.
+
+        Raises:
+            TypeError: always.
+        """
+
+        raise TypeError(
+            "{c} does not support sum()".format(c=self.__class__.__name__))
+
     # ------------------------------------------------------------------------
     def _item_to_num(self, item):
         """Convert items to seconds since the epoch."""
         
-        seconds = _delta_to_seconds(item - EPOCH)
+        seconds = _delta_to_seconds(item - _epoch())
         return seconds
 
     # ------------------------------------------------------------------------
     def _num_to_item(self, num):
         """Convert seconds to a datetime object."""
-
-        return datetime.fromtimestamp(num)
+        return _epoch() + _seconds_to_delta(num)
 
     # ------------------------------------------------------------------------
     def _step_to_num(self, step):
@@ -99,12 +173,62 @@ class DatetimeRange(BaseRange):
     # ------------------------------------------------------------------------
     def _num_to_step(self, num):
         """Convert seconds to timedelta object."""
-        return timedelta(seconds=num)
+        return _seconds_to_delta(num)
+
+    # ------------------------------------------------------------------------
+    def _array_num(self, num):
+        """Convert seconds to microseconds for vectorized calculations."""
+        return _seconds_to_micros(num)
+
+    # ------------------------------------------------------------------------
+    def _array_num_to_num(self, value):
+        """Convert microseconds back to seconds."""
+        return _micros_to_seconds(value)
+
+    # ------------------------------------------------------------------------
+    def _item_array_to_nums(self, values):
+        """Convert datetime64 values or datetime objects to microseconds."""
+        return _datetime_array_to_micros(values)
+
+    # ------------------------------------------------------------------------
+    def _fingerprint_key(self):
+        """Key independent of the local timezone, see _wall_clock_key()."""
+        return _wall_clock_key(self)
+
+    # ------------------------------------------------------------------------
+    def to_pandas(self):
+        """Returns a pandas DatetimeIndex of the items.
+
+        Steps of whole microseconds map onto pandas.date_range(). Other
+        steps are exported with to_array(). Requires pandas.
+        """
+
+        pandas = import_pandas()
+
+        step = _exact_micros(self._step)
+        if step is not None:
+            return pandas.date_range(
+                self.start, periods=self.length,
+                freq=pandas.Timedelta(microseconds=step))
+
+        return pandas.DatetimeIndex(self.to_array())
+
+    # ------------------------------------------------------------------------
+    def _num_array(self, indices):
+        """Convert indices to an int64 array of microseconds."""
+        return _micros_array(self._start, self._step, indices)
+
+    # ------------------------------------------------------------------------
+    def _num_array_to_items(self, nums):
+        """Convert microseconds to a datetime64[us] array."""
+        return _micros_to_datetime64(nums)
 
 # ----------------------------------------------------------------------------
 class TimeRange(BaseRange):
     """Time object progression."""
 
+    _period = 86400
+
     # ------------------------------------------------------------------------
     def __init__(self, start, stop, step):
         """Constructor. Start, stop, and step are required."""
@@ -126,22 +250,66 @@ class TimeRange(BaseRange):
             self._stop += _delta_to_seconds(timedelta(days=1))
         elif self._step < 0 and self._start < self._stop:
             self._start += _delta_to_seconds(timedelta(days=1))
-            
+
+    # ------------------------------------------------------------------------
+    @classmethod
+    def by_count(cls, start, stop, num):
+        """Returns a progression of num evenly spaced times of day.
+
+        Like the constructor, a stop earlier in the day than start wraps
+        forward past midnight. See BaseRange.by_count().
+        """
+
+        if isinstance(start, time) and isinstance(stop, time) and \
+           stop < start:
+            # a timedelta is converted as an offset from midnight
+            stop = timedelta(
+                days=1,
+                hours=stop.hour,
+                minutes=stop.minute,
+                seconds=stop.second,
+                microseconds=stop.microsecond,
+            )
+
+        return super(TimeRange, cls).by_count(start, stop, num)
+
+    # ------------------------------------------------------------------------
+    def sum(self):
+        """Not supported: times of day cannot be added together.
+
+        Raises:
+            TypeError: always.
+        """
+
+        raise TypeError(
+            "{c} does not support sum()".format(c=self.__class__.__name__))
+
     # ------------------------------------------------------------------------
     def _item_to_num(self, item):
-        """Convert time object to seconds."""
+        """Convert time object to seconds.
+
+        timedelta objects are treated as offsets from midnight, like
+        timedelta64 arrays.
+        """
 
-        return _delta_to_seconds(timedelta(hours=item.hour)) + \
-               _delta_to_seconds(timedelta(minutes=item.minute)) + \
-               _delta_to_seconds(timedelta(seconds=item.second))
+        if isinstance(item, timedelta):
+            return _delta_to_seconds(item)
+
+        return _delta_to_seconds(timedelta(
+            hours=item.hour,
+            minutes=item.minute,
+            seconds=item.second,
+            microseconds=item.microsecond,
+        ))
 
     # ------------------------------------------------------------------------
     def _num_to_item(self, num):
         """Convert seconds to time object."""
 
-        (minutes, seconds) = divmod(num, 60)
+        (seconds, microseconds) = _split_seconds(num)
+        (minutes, seconds) = divmod(seconds, 60)
         (hours, minutes) = divmod(minutes, 60)
-        return time(hours % 24, minutes, seconds)
+        return time(hours % 24, minutes, seconds, microseconds)
 
     # ------------------------------------------------------------------------
     def _step_to_num(self, step):
@@ -153,12 +321,281 @@ class TimeRange(BaseRange):
     def _num_to_step(self, num):
         """Convert seconds to timedelta object."""
 
-        return timedelta(seconds=num)
+        return _seconds_to_delta(num)
+
+    # ------------------------------------------------------------------------
+    def _array_num(self, num):
+        """Convert seconds to microseconds for vectorized calculations."""
+
+        return _seconds_to_micros(num)
+
+    # ------------------------------------------------------------------------
+    def _array_num_to_num(self, value):
+        """Convert microseconds back to seconds."""
+
+        return _micros_to_seconds(value)
+
+    # ------------------------------------------------------------------------
+    def _item_array_to_nums(self, values):
+        """Convert time objects to microseconds since midnight.
+
+        timedelta64 values are treated as offsets from midnight and the time
+        of day is used for datetime64 values.
+        """
+
+        numpy = import_numpy()
+
+        if values.dtype.kind == 'M':
+            values = values - values.astype('M8[D]')
+
+        if values.dtype.kind == 'm':
+            return values.astype('m8[us]').astype(numpy.int64)
+
+        return super(TimeRange, self)._item_array_to_nums(values)
+
+    # ------------------------------------------------------------------------
+    def _wrap_num(self, num):
+        """Move times of day before the progression past midnight.
+
+        A progression wrapping past midnight holds the times after midnight
+        as seconds beyond one day. Times of day below the start of such a
+        progression are looked up one day later.
+        """
+
+        day = self._period
+        (lo, hi) = sorted((self._start, self._stop))
+
+        if hi >= day and 0 <= num < min(lo, day):
+            return num + day
+
+        return num
+
+    # ------------------------------------------------------------------------
+    def _wrap_num_array(self, nums):
+        """Vectorized _wrap_num() for an array of microseconds."""
+
+        numpy = import_numpy()
+
+        day = self._array_num(self._period)
+        (lo, hi) = sorted((self._start, self._stop))
+
+        if self._array_num(hi) < day:
+            return nums
+
+        lo = min(self._array_num(lo), day)
+        return numpy.where((nums >= 0) & (nums < lo), nums + day, nums)
+
+    # ------------------------------------------------------------------------
+    def to_pandas(self):
+        """Returns a pandas TimedeltaIndex of offsets from midnight.
+
+        Steps of whole microseconds that do not cross midnight map onto
+        pandas.timedelta_range(). Other progressions are computed as
+        vectorized microsecond offsets. Requires pandas.
+        """
+
+        numpy = import_numpy()
+        pandas = import_pandas()
+
+        length = self.length
+        day = 86400
+
+        step = _exact_micros(self._step)
+        last = self._num_at(length - 1) if length else self._start
+
+        if step is not None and 0 <= min(self._start, last) and \
+           max(self._start, last) < day:
+            return pandas.timedelta_range(
+                start=_seconds_to_delta(self._start), periods=length,
+                freq=pandas.Timedelta(microseconds=step))
+
+        micros = _micros_array(self._start, self._step, numpy.arange(length))
+        return pandas.to_timedelta(micros % (day * 10 ** 6), unit='us')
+
+    # ------------------------------------------------------------------------
+    def _num_array(self, indices):
+        """Convert indices to an int64 array of microseconds."""
+
+        return _micros_array(self._start, self._step, indices)
+
+    # ------------------------------------------------------------------------
+    def _num_array_to_items(self, nums):
+        """Convert microseconds to an object array of time objects."""
+
+        numpy = import_numpy()
+
+        return numpy.array(
+            [self._num_to_item(_micros_to_seconds(n)) for n in nums.tolist()],
+            dtype=object,
+        )
+
+# ----------------------------------------------------------------------------
+def __getattr__(name):
+    """Provide the lazily computed EPOCH as a module attribute (PEP 562)."""
+
+    if name == 'EPOCH':
+        return _epoch()
+
+    raise AttributeError(
+        "module {m!r} has no attribute {n!r}".format(m=__name__, n=name))
+
+# ----------------------------------------------------------------------------
+def _datetime_array_to_micros(values):
+    """Converts datetime64 values to microseconds since the epoch."""
+
+    numpy = import_numpy()
+
+    values = values.astype('M8[us]')
+    return (values - numpy.datetime64(_epoch(), 'us')).astype(numpy.int64)
 
 # ----------------------------------------------------------------------------
 def _delta_to_seconds(delta):
-    """Converts timedelta object to seconds."""
+    """Converts timedelta object to seconds.
+
+    Whole seconds are returned as an int, anything else as an exact Fraction.
+    """
+
+    microseconds = (delta.days * 86400 + delta.seconds) * 10 ** 6 + \
+        delta.microseconds
+
+    if microseconds % 10 ** 6 == 0:
+        return microseconds // 10 ** 6
+
+    return Fraction(microseconds, 10 ** 6)
+
+# ----------------------------------------------------------------------------
+def _epoch():
+    """Returns the epoch relative to local time, computing it once."""
+
+    global _EPOCH
+
+    if _EPOCH is None:
+        _EPOCH = datetime.fromtimestamp(mktime(localtime(0)))
+
+    return _EPOCH
+
+# ----------------------------------------------------------------------------
+def _exact_micros(num):
+    """Converts seconds to an int number of microseconds, or None if inexact."""
+
+    micros = Fraction(num) * 10 ** 6
+
+    if micros.denominator != 1:
+        return None
 
-    # using this instead of delta.total_seconds() to support python 2.6
-    return int(delta.total_seconds())
+    return int(micros)
+
+# ----------------------------------------------------------------------------
+def _micros_array(start, step, indices):
+    """Returns microseconds at the supplied indices as an int64 array.
+
+    Values are computed exactly and rounded half to even, matching the
+    scalar conversion in _split_seconds(). The whole and fractional
+    microseconds are accumulated separately so that int64 arithmetic can be
+    used even for steps with large denominators.
+    """
+
+    numpy = import_numpy()
+
+    start = Fraction(start) * 10 ** 6
+    step = Fraction(step) * 10 ** 6
+
+    denom = start.denominator * step.denominator // \
+        gcd(start.denominator, step.denominator)
+    (first, first_rem) = divmod(start.numerator * (denom // start.denominator),
+                                denom)
+    (incr, incr_rem) = divmod(step.numerator * (denom // step.denominator),
+                              denom)
+
+    count = int(indices.max()) + 1 if len(indices) else 0
+
+    if abs(first) + (abs(incr) + 1) * count < 2 ** 63 and \
+       denom * (count + 1) < 2 ** 63:
+        indices = indices.astype(numpy.int64)
+    else:
+        indices = indices.astype(object)
+
+    # 0 <= rems < denom * (count + 1)
+    rems = first_rem + indices * incr_rem
+    (carry, rem) = (rems // denom, rems % denom)
+    quot = first + indices * incr + carry
+
+    up = (2 * rem > denom) | ((2 * rem == denom) & (quot % 2 == 1))
+
+    return (quot + up).astype(numpy.int64)
+
+# ----------------------------------------------------------------------------
+def _micros_to_datetime64(micros):
+    """Converts microseconds since the epoch to a datetime64[us] array."""
+
+    numpy = import_numpy()
+    return micros.astype('m8[us]') + numpy.datetime64(_epoch(), 'us')
+
+# ----------------------------------------------------------------------------
+def _micros_to_seconds(micros):
+    """Converts an int number of microseconds to int or Fraction seconds."""
+
+    (seconds, rem) = divmod(micros, 10 ** 6)
+
+    if not rem:
+        return seconds
+
+    return Fraction(micros, 10 ** 6)
+
+# ----------------------------------------------------------------------------
+def _seconds_to_micros(num):
+    """Converts seconds to an int number of microseconds."""
+
+    if isinstance(num, integer_types):
+        return num * 10 ** 6
+
+    return int(Fraction(num) * 10 ** 6)
+
+# ----------------------------------------------------------------------------
+def _seconds_to_delta(num):
+    """Converts seconds to a timedelta object."""
+
+    (seconds, microseconds) = _split_seconds(num)
+    return timedelta(seconds=seconds, microseconds=microseconds)
+
+# ----------------------------------------------------------------------------
+def _split_seconds(num):
+    """Splits seconds into whole seconds and microseconds.
+
+    Fractional values are rounded to the nearest microsecond.
+    """
+
+    if isinstance(num, integer_types):
+        return (num, 0)
+
+    return divmod(int(round(Fraction(num) * 10 ** 6)), 10 ** 6)
+
+# ----------------------------------------------------------------------------
+def _wall_clock_key(rng):
+    """Returns the _key() of a date/datetime progression without the epoch.
+
+    Numeric values count seconds from the local time epoch, which depends
+    on the timezone. The first value is given instead as the ISO format of
+    its whole second wall clock time plus the exact fractional second, and
+    the step as exact microseconds.
+    """
+
+    (length, start, step) = rng._key()
+
+    if start is not None:
+        (seconds, fraction) = divmod(Fraction(start), 1)
+        start = (
+            (_epoch() + timedelta(seconds=int(seconds))).isoformat(),
+            fraction,
+        )
+
+    if step is not None:
+        step = Fraction(step) * 10 ** 6
+
+    return (length, start, step)
+
+# ----------------------------------------------------------------------------
 
+# module level __getattr__ requires python 3.7
+if sys.version_info < (3, 7):
+    EPOCH = _epoch()
@@ -0,0 +1,170 @@
+
+"""Parse and format frame range specs such as "1-100x2,150,200-250"."""
+
+# ----------------------------------------------------------------------------
+
+import re
+
+from six import integer_types
+
+from ._util import floor_div
+from .rng import Range
+
+# ----------------------------------------------------------------------------
+
+__all__ = [
+    'format_frame_spec',
+    'parse_frame_spec',
+]
+
+# a single frame "N", a range "A-B", or a stepped range "A-BxS"
+_TOKEN = re.compile(r'^(-?\d+)(?:-(-?\d+)(?:x(\d+))?)?$')
+
+# ----------------------------------------------------------------------------
+def parse_frame_spec(spec):
+    """Returns a list of integer Range objects, one per comma separated token.
+
+    Tokens are a single frame ("150"), an inclusive range ("1-100"), or a
+    stepped range ("1-100x2"). Ranges whose first frame is larger than the
+    last frame count down and the step is always written as a positive
+    number ("10-1x3" is 10, 7, 4, 1). Frames are never enumerated, so the
+    cost depends on the number of tokens only.
+
+    Raises:
+        ValueError: if a token is malformed or has a step of 0.
+    """
+
+    if not spec.strip():
+        return []
+
+    ranges = []
+    for token in spec.split(','):
+        match = _TOKEN.match(token.strip())
+        if not match:
+            raise ValueError(
+                "Invalid frame spec token: {t!r}".format(t=token))
+
+        (first, last, step) = match.groups()
+        first = int(first)
+
+        if last is None:
+            ranges.append(Range(first, first))
+            continue
+
+        last = int(last)
+        step = int(step) if step is not None else 1
+
+        if step == 0:
+            raise ValueError(
+                "Step cannot be 0 in frame spec token: {t!r}".format(t=token))
+
+        if last < first:
+            step = -step
+
+        # end on the last frame actually reached by the step
+        last = first + floor_div(last - first, step) * step
+        ranges.append(Range(first, last, step))
+
+    return ranges
+
+# ----------------------------------------------------------------------------
+def format_frame_spec(frames):
+    """Returns a compact spec string for a collection of frames.
+
+    The collection may hold integer progressions and individual int frames.
+    The spec lists the frames in the order supplied, so parsing it with
+    parse_frame_spec() yields the same frames. Adjacent ranges and frames
+    that continue the same progression are merged into one token, and each
+    token is written in its shortest form. Only the progressions' ends and
+    steps are inspected, never their individual frames.
+
+    Raises:
+        ValueError: if a progression has non-integer frames.
+    """
+
+    runs = []
+    for piece in frames:
+        (first, step, count) = _piece_run(piece)
+
+        if count == 2:
+            # a pair merges like two single frames, which keeps the output
+            # stable when it is parsed and formatted again
+            _extend_runs(runs, first, None, 1)
+            _extend_runs(runs, first + step, None, 1)
+        elif count:
+            _extend_runs(runs, first, step, count)
+
+    return ",".join([_format_run(*run) for run in runs])
+
+# ----------------------------------------------------------------------------
+def _extend_runs(runs, first, step, count):
+    """Append a run of frames, merging it into the previous run if possible.
+
+    Runs are [first, step, count] lists. Single frame runs have no step.
+    """
+
+    if runs:
+        (r_first, r_step, r_count) = runs[-1]
+
+        if r_count == 1:
+            gap = first - r_first
+            if gap != 0 and (count == 1 or step == gap):
+                runs[-1] = [r_first, gap, count + 1]
+                return
+
+        else:
+            r_last = r_first + (r_count - 1) * r_step
+
+            if first == r_last + r_step and (count == 1 or step == r_step):
+                runs[-1][2] += count
+                return
+
+            # a pair costs as much as two single frames, so hand its second
+            # frame to the new run if that lets the new run grow
+            gap = first - r_last
+            if r_count == 2 and gap != 0 and (count == 1 or step == gap):
+                runs[-1] = [r_first, None, 1]
+                runs.append([r_last, gap, count + 1])
+                return
+
+    runs.append([first, step if count > 1 else None, count])
+
+# ----------------------------------------------------------------------------
+def _format_run(first, step, count):
+    """Returns the shortest token for a run of frames."""
+
+    if count == 1:
+        return str(first)
+
+    last = first + (count - 1) * step
+
+    token = "{f}-{l}".format(f=first, l=last)
+    if abs(step) != 1:
+        token += "x{s}".format(s=abs(step))
+
+    if count == 2:
+        pair = "{f},{l}".format(f=first, l=last)
+        if len(pair) < len(token):
+            return pair
+
+    return token
+
+# ----------------------------------------------------------------------------
+def _piece_run(piece):
+    """Returns (first, step, count) for an int frame or a progression."""
+
+    if isinstance(piece, integer_types):
+        return (piece, None, 1)
+
+    count = piece.length
+    if not count:
+        return (None, None, 0)
+
+    (first, step) = (piece.start, piece.step)
+
+    if not isinstance(first, integer_types) or \
+       not isinstance(step, integer_types):
+        raise ValueError(
+            "Frame specs require integer frames, got {p!r}".format(p=piece))
+
+    return (first, step, count)
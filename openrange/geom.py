@@ -0,0 +1,364 @@
+
+"""Geometric (multiplicative) progressions."""
+
+# ----------------------------------------------------------------------------
+
+from fractions import Fraction
+import math
+
+from six import integer_types
+
+from ._compat import import_numpy
+from ._util import floor_array, rounding_tol
+from .base import BaseRange
+
+# ----------------------------------------------------------------------------
+
+__all__ = [
+    'GeometricRange',
+]
+
+# ----------------------------------------------------------------------------
+class GeometricRange(BaseRange):
+    """Inclusive geometric progression: start, start * ratio, ...
+
+    If start, stop, and ratio are all ints or Fractions, the progression is
+    evaluated with exact rational arithmetic and integral items are returned
+    as ints. Otherwise items are floats and inclusion tests allow a relative
+    tolerance of rel_tol.
+    """
+
+    # ------------------------------------------------------------------------
+    def __init__(self, start, stop, ratio, rel_tol=1e-9):
+        """Constructor. Start, stop, and ratio are required.
+
+        Raises:
+            ValueError: if start is 0
+            ValueError: if ratio is not positive or is 1
+        """
+
+        self._exact = all(
+            isinstance(arg, integer_types + (Fraction,))
+            for arg in (start, stop, ratio)
+        )
+        self._rel_tol = rel_tol
+
+        super(GeometricRange, self).__init__(start, stop, ratio)
+
+        if self._start == 0:
+            raise ValueError("Start cannot be 0.")
+
+        if self._step < 0 or self._step == 1:
+            raise ValueError("Ratio must be positive and cannot be 1.")
+
+    # ------------------------------------------------------------------------
+    @classmethod
+    def by_count(cls, start, stop, num):
+        """Not supported: geometric progressions are not evenly spaced.
+
+        Raises:
+            TypeError: always.
+        """
+
+        raise TypeError(
+            "{c} does not support by_count()".format(c=cls.__name__))
+
+    # ------------------------------------------------------------------------
+    def mean(self):
+        """Returns the arithmetic mean of the items in O(1).
+
+        Raises:
+            ValueError: if the progression is empty.
+        """
+
+        length = self._nonempty_length()
+        return self._num_to_item(self._series_sum(length) / length)
+
+    # ------------------------------------------------------------------------
+    def reverse(self):
+        """Reverses the range in place.
+
+        The reversed progression starts from the last item rather than from
+        stop, which need not be an item, so it holds the same items.
+
+        Raises:
+            TypeError: if the progression is frozen.
+        """
+
+        self._check_mutable()
+
+        length = self.length
+        last = self._num_at(length - 1) if length else self._stop
+
+        (self._start, self._stop) = (last, self._start)
+        self._step = 1 / self._step
+
+    # ------------------------------------------------------------------------
+    def scale(self, k, origin=None):
+        """Returns a new progression with the items scaled by k, in O(1).
+
+        Only scaling about 0 preserves the ratio, so the origin defaults to
+        0 rather than the start of the progression.
+
+        Raises:
+            ValueError: if k is 0 or origin is not 0.
+        """
+
+        if k == 0:
+            raise ValueError("Scale factor cannot be 0.")
+
+        if origin is not None and self._item_to_num(origin) != 0:
+            raise ValueError(
+                "{c} can only be scaled about 0.".format(
+                    c=self.__class__.__name__))
+
+        new_range = self._from_nums(
+            self._start * k, self._stop * k, self._step)
+        new_range._exact = self._exact and \
+            isinstance(k, integer_types + (Fraction,))
+
+        return new_range
+
+    # ------------------------------------------------------------------------
+    def sum(self):
+        """Returns the sum of the items in O(1).
+
+        The sum is computed from the geometric series formula, exactly for
+        exact progressions. The sum of an empty progression is 0.
+        """
+
+        length = self.length
+
+        if not length:
+            return 0
+
+        return self._num_to_item(self._series_sum(length))
+
+    # ------------------------------------------------------------------------
+    @property
+    def length(self):
+        """The number of items in the progression."""
+
+        ratio = self._step
+        quot = self._stop / self._start
+
+        if quot <= 0 or not self._within(1, quot):
+            return 0
+
+        count = int(math.floor(_log(quot) / _log(ratio)))
+
+        # correct for any rounding in the logarithm estimate
+        while self._within(ratio ** (count + 1), quot):
+            count += 1
+        while count > 0 and not self._within(ratio ** count, quot):
+            count -= 1
+
+        return count + 1
+
+    # ------------------------------------------------------------------------
+    @property
+    def ratio(self):
+        """The ratio between consecutive items."""
+        return self._num_to_step(self._step)
+
+    # ------------------------------------------------------------------------
+    def _ascending(self):
+        """True if items increase along the progression."""
+
+        return (self._start > 0) == (self._step > 1)
+
+    # ------------------------------------------------------------------------
+    def _index_ceil(self, num):
+        """Returns the ceiling of the fractional index of num."""
+
+        index = self._index_floor(num)
+        quot = num / self._start
+
+        if quot > 0 and self._matches(self._step ** index, quot):
+            return index
+
+        return index + 1
+
+    # ------------------------------------------------------------------------
+    def _index_floor(self, num):
+        """Returns the floor of the fractional index of num."""
+
+        ratio = self._step
+        quot = num / self._start
+
+        # values on the other side of zero lie beyond the end approached by
+        # shrinking ratios, or before the start for growing ratios
+        if quot <= 0:
+            return -1 if ratio > 1 else self.length
+
+        index = int(math.floor(_log(quot) / _log(ratio)))
+
+        while self._within(ratio ** (index + 1), quot):
+            index += 1
+        while not self._within(ratio ** index, quot):
+            index -= 1
+
+        return index
+
+    # ------------------------------------------------------------------------
+    def _index_floor_array(self, nums, negate=False):
+        """Vectorized _index_floor() using logarithms."""
+
+        numpy = import_numpy()
+
+        ratio = float(self._step)
+        quot = nums / float(self._start)
+        outside = quot <= 0
+
+        logs = numpy.log(numpy.where(outside, 1.0, quot))
+        pos = logs / math.log(ratio)
+
+        # the logarithm adds an absolute error to the relative error of quot
+        tol = rounding_tol(1 + numpy.abs(logs), math.log(ratio))
+        index = floor_array(-pos if negate else pos, tol)
+
+        sentinel = -1 if ratio > 1 else self.length
+        return numpy.where(outside, -sentinel if negate else sentinel, index)
+
+    # ------------------------------------------------------------------------
+    def _index_num(self, num):
+        """Returns the index of the supplied numeric value or None."""
+
+        quot = num / self._start
+        if quot <= 0:
+            return None
+
+        index = int(round(_log(quot) / _log(self._step)))
+        if index < 0 or index >= self.length:
+            return None
+
+        return index if self._matches(self._num_at(index), num) else None
+
+    # ------------------------------------------------------------------------
+    def _item_to_num(self, item):
+        """Convert to an exact Fraction or to a float."""
+
+        if self._exact:
+            return Fraction(item)
+
+        return float(item)
+
+    # ------------------------------------------------------------------------
+    def _iter(self):
+        """Reusable iteration method."""
+
+        for index in range(self.length):
+            yield self._num_at(index)
+
+    # ------------------------------------------------------------------------
+    def _num_at(self, index):
+        """Returns the numeric value at the supplied non-negative index."""
+
+        return self._start * self._step ** index
+
+    # ------------------------------------------------------------------------
+    def _matches(self, value, num):
+        """Test two numeric values for equality within the tolerance."""
+
+        if self._exact:
+            return value == num
+
+        return _isclose(value, num, self._rel_tol)
+
+    # ------------------------------------------------------------------------
+    def _num_array(self, indices):
+        """Convert a numpy array of indices to an array of numeric values."""
+
+        numpy = import_numpy()
+
+        if not self._exact:
+            return self._start * numpy.power(self._step, indices.astype(float))
+
+        if len(indices) and self._step.denominator == 1:
+            # integer ratios stay in int64 while the values fit
+            (start, ratio) = (self._start, self._step.numerator)
+            if start.denominator == 1 and \
+               abs(self._num_at(int(indices.max()))) < 2 ** 63:
+                return start.numerator * numpy.power(
+                    ratio, indices.astype(numpy.int64))
+
+        return numpy.array(
+            [self._num_at(i) for i in indices.tolist()], dtype=object)
+
+    # ------------------------------------------------------------------------
+    def _num_array_to_items(self, nums):
+        """Numeric arrays of ints or floats already hold the items."""
+
+        if nums.dtype.kind in 'if':
+            return nums
+
+        return super(GeometricRange, self)._num_array_to_items(nums)
+
+    # ------------------------------------------------------------------------
+    def _num_to_item(self, num):
+        """Convert back to int, Fraction, or float."""
+
+        if not self._exact:
+            return float(num)
+
+        if isinstance(num, Fraction) and num.denominator == 1:
+            return num.numerator
+
+        return num
+
+    # ------------------------------------------------------------------------
+    def _series_sum(self, length):
+        """Returns the sum of the first length numeric values."""
+
+        (start, ratio) = (self._start, self._step)
+
+        if self._exact:
+            (start, ratio) = (Fraction(start), Fraction(ratio))
+
+        return start * (ratio ** length - 1) / (ratio - 1)
+
+    # ------------------------------------------------------------------------
+    def _shifted(self, num):
+        """Not supported: shifted items do not form a geometric progression.
+
+        Raises:
+            TypeError: always, for shift() and the + and - operators.
+        """
+
+        raise TypeError(
+            "{c} does not support shift()".format(c=self.__class__.__name__))
+
+    # ------------------------------------------------------------------------
+    def _step_multiple(self, count):
+        """Returns the numeric ratio spanning count steps."""
+
+        return self._step ** count
+
+    # ------------------------------------------------------------------------
+    def _within(self, value, bound):
+        """Test whether value has not stepped past bound."""
+
+        if self._exact:
+            tol = 0
+        else:
+            tol = self._rel_tol * abs(bound)
+
+        if self._step > 1:
+            return value <= bound + tol
+        else:
+            return value >= bound - tol
+
+# ----------------------------------------------------------------------------
+def _isclose(a, b, rel_tol):
+    """Relative tolerance comparison."""
+
+    return abs(a - b) <= rel_tol * max(abs(a), abs(b))
+
+# ----------------------------------------------------------------------------
+def _log(value):
+    """Natural log that also works for huge Fractions."""
+
+    if isinstance(value, Fraction):
+        return math.log(value.numerator) - math.log(value.denominator)
+
+    return math.log(value)
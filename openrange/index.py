@@ -0,0 +1,323 @@
+
+"""Find the progressions that contain a value among many progressions."""
+
+# ----------------------------------------------------------------------------
+
+from ._compat import import_numpy
+from ._util import aligned_array
+from .base import BaseRange
+
+# ----------------------------------------------------------------------------
+
+__all__ = [
+    'RangeIndex',
+]
+
+# values converted with one type's conversion may not be valid for another
+_CONVERSION_ERRORS = (ArithmeticError, AttributeError, TypeError, ValueError)
+
+# ----------------------------------------------------------------------------
+class RangeIndex(object):
+    """Static index of many progressions by their numeric bounds.
+
+    Progressions are grouped by type and conversion settings (e.g. the
+    template of a PathSequenceRange), since each has its own numeric
+    representation. Each group is stored in a centered interval tree over
+    the first and last numeric value of each progression. A query walks
+    the tree in O(log n + candidates). The step alignment check, i.e. the
+    progression's own inclusion test, is only applied to candidates whose
+    bounds contain the value.
+
+    Queries return positions in the sequence of progressions supplied to
+    the constructor. Empty progressions never match.
+    """
+
+    # ------------------------------------------------------------------------
+    def __init__(self, ranges):
+        """Constructor.
+
+        Args:
+            ranges: a sequence of BaseRange objects to index.
+        """
+
+        self._ranges = list(ranges)
+
+        groups = {}
+        for (pos, rng) in enumerate(self._ranges):
+            if rng.length:
+                groups.setdefault(
+                    (type(rng), rng._conversion_key()), []).append(pos)
+
+        self._groups = [
+            _Group(self._ranges, positions) for positions in groups.values()]
+
+    # ------------------------------------------------------------------------
+    def __len__(self):
+        """Returns the number of indexed progressions."""
+
+        return len(self._ranges)
+
+    # ------------------------------------------------------------------------
+    def __repr__(self):
+        """Official string representation of the index."""
+
+        return "{c}(<{n} ranges>)".format(
+            c=self.__class__.__name__, n=len(self._ranges))
+
+    # ------------------------------------------------------------------------
+    def query(self, item):
+        """Returns the sorted positions of the progressions containing item.
+
+        Progressions whose type cannot convert item are skipped.
+        """
+
+        hits = []
+        for group in self._groups:
+            hits.extend(group.query(item))
+
+        return sorted(hits)
+
+    # ------------------------------------------------------------------------
+    def query_array(self, values):
+        """Returns all (value, progression) matches for an array of values.
+
+        The result is a pair of int64 numpy arrays of equal length: the
+        positions of the values and the positions of the progressions that
+        contain them, ordered by value position and then by progression.
+        Candidates are found for all values at once with a binary search of
+        the sorted values, and the step alignment of additive progressions
+        is checked in a single vectorized pass. Requires numpy.
+
+        Args:
+            values: numpy array (e.g. datetime64 for datetime progressions)
+                or any iterable of items.
+        """
+
+        numpy = import_numpy()
+
+        if not isinstance(values, numpy.ndarray):
+            values = numpy.asarray(list(values))
+
+        value_pos = []
+        range_pos = []
+
+        for group in self._groups:
+            (vals, rngs) = group.query_array(values)
+            value_pos.append(vals)
+            range_pos.append(rngs)
+
+        if not value_pos:
+            return (numpy.zeros(0, numpy.int64), numpy.zeros(0, numpy.int64))
+
+        value_pos = numpy.concatenate(value_pos)
+        range_pos = numpy.concatenate(range_pos)
+        order = numpy.lexsort((range_pos, value_pos))
+
+        return (value_pos[order], range_pos[order])
+
+    # ------------------------------------------------------------------------
+    @property
+    def ranges(self):
+        """The indexed progressions."""
+        return self._ranges
+
+# ----------------------------------------------------------------------------
+class _Group(object):
+    """Interval tree over progressions with the same numeric space."""
+
+    # ------------------------------------------------------------------------
+    def __init__(self, ranges, positions):
+
+        self._ranges = ranges
+        self._positions = positions
+        self._proto = ranges[positions[0]]
+
+        intervals = [_bounds(ranges[pos]) + (pos,) for pos in positions]
+        self._root = _Node.build(intervals)
+
+        # vectorized state, see _array_state()
+        self._state = None
+
+    # ------------------------------------------------------------------------
+    def query(self, item):
+        """Returns the positions of the progressions containing item."""
+
+        proto = self._proto
+
+        try:
+            nums = [proto._item_to_num(item)]
+            if proto._period is not None and 0 <= nums[0] < proto._period:
+                # members wrapping past the period hold the value one later
+                nums.append(nums[0] + proto._period)
+            candidates = set()
+            if self._root:
+                for num in nums:
+                    candidates.update(self._root.stab(num))
+        except _CONVERSION_ERRORS:
+            return []
+
+        ranges = self._ranges
+        return [pos for pos in sorted(candidates) if item in ranges[pos]]
+
+    # ------------------------------------------------------------------------
+    def query_array(self, values):
+        """Returns (value positions, progression positions) of all matches."""
+
+        numpy = import_numpy()
+
+        empty = (numpy.zeros(0, numpy.int64), numpy.zeros(0, numpy.int64))
+
+        try:
+            nums = self._proto._item_array_to_nums(values)
+        except _CONVERSION_ERRORS:
+            return empty
+
+        if nums.dtype.kind not in 'iuf' or not len(nums):
+            return empty
+
+        # each value is searched at its own numeric position; values of a
+        # cyclic domain also one period later, see query()
+        source = numpy.arange(len(nums))
+        if self._proto._period is not None:
+            period = self._proto._array_num(self._proto._period)
+            wrap = (nums >= 0) & (nums < period)
+            source = numpy.concatenate([source, source[wrap]])
+            nums = numpy.concatenate([nums, nums[wrap] + period])
+
+        (positions, lo, hi, starts, steps) = self._array_state()
+
+        # all values inside the bounds of each progression
+        order = numpy.argsort(nums, kind='stable')
+        ordered = nums[order]
+        first = numpy.searchsorted(ordered, lo, side='left')
+        counts = numpy.maximum(
+            numpy.searchsorted(ordered, hi, side='right') - first, 0)
+
+        owner = numpy.repeat(numpy.arange(len(positions)), counts)
+        offset = numpy.arange(counts.sum()) - \
+            numpy.repeat(numpy.cumsum(counts) - counts, counts)
+        num_idx = order[numpy.repeat(first, counts) + offset]
+        value_idx = source[num_idx]
+
+        if starts is None:
+            # non-additive progressions (e.g. GeometricRange) test each
+            # candidate individually
+            ranges = self._ranges
+            items = values[value_idx].tolist()
+            keep = numpy.array([
+                item in ranges[pos] for (item, pos) in
+                zip(items, positions[owner].tolist())
+            ], dtype=bool)
+        else:
+            (_, keep) = aligned_array(
+                nums[num_idx], starts[owner], steps[owner])
+
+        return (value_idx[keep].astype(numpy.int64), positions[owner[keep]])
+
+    # ------------------------------------------------------------------------
+    def _array_state(self):
+        """Numeric state of each progression for vectorized queries.
+
+        Returns (positions, lo, hi, starts, steps) numpy arrays in the number
+        space of _array_num(). starts and steps are None for non-additive
+        progressions. Computed on first use and cached.
+        """
+
+        if self._state is not None:
+            return self._state
+
+        numpy = import_numpy()
+
+        rngs = [self._ranges[pos] for pos in self._positions]
+
+        first = numpy.array([rng._array_num(rng._num_at(0)) for rng in rngs])
+        last = numpy.array(
+            [rng._array_num(rng._num_at(rng.length - 1)) for rng in rngs])
+
+        if type(self._proto)._num_at is BaseRange._num_at:
+            starts = first
+            steps = numpy.array([rng._array_num(rng._step) for rng in rngs])
+        else:
+            (starts, steps) = (None, None)
+
+        self._state = (
+            numpy.asarray(self._positions, dtype=numpy.int64),
+            numpy.minimum(first, last),
+            numpy.maximum(first, last),
+            starts,
+            steps,
+        )
+
+        return self._state
+
+# ----------------------------------------------------------------------------
+class _Node(object):
+    """Node of a centered interval tree."""
+
+    __slots__ = ('center', 'by_lo', 'by_hi', 'left', 'right')
+
+    # ------------------------------------------------------------------------
+    @classmethod
+    def build(cls, intervals):
+        """Build a tree from (lo, hi, position) tuples. Returns None if empty."""
+
+        if not intervals:
+            return None
+
+        ends = sorted([iv[0] for iv in intervals] + [iv[1] for iv in intervals])
+        center = ends[len(ends) // 2]
+
+        (left, here, right) = ([], [], [])
+        for interval in intervals:
+            if interval[1] < center:
+                left.append(interval)
+            elif interval[0] > center:
+                right.append(interval)
+            else:
+                here.append(interval)
+
+        node = cls()
+        node.center = center
+        node.by_lo = sorted(here, key=lambda iv: iv[0])
+        node.by_hi = sorted(here, key=lambda iv: iv[1], reverse=True)
+        node.left = cls.build(left)
+        node.right = cls.build(right)
+
+        return node
+
+    # ------------------------------------------------------------------------
+    def stab(self, num):
+        """Returns the positions of all intervals containing num."""
+
+        hits = []
+        node = self
+
+        while node is not None:
+            if num < node.center:
+                for (lo, _, pos) in node.by_lo:
+                    if lo > num:
+                        break
+                    hits.append(pos)
+                node = node.left
+
+            elif num > node.center:
+                for (_, hi, pos) in node.by_hi:
+                    if hi < num:
+                        break
+                    hits.append(pos)
+                node = node.right
+
+            else:
+                hits.extend([pos for (_, _, pos) in node.by_lo])
+                break
+
+        return hits
+
+# ----------------------------------------------------------------------------
+def _bounds(rng):
+    """Returns the (lowest, highest) numeric value of a progression."""
+
+    first = rng._num_at(0)
+    last = rng._num_at(rng.length - 1)
+
+    return (min(first, last), max(first, last))
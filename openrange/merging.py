@@ -0,0 +1,192 @@
+
+"""Merge many progressions into a single sorted stream."""
+
+# ----------------------------------------------------------------------------
+
+import heapq
+
+from ._compat import import_numpy
+
+# ----------------------------------------------------------------------------
+
+__all__ = [
+    'merge',
+    'merge_arrays',
+]
+
+# default number of values taken from each progression per vectorized pass
+CHUNK_SIZE = 2 ** 16
+
+# ----------------------------------------------------------------------------
+def merge(*ranges, **kwargs):
+    """Generates the items of all progressions in ascending order.
+
+    The progressions are merged lazily with a heap keyed on their numeric
+    values, so only one pending value per progression is kept in memory and
+    descending progressions are walked from their last item. Items with
+    equal numeric values are yielded once unless dedup is False, in which
+    case they are yielded in the order of the supplied progressions. Dropped
+    duplicates are never converted to items.
+
+    Args:
+        ranges: progressions of a single BaseRange type and conversion
+            setting, e.g. paths of the same template.
+        dedup: drop items whose numeric value was just yielded (default
+            True).
+
+    Raises:
+        TypeError: if the progressions are of different types or
+            conversion settings.
+    """
+
+    dedup = _dedup_arg('merge', kwargs)
+    _check_types(ranges)
+
+    heap = []
+    for (pos, rng) in enumerate(ranges):
+        nums = _ascending_nums(rng)
+        for num in nums:
+            heap.append((num, pos, nums))
+            break
+
+    heapq.heapify(heap)
+
+    emitted = False
+    last = None
+
+    while heap:
+        (num, pos, nums) = heap[0]
+
+        if not (dedup and emitted and num == last):
+            yield ranges[pos]._num_to_item(num)
+            (emitted, last) = (True, num)
+
+        for num in nums:
+            # replacing the top is cheaper than a pop followed by a push
+            heapq.heapreplace(heap, (num, pos, nums))
+            break
+        else:
+            heapq.heappop(heap)
+
+# ----------------------------------------------------------------------------
+def merge_arrays(*ranges, **kwargs):
+    """Generates numpy arrays of the items of all progressions in order.
+
+    Vectorized counterpart of merge(): the concatenated arrays hold the same
+    items. Each pass takes the next chunk_size numeric values of every
+    progression with a vectorized evaluation. All values up to the smallest
+    last value of the chunks cannot be preceded by a later value, so they
+    are sorted, deduplicated, and converted to items at once. Memory is
+    O(k * chunk_size) for k progressions. Requires numpy.
+
+    Args:
+        ranges: progressions of a single BaseRange type and conversion
+            setting, e.g. paths of the same template.
+        dedup: drop items with equal numeric values (default True).
+        chunk_size: the maximum number of items per yielded array.
+
+    Raises:
+        TypeError: if the progressions are of different types or
+            conversion settings.
+    """
+
+    chunk_size = kwargs.pop('chunk_size', CHUNK_SIZE)
+    dedup = _dedup_arg('merge_arrays', kwargs)
+    _check_types(ranges)
+
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be >= 1.")
+
+    numpy = import_numpy()
+
+    # number of values already consumed from each progression
+    cursors = [0] * len(ranges)
+    lengths = [rng.length for rng in ranges]
+
+    while any(cursor < length for (cursor, length) in zip(cursors, lengths)):
+
+        windows = []
+        threshold = None
+
+        for (pos, rng) in enumerate(ranges):
+            count = min(chunk_size, lengths[pos] - cursors[pos])
+            if count <= 0:
+                continue
+
+            nums = _ascending_num_array(rng, cursors[pos], count, numpy)
+            windows.append((pos, nums))
+
+            # a progression with values left after this window bounds the
+            # values that are final after this pass
+            if cursors[pos] + count < lengths[pos] and \
+               (threshold is None or nums[-1] < threshold):
+                threshold = nums[-1]
+
+        parts = []
+        for (pos, nums) in windows:
+            if threshold is None:
+                take = len(nums)
+            else:
+                take = int(numpy.searchsorted(nums, threshold, side='right'))
+            cursors[pos] += take
+            parts.append(nums[:take])
+
+        nums = numpy.concatenate(parts)
+        nums = nums[numpy.argsort(nums, kind='stable')]
+
+        if dedup and len(nums) > 1:
+            keep = numpy.ones(len(nums), dtype=bool)
+            keep[1:] = nums[1:] != nums[:-1]
+            nums = nums[keep]
+
+        items = ranges[0]._num_array_to_items(nums)
+        for start in range(0, len(items), chunk_size):
+            yield items[start:start + chunk_size]
+
+# ----------------------------------------------------------------------------
+def _ascending_num_array(rng, offset, count, numpy):
+    """The count numeric values of rng in ascending order after offset."""
+
+    indices = numpy.arange(offset, offset + count)
+
+    if not rng._ascending():
+        indices = rng.length - 1 - indices
+
+    return rng._num_array(indices)
+
+# ----------------------------------------------------------------------------
+def _ascending_nums(rng):
+    """Returns an iterator of the numeric values of rng in ascending order."""
+
+    if rng._ascending():
+        return rng._iter()
+
+    return (rng._num_at(i) for i in range(rng.length - 1, -1, -1))
+
+# ----------------------------------------------------------------------------
+def _check_types(ranges):
+    """Numeric values are only comparable within a single numeric space."""
+
+    types = set(type(rng) for rng in ranges)
+    if len(types) > 1:
+        raise TypeError(
+            "Cannot merge progressions of different types: {t}".format(
+                t=", ".join(sorted(t.__name__ for t in types))))
+
+    if len(set(rng._conversion_key() for rng in ranges)) > 1:
+        raise TypeError(
+            "Cannot merge {c} progressions with different conversion "
+            "settings".format(c=type(ranges[0]).__name__))
+
+# ----------------------------------------------------------------------------
+def _dedup_arg(name, kwargs):
+    """Pop the dedup keyword argument and reject any others."""
+
+    dedup = kwargs.pop('dedup', True)
+
+    if kwargs:
+        raise TypeError(
+            "{n}() got an unexpected keyword argument '{a}'".format(
+                n=name, a=sorted(kwargs)[0]))
+
+    return dedup
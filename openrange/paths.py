@@ -0,0 +1,320 @@
+
+"""Frame file path sequences, e.g. shot_010.%04d.exr."""
+
+# ----------------------------------------------------------------------------
+
+import itertools
+import re
+
+from six import integer_types, string_types
+
+from ._compat import import_numpy
+from .base import BaseRange
+
+# ----------------------------------------------------------------------------
+
+__all__ = [
+    'PathSequenceRange',
+]
+
+# printf style (%d, %04d) or hash style (####) frame placeholders
+_PLACEHOLDER = re.compile(r'%(0\d+)?d|#+')
+
+# negative frame numbers in a path
+_NEGATIVE_FRAME = re.compile(r'-\d+\Z')
+
+# ----------------------------------------------------------------------------
+class PathSequenceRange(BaseRange):
+    """Progression of file paths, one per integer frame number.
+
+    The template holds a single frame placeholder: printf style, e.g.
+    shot_010.%04d.exr, or hash style with one # per digit, e.g.
+    shot_010.####.exr. Frames are zero padded to the placeholder width and
+    negative frames are formatted like printf, e.g. -005.
+
+    start and stop may be given as frame numbers or as paths, and paths are
+    parsed back to frame numbers in O(1), so inclusion tests and index()
+    accept existing file names. Iteration builds the paths in blocks of
+    up to 100 frames that share everything but their last two digits, so
+    each path costs a single string concatenation.
+    """
+
+    # ------------------------------------------------------------------------
+    def __init__(self, template, *args):
+        """Constructor.
+
+        Args:
+            template: the path template with a single frame placeholder.
+            args: start, stop, and step as for BaseRange, as frame numbers
+                or paths. The step is an int.
+
+        Raises:
+            ValueError: if the template does not hold exactly one
+                placeholder.
+        """
+
+        placeholders = list(_PLACEHOLDER.finditer(template))
+
+        if len(placeholders) != 1:
+            raise ValueError(
+                "Template must hold exactly one frame placeholder: "
+                "'{t}'".format(t=template))
+
+        match = placeholders[0]
+        if match.group().startswith('#'):
+            width = len(match.group())
+        else:
+            width = int(match.group(1) or 0)
+
+        self._template = template
+        self._prefix = template[:match.start()]
+        self._suffix = template[match.end():]
+        self._width = width
+
+        super(PathSequenceRange, self).__init__(*args)
+
+    # ------------------------------------------------------------------------
+    def __contains__(self, item):
+        """Test for inclusion of a path or frame number.
+
+        Paths that do not match the template are not included.
+        """
+
+        try:
+            num = self._item_to_num(item)
+        except (TypeError, ValueError):
+            return False
+
+        return self._index_num(num) is not None
+
+    # ------------------------------------------------------------------------
+    def __iter__(self):
+        """Generates all paths in the progression."""
+
+        return self.iter_paths()
+
+    # ------------------------------------------------------------------------
+    def __repr__(self):
+        """Official string representation of the progression."""
+
+        return "{c}({t!r}, {a}, {o}, {s})".format(
+            c=self.__class__.__name__,
+            t=self._template,
+            a=self._start,
+            o=self._stop,
+            s=self._step,
+        )
+
+    # ------------------------------------------------------------------------
+    @classmethod
+    def by_count(cls, start, stop, num):
+        """Not supported: evenly spaced frames are generally fractional.
+
+        Raises:
+            TypeError: always.
+        """
+
+        raise TypeError(
+            "{c} does not support by_count()".format(c=cls.__name__))
+
+    # ------------------------------------------------------------------------
+    def frame(self, path):
+        """Returns the frame number of a path matching the template.
+
+        Raises:
+            ValueError: if the path does not match the template.
+        """
+
+        return self._item_to_num(path)
+
+    # ------------------------------------------------------------------------
+    def iter_paths(self):
+        """Generates all paths in the progression, built in blocks.
+
+        Equivalent to iter(self). Frames that share all but their last two
+        digits are formatted together: the shared head is formatted once
+        and joined with precomputed two digit tails, so no format string is
+        parsed per path.
+        """
+
+        return itertools.chain.from_iterable(self._path_blocks())
+
+    # ------------------------------------------------------------------------
+    def scale(self, k, origin=None):
+        """Returns a new progression with the frames scaled by k, in O(1).
+
+        See BaseRange.scale(). The scaled frames must be whole numbers,
+        e.g. scale(2) retimes a sequence to twice the frame rate.
+
+        Raises:
+            TypeError: if any scaled frame or the step is fractional.
+            ValueError: if k is 0.
+        """
+
+        new_range = super(PathSequenceRange, self).scale(k, origin=origin)
+
+        if new_range._rational:
+            raise TypeError(
+                "{c} frames must be whole numbers, cannot scale by "
+                "{k}".format(c=self.__class__.__name__, k=k))
+
+        return new_range
+
+    # ------------------------------------------------------------------------
+    def sum(self):
+        """Not supported: paths cannot be added together.
+
+        Raises:
+            TypeError: always.
+        """
+
+        raise TypeError(
+            "{c} does not support sum()".format(c=self.__class__.__name__))
+
+    # ------------------------------------------------------------------------
+    @property
+    def padding(self):
+        """The number of digits frames are zero padded to."""
+        return self._width
+
+    # ------------------------------------------------------------------------
+    @property
+    def template(self):
+        """The path template."""
+        return self._template
+
+    # ------------------------------------------------------------------------
+    def _format_frame(self, frame):
+        """Returns the path of a single frame number."""
+
+        return self._prefix + str(frame).zfill(self._width) + self._suffix
+
+    # ------------------------------------------------------------------------
+    def _item_to_num(self, item):
+        """Convert a path or frame number to a frame number.
+
+        Raises:
+            TypeError: if item is neither a path nor an int.
+            ValueError: if the path does not match the template.
+        """
+
+        if isinstance(item, integer_types):
+            return item
+
+        if not isinstance(item, string_types):
+            raise TypeError(
+                "Invalid path type: {t}".format(t=type(item).__name__))
+
+        (prefix, suffix) = (self._prefix, self._suffix)
+
+        if len(item) >= len(prefix) + len(suffix) and \
+           item.startswith(prefix) and item.endswith(suffix):
+
+            frame = item[len(prefix):len(item) - len(suffix)]
+
+            if frame.isdigit():
+                # zero padded to exactly the width, or longer without padding
+                if len(frame) == max(self._width, 1) or \
+                   (len(frame) > self._width and frame[0] != '0'):
+                    return int(frame)
+
+            elif _NEGATIVE_FRAME.match(frame):
+                num = int(frame)
+                if self._format_frame(num) == item:
+                    return num
+
+        raise ValueError(
+            "Path '{p}' does not match template '{t}'".format(
+                p=item, t=self._template))
+
+    # ------------------------------------------------------------------------
+    def _key(self):
+        """Canonical state: the numeric key and the template parts."""
+
+        return super(PathSequenceRange, self)._key() + \
+            (self._prefix, self._width, self._suffix)
+
+    # ------------------------------------------------------------------------
+    def _num_array_to_items(self, nums):
+        """Convert frame numbers to an array of paths."""
+
+        numpy = import_numpy()
+        return numpy.array([self._format_frame(n) for n in nums.tolist()])
+
+    # ------------------------------------------------------------------------
+    def _num_to_item(self, num):
+        """Convert a frame number to a path.
+
+        Raises:
+            ValueError: if num is not a whole frame number, e.g. the mean
+                of an even number of consecutive frames.
+        """
+
+        if not isinstance(num, integer_types):
+            raise ValueError(
+                "Frame {n} is not a whole number".format(n=num))
+
+        return self._format_frame(num)
+
+    # ------------------------------------------------------------------------
+    def _num_to_step(self, num):
+        """Steps are frame counts."""
+
+        return num
+
+    # ------------------------------------------------------------------------
+    def _path_blocks(self):
+        """Generates lists of consecutive paths.
+
+        Non-negative frames are grouped by frame // 100. A group's head,
+        the prefix and the leading digits, is formatted once, and its paths
+        select a strided slice of the 100 precomputed tails: the last two
+        digits followed by the suffix.
+        """
+
+        length = self.length
+        if not length:
+            return
+
+        (frame, step, width) = (self._start, self._step, self._width)
+        tails = ["{d:02d}{s}".format(d=d, s=self._suffix) for d in range(100)]
+        fmt = self._format_frame
+
+        while length > 0:
+            (block, rem) = divmod(frame, 100)
+
+            if frame < 0 or abs(step) >= 100 or (block == 0 and width < 2):
+                # no shared head, format a single path
+                yield [fmt(frame)]
+                (frame, length) = (frame + step, length - 1)
+                continue
+
+            if block:
+                head = self._prefix + str(block).zfill(width - 2)
+            else:
+                head = self._prefix + '0' * (width - 2)
+
+            if step > 0:
+                count = min(length, (99 - rem) // step + 1)
+                selected = tails[rem:rem + (count - 1) * step + 1:step]
+            else:
+                count = min(length, rem // -step + 1)
+                selected = tails[rem::step][:count]
+
+            yield [head + tail for tail in selected]
+            (frame, length) = (frame + count * step, length - count)
+
+    # ------------------------------------------------------------------------
+    def _step_to_num(self, step):
+        """Steps are frame counts.
+
+        Raises:
+            TypeError: if step is not an int.
+        """
+
+        if not isinstance(step, integer_types):
+            raise TypeError(
+                "Invalid type for step argument: {t}".format(
+                    t=type(step).__name__))
+
+        return step
@@ -0,0 +1,294 @@
+
+"""Cartesian products of progressions with random access."""
+
+# ----------------------------------------------------------------------------
+
+import itertools
+
+from six import integer_types
+
+from ._compat import import_numpy
+from ._util import seq_length
+
+# ----------------------------------------------------------------------------
+
+try:
+    from collections.abc import Sequence
+except ImportError:
+    # python 2
+    from collections import Sequence
+
+# ----------------------------------------------------------------------------
+
+__all__ = [
+    'ProductRange',
+]
+
+# ----------------------------------------------------------------------------
+class ProductRange(Sequence):
+    """Cartesian product of several progressions.
+
+    Items are tuples with one value per axis, ordered like the output of
+    itertools.product(): the last axis varies fastest. Unlike
+    itertools.product(), the length, indexing, index() and inclusion tests
+    are computed from the axes without enumerating the grid. Axes are
+    typically BaseRange instances, but any sequence will do.
+    """
+
+    # ------------------------------------------------------------------------
+    def __bool__(self):
+        """Returns True if the product has items, even beyond sys.maxsize."""
+
+        return self.length > 0
+
+    # python 2
+    __nonzero__ = __bool__
+
+    # ------------------------------------------------------------------------
+    def __contains__(self, item):
+        """Test for inclusion of the supplied tuple."""
+
+        try:
+            if len(item) != len(self._ranges):
+                return False
+        except TypeError:
+            return False
+
+        for (value, rng) in zip(item, self._ranges):
+            if value not in rng:
+                return False
+
+        return True
+
+    # ------------------------------------------------------------------------
+    def __getitem__(self, index):
+        """Retrieves item(s) from the grid.
+
+        An int index returns the tuple at that position of the flattened
+        grid. A slice returns a list of tuples. A tuple of ints/slices, one
+        per axis, selects along each axis: ints fix the value of an axis and
+        remove it, slices keep the axis with the sliced values.
+        """
+
+        if isinstance(index, tuple):
+            return self._select(index)
+
+        elif isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.length))]
+
+        elif isinstance(index, integer_types):
+            indices = self._unravel(index)
+            return tuple(rng[i] for (rng, i) in zip(self._ranges, indices))
+
+        else:
+            raise TypeError(
+                "Invalid index type: {t}".format(t=str(type(index))))
+
+    # ------------------------------------------------------------------------
+    def __init__(self, *ranges):
+        """Constructor.
+
+        Args:
+            ranges: one or more progressions making up the axes of the grid.
+
+        Raises:
+            TypeError: if no ranges are supplied.
+        """
+
+        if not ranges:
+            raise TypeError(
+                "{c} expected at least 1 range.".format(
+                    c=self.__class__.__name__))
+
+        self._ranges = tuple(ranges)
+        self._shape = tuple(seq_length(rng) for rng in self._ranges)
+
+    # ------------------------------------------------------------------------
+    def __iter__(self):
+        """Generates all tuples in the grid."""
+
+        return itertools.product(*self._ranges)
+
+    # ------------------------------------------------------------------------
+    def __len__(self):
+        """Returns the number of tuples in the grid.
+
+        Raises:
+            OverflowError: if the length exceeds sys.maxsize. Use the length
+                property for grids of arbitrary size.
+        """
+
+        return self.length
+
+    # ------------------------------------------------------------------------
+    def __repr__(self):
+        """Official string representation of the grid."""
+
+        return "{c}({r})".format(
+            c=self.__class__.__name__,
+            r=", ".join([repr(rng) for rng in self._ranges]),
+        )
+
+    # ------------------------------------------------------------------------
+    def __str__(self):
+        """Informal string representation of the grid."""
+
+        return self.__repr__()
+
+    # ------------------------------------------------------------------------
+    def index(self, item):
+        """Returns the flat index of the supplied tuple."""
+
+        if len(item) != len(self._ranges):
+            raise ValueError(
+                "{i} is not in {c}".format(i=item, c=self.__class__.__name__))
+
+        indices = [rng.index(value) for (value, rng) in zip(item, self._ranges)]
+        return self._ravel(indices)
+
+    # ------------------------------------------------------------------------
+    def count(self, item):
+        """Returns the number of times item appears in the grid."""
+
+        if self.__contains__(item):
+            return 1
+        else:
+            return 0
+
+    # ------------------------------------------------------------------------
+    def chunks(self, size):
+        """Generates column arrays for consecutive blocks of the grid.
+
+        Each block is a tuple of numpy arrays, as returned by to_arrays(),
+        holding at most size rows. Requires numpy.
+        """
+
+        if size < 1:
+            raise ValueError("Chunk size must be >= 1.")
+
+        total = self.length
+        for start in range(0, total, size):
+            yield self.to_arrays(start, min(start + size, total))
+
+    # ------------------------------------------------------------------------
+    def to_arrays(self, start=0, stop=None):
+        """Returns one numpy array per axis for a block of the flat grid.
+
+        Row n of the returned columns is the tuple at flat index start + n.
+        The flat indices are decomposed into axis indices in one vectorized
+        pass, and only the values at those indices are exported from each
+        axis, so the cost depends on the size of the block rather than the
+        axes. Grids beyond the int64 range use object arrays of python ints.
+        Requires numpy.
+        """
+
+        numpy = import_numpy()
+
+        total = self.length
+        (start, stop, _) = slice(start, stop).indices(total)
+        count = max(0, stop - start)
+
+        if not count:
+            return tuple(numpy.array([]) for _ in self._ranges)
+
+        if total < 2 ** 63:
+            flat = numpy.arange(start, stop, dtype=numpy.int64)
+        else:
+            flat = numpy.arange(count).astype(object) + start
+
+        # mixed radix, the last axis varies fastest
+        axes = []
+        for size in reversed(self._shape):
+            axes.append(flat % size)
+            flat = flat // size
+
+        return tuple(
+            _axis_array(rng, axis, numpy)
+            for (rng, axis) in zip(self._ranges, reversed(axes))
+        )
+
+    # ------------------------------------------------------------------------
+    @property
+    def length(self):
+        """The number of tuples in the grid, which may exceed sys.maxsize."""
+
+        total = 1
+        for size in self._shape:
+            total *= size
+
+        return total
+
+    # ------------------------------------------------------------------------
+    @property
+    def ranges(self):
+        """The progressions making up the axes of the grid."""
+        return self._ranges
+
+    # ------------------------------------------------------------------------
+    @property
+    def shape(self):
+        """The length of each axis."""
+        return self._shape
+
+    # ------------------------------------------------------------------------
+    def _ravel(self, indices):
+        """Combine per-axis indices into a flat index."""
+
+        flat = 0
+        for (i, size) in zip(indices, self._shape):
+            flat = flat * size + i
+
+        return flat
+
+    # ------------------------------------------------------------------------
+    def _select(self, key):
+        """Select values along each axis."""
+
+        if len(key) > len(self._ranges):
+            raise IndexError(
+                "Too many indices for {c} with {n} axes.".format(
+                    c=self.__class__.__name__, n=len(self._ranges)))
+
+        key = key + (slice(None),) * (len(self._ranges) - len(key))
+
+        fixed = []
+        axes = []
+        for (rng, k) in zip(self._ranges, key):
+            if isinstance(k, slice):
+                axes.append(rng[k])
+            else:
+                fixed.append(rng[k])
+
+        if not axes:
+            return tuple(fixed)
+
+        return self.__class__(*axes)
+
+    # ------------------------------------------------------------------------
+    def _unravel(self, index):
+        """Decompose a flat index into per-axis indices (mixed radix)."""
+
+        total = self.length
+
+        if index < 0:
+            index += total
+        if index < 0 or index >= total:
+            raise IndexError(
+                "Index '{i}' is out of range.".format(i=index))
+
+        indices = []
+        for size in reversed(self._shape):
+            (index, i) = divmod(index, size)
+            indices.append(i)
+
+        return tuple(reversed(indices))
+
+# ----------------------------------------------------------------------------
+def _axis_array(rng, indices, numpy):
+    """Export the values of an axis at the supplied indices."""
+
+    if hasattr(rng, '_num_array'):
+        # progressions evaluate only the requested values, vectorized
+        return rng._num_array_to_items(rng._num_array(indices))
+
+    return numpy.array([rng[i] for i in indices.tolist()])
@@ -1,18 +1,76 @@
 
 from decimal import Decimal
+from fractions import Fraction
+
+from six import integer_types
+
+from ._compat import import_pandas
 from .base import BaseRange
 
 class Range(BaseRange):
     """Inclusive numerical range."""
 
+    @classmethod
+    def from_pandas(cls, index):
+        """Returns a Range with the same items as a regular pandas index.
+
+        A pandas RangeIndex, including an empty one, is converted in O(1).
+        Requires pandas.
+
+        Raises:
+            ValueError: if any other index is empty or not evenly spaced.
+        """
+
+        pandas = import_pandas()
+
+        if isinstance(index, pandas.RangeIndex):
+            (start, step) = (index.start, index.step)
+            return cls(start, start + (len(index) - 1) * step, step)
+
+        return super(Range, cls).from_pandas(index)
+
+    def to_pandas(self):
+        """Returns a pandas Index containing all items in the range.
+
+        Integer ranges map to a pandas RangeIndex in O(1). Other ranges are
+        exported with to_array(). Requires pandas.
+        """
+
+        pandas = import_pandas()
+
+        (start, step) = (self.start, self.step)
+
+        if isinstance(start, integer_types) and \
+           isinstance(step, integer_types):
+            stop = start + self.length * step
+            if max(abs(start), abs(stop)) < 2 ** 63:
+                return pandas.RangeIndex(start, stop, step)
+
+        return super(Range, self).to_pandas()
+
     def _item_to_num(self, item):
-        """Converts to Decimal. Try to avoid float precision problems."""
+        """Converts to Decimal. Try to avoid float precision problems.
+
+        Ints are kept as ints, which have unlimited precision. Progressions
+        with exact rational steps (see by_count()) use Fractions instead.
+        """
+
+        if isinstance(item, integer_types):
+            return item
+
+        if self._rational:
+            return Fraction(Decimal(repr(item)))
 
         return Decimal(repr(item))
        
     def _num_to_item(self, num):
         """Convert back to int/float."""
 
+        if isinstance(num, Fraction):
+            if num.denominator == 1:
+                return num.numerator
+            return float(num)
+
         # Rely on the fact that attempting to convert a string that represents
         # a floating point value to an int will raise ValueError
         num_str = str(num)
@@ -24,3 +82,13 @@ class Range(BaseRange):
     
         return item
 
+    def _array_num_to_num(self, value):
+        """Ints and floats from numpy are items."""
+
+        return self._item_to_num(value)
+
+    def _num_array_to_items(self, nums):
+        """Numeric arrays already hold the int/float items."""
+
+        return nums
+
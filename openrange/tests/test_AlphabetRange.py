@@ -0,0 +1,141 @@
+
+import random
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from openrange.alphabet import AlphabetRange, BASE36, BASE62, HEX
+from openrange.index import RangeIndex
+from openrange.merging import merge
+
+LETTERS = 'abcdefghijklmnopqrstuvwxyz'
+
+def _encode(num, alphabet, width):
+    digits = ''
+    while num:
+        (num, digit) = divmod(num, len(alphabet))
+        digits = alphabet[digit] + digits
+    return (digits or alphabet[0]).rjust(max(width, 1), alphabet[0])
+
+class TestAlphabetRange(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = AlphabetRange(LETTERS, 'aa', 'zz', width=2)
+
+    def test_alphabets(self):
+        self.assertEqual(len(self.rng), 26 * 26)
+        self.assertEqual(list(self.rng[:3]), ['aa', 'ab', 'ac'])
+        self.assertEqual(self.rng[-1], 'zz')
+        self.assertEqual(self.rng.base, 26)
+        self.assertEqual(self.rng.width, 2)
+        self.assertEqual(self.rng[::5].step, 5)
+
+        self.assertEqual(list(AlphabetRange(HEX, 'e', '11')),
+                         ['e', 'f', '10', '11'])
+        self.assertEqual(AlphabetRange(HEX, 255, width=4)[-1], '00ff')
+        self.assertEqual(
+            AlphabetRange(BASE62, 61, 62), AlphabetRange(BASE62, 'z', '10'))
+        self.assertEqual(list(AlphabetRange('01', 5)),
+                         ['0', '1', '10', '11', '100', '101'])
+
+        self.assertRaises(ValueError, AlphabetRange, 'a', 0, 1)
+        self.assertRaises(ValueError, AlphabetRange, 'abca', 0, 1)
+        self.assertRaises(ValueError, AlphabetRange, HEX, 0, 1, width=-1)
+        self.assertRaises(TypeError, AlphabetRange, HEX, 0, 1, pad=2)
+        self.assertRaises(TypeError, AlphabetRange, HEX, 0, 9, '2')
+        self.assertRaises(ValueError, AlphabetRange, HEX, -1, 9)
+
+    def test_iteration_matches_encoding(self):
+        rand = random.Random(0)
+        for _ in range(500):
+            alphabet = rand.choice(['01', LETTERS, HEX, BASE36, BASE62,
+                                    BASE62 + '-_'])
+            width = rand.choice([0, 1, 2, 3, 6])
+            start = rand.randint(0, 200000)
+            step = rand.choice([1, 2, 7, 99, 4096, -1, -3, -250])
+            count = rand.randint(0, 400)
+            stop = max(start + step * (count - 1), 0)
+            rng = AlphabetRange(alphabet, start, stop, step, width=width)
+            expected = [_encode(n, alphabet, width) for n in
+                        range(start, stop + (1 if step > 0 else -1), step)]
+            self.assertEqual(list(rng), expected)
+            self.assertEqual(
+                [rng.decode(item) for item in expected],
+                list(range(start, stop + (1 if step > 0 else -1), step)))
+
+    def test_decode(self):
+        self.assertEqual(self.rng.decode('ba'), 26)
+        self.assertEqual(self.rng.index('ba'), 26)
+        self.assertEqual(self.rng.decode('baa'), 676)
+        self.assertTrue('ba' in self.rng)
+        self.assertTrue(26 in self.rng)
+        self.assertFalse('a' in self.rng)
+        self.assertFalse('aab' in self.rng)
+        self.assertFalse('a1' in self.rng)
+        self.assertFalse('baa' in self.rng)
+        self.assertFalse(None in self.rng)
+        self.assertRaises(ValueError, self.rng.decode, 'aB')
+        self.assertRaises(ValueError, self.rng.encode, -1)
+
+        # symbols outside the alphabet that int() would accept
+        rng = AlphabetRange('abcdefghij', 0, 99)
+        self.assertRaises(ValueError, rng.decode, '12')
+        self.assertEqual(rng.decode('ja'), 90)
+
+        rng = AlphabetRange(BASE62 + '-_', 0, 10 ** 12, width=8)
+        self.assertEqual(rng.decode(rng.encode(10 ** 12)), 10 ** 12)
+        self.assertEqual(rng.encode(63), '0000000_')
+
+    def test_key(self):
+        other = AlphabetRange(LETTERS, 0, 675, width=3)
+        self.assertEqual(self.rng, AlphabetRange(LETTERS, 0, 675, width=2))
+        self.assertNotEqual(self.rng, other)
+        self.assertNotEqual(self.rng.fingerprint(), other.fingerprint())
+        self.assertNotEqual(
+            AlphabetRange(HEX, 0, 15).fingerprint(),
+            AlphabetRange(BASE36, 0, 15).fingerprint())
+
+    def test_slicing(self):
+        sliced = self.rng[30:40:3]
+        self.assertTrue(isinstance(sliced, AlphabetRange))
+        self.assertEqual(list(sliced), ['be', 'bh', 'bk', 'bn'])
+        self.assertEqual(list(reversed(self.rng))[:2], ['zz', 'zy'])
+
+    def test_alphabets_do_not_mix(self):
+        (hex_rng, base36) = (AlphabetRange(HEX, 0, 255),
+                             AlphabetRange(BASE36, 0, 255))
+        index = RangeIndex([hex_rng, base36, self.rng])
+        # 255, 555 (outside 0..255) and 135
+        self.assertEqual(index.query('ff'), [0, 2])
+        # 115, 255 and not validly encoded
+        self.assertEqual(index.query('73'), [0, 1])
+        self.assertEqual(index.query(5), [0, 1, 2])
+        self.assertRaises(TypeError, list, merge(hex_rng, base36))
+        self.assertRaises(
+            TypeError, list, merge(hex_rng, AlphabetRange(HEX, 0, 9, width=2)))
+        self.assertEqual(
+            list(merge(hex_rng[:2], hex_rng[1:3])), ['0', '1', '2'])
+
+    def test_whole_values(self):
+        self.assertEqual(AlphabetRange(HEX, 0, 254).mean(), '7f')
+        self.assertEqual(list(AlphabetRange(HEX, 1, 3).scale(16)),
+                         ['1', '11', '21'])
+        self.assertRaises(ValueError, AlphabetRange(HEX, 0, 255).mean)
+        self.assertRaises(ValueError, AlphabetRange(HEX, 0, 255).median)
+        self.assertRaises(TypeError, self.rng.scale, 0.5)
+        self.assertRaises(TypeError, AlphabetRange.by_count, 0, 255, 7)
+
+    def test_repr(self):
+        self.assertEqual(
+            repr(self.rng),
+            "AlphabetRange('{a}', 'aa', 'zz', 1, width=2)".format(a=LETTERS))
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_to_array(self):
+        for rng in [self.rng, AlphabetRange(HEX, 0, 5000, 7),
+                    AlphabetRange(BASE62, 10 ** 9, 10 ** 9 + 100, width=8),
+                    AlphabetRange(BASE62, 10 ** 20, 10 ** 20 + 5)]:
+            self.assertEqual(rng.to_array().tolist(), list(rng))
@@ -1,8 +1,113 @@
+import sys
+import threading
+import time
 import unittest
+
 from openrange import BaseRange
 
+class CountingRange(BaseRange):
+    """Integer progression that counts item conversions."""
+
+    conversions = 0
+
+    def _item_to_num(self, item):
+        CountingRange.conversions += 1
+        return item
+
+    def _num_to_item(self, num):
+        CountingRange.conversions += 1
+        return num
+
 class TestBaseRange(unittest.TestCase):
 
     def test_no_construct(self):
         self.assertRaises(TypeError, BaseRange, None)
 
+    def test_reversed_no_conversion(self):
+        rng = CountingRange(0, 10, 2)
+        CountingRange.conversions = 0
+        rev = reversed(rng)
+        self.assertEqual(CountingRange.conversions, 0)
+        self.assertTrue(isinstance(rev, CountingRange))
+        self.assertEqual(list(rev), [10, 8, 6, 4, 2, 0])
+
+    def test_slice_no_conversion(self):
+        rng = CountingRange(0, 100, 3)
+        CountingRange.conversions = 0
+        sub = rng[5:-5:2]
+        self.assertEqual(CountingRange.conversions, 0)
+        self.assertTrue(isinstance(sub, CountingRange))
+        self.assertEqual(list(sub), list(range(0, 101, 3))[5:-5:2])
+
+class SlowRange(BaseRange):
+    """Integer progression with a slow, failure-prone item conversion."""
+
+    def __init__(self, *args, **kwargs):
+        self.fail_at = kwargs.pop('fail_at', None)
+        self.converted = []
+        self.lock = threading.Lock()
+        super(SlowRange, self).__init__(*args)
+
+    def _item_to_num(self, item):
+        return item
+
+    def _num_to_item(self, num):
+        time.sleep(0.01)
+        with self.lock:
+            self.converted.append(num)
+        if num == self.fail_at:
+            raise IOError("cannot stat {n}".format(n=num))
+        return num
+
+class TestIterPrefetch(unittest.TestCase):
+
+    def test_order(self):
+        rng = SlowRange(0, 40)
+        self.assertEqual(list(rng.iter_prefetch(workers=8)), list(range(41)))
+
+    def test_buffer_bound(self):
+        rng = SlowRange(0, 1000)
+        items = rng.iter_prefetch(workers=2, buffer=5)
+        self.assertEqual(next(items), 0)
+        time.sleep(0.1)
+        self.assertTrue(len(rng.converted) <= 6)
+        items.close()
+
+    def test_exception_position(self):
+        rng = SlowRange(0, 20, fail_at=7)
+        seen = []
+        with self.assertRaises(IOError):
+            for item in rng.iter_prefetch(workers=4):
+                seen.append(item)
+        self.assertEqual(seen, list(range(7)))
+
+    def test_early_stop(self):
+        rng = SlowRange(0, 10000)
+        before = threading.active_count()
+        for item in rng.iter_prefetch(workers=4, buffer=8):
+            if item == 3:
+                break
+        self.assertTrue(len(rng.converted) < 20)
+        self.assertEqual(threading.active_count(), before)
+
+    def test_bad_args(self):
+        rng = SlowRange(3)
+        self.assertRaises(ValueError, list, rng.iter_prefetch(workers=0))
+        self.assertRaises(ValueError, list, rng.iter_prefetch(buffer=0))
+
+    def test_missing_futures(self):
+        # e.g. python 2 without the futures backport
+        modules = dict(
+            (name, sys.modules.get(name)) for name in
+            ('concurrent', 'concurrent.futures'))
+        try:
+            sys.modules['concurrent.futures'] = None
+            with self.assertRaises(ImportError) as raised:
+                list(SlowRange(3).iter_prefetch())
+            self.assertIn("futures package", str(raised.exception))
+        finally:
+            for (name, module) in modules.items():
+                if module is None:
+                    sys.modules.pop(name, None)
+                else:
+                    sys.modules[name] = module
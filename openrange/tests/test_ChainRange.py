@@ -0,0 +1,121 @@
+
+from datetime import date, timedelta
+import itertools
+import random
+import unittest
+
+from openrange.chain import ChainRange
+from openrange.dt import DateRange
+from openrange.rng import Range
+
+class TestChainRange(unittest.TestCase):
+
+    def setUp(self):
+        self.parts = [Range(1, 5), Range(5, 1), Range(10, 30, 10),
+                      Range(0, -6, -2), Range(7, 7)]
+        self.chain = ChainRange(*self.parts)
+        self.items = list(itertools.chain(*self.parts))
+
+    def test_iter_len(self):
+        self.assertEqual(list(self.chain), self.items)
+        self.assertEqual(len(self.chain), len(self.items))
+        self.assertEqual(self.chain.ranges, tuple(self.parts))
+        self.assertEqual(len(ChainRange()), 0)
+        self.assertEqual(list(ChainRange()), [])
+
+    def test_getitem(self):
+        for (i, item) in enumerate(self.items):
+            self.assertEqual(self.chain[i], item)
+            self.assertEqual(self.chain[i - len(self.items)], item)
+
+        self.assertRaises(IndexError, self.chain.__getitem__, len(self.items))
+        self.assertRaises(IndexError, self.chain.__getitem__, -20)
+        self.assertRaises(TypeError, self.chain.__getitem__, 'a')
+
+    def test_contains_index_count(self):
+        self.assertTrue(20 in self.chain)
+        self.assertFalse(6 in self.chain)
+        self.assertEqual(self.chain.index(-4), self.items.index(-4))
+        self.assertEqual(self.chain.index(7), len(self.items) - 1)
+        self.assertRaises(ValueError, self.chain.index, 6)
+        self.assertEqual(self.chain.count(0), 1)
+
+    def test_slices(self):
+        slices = [None, 0, 1, 3, 7, -1, -3, 20, -20]
+        for (start, stop) in itertools.product(slices, repeat=2):
+            for step in [None, 1, 2, 3, -1, -2, -4]:
+                sliced = self.chain[start:stop:step]
+                self.assertTrue(isinstance(sliced, ChainRange))
+                self.assertEqual(
+                    list(sliced), self.items[start:stop:step],
+                    "{s}".format(s=(start, stop, step)))
+
+    def test_slice_is_lazy(self):
+        chain = ChainRange(Range(0, 10 ** 20), Range(-1, -10 ** 20, -1))
+        sliced = chain[10 ** 20 - 2:10 ** 20 + 3]
+        self.assertEqual(list(sliced), [10 ** 20 - 2, 10 ** 20 - 1, 10 ** 20,
+                                        -1, -2])
+        self.assertEqual(len(sliced.ranges), 2)
+        self.assertTrue(isinstance(sliced.ranges[0], Range))
+
+    def test_repeat(self):
+        rng = Range(-1, 1, .5)
+        self.assertEqual(list(rng.repeat()), list(rng) * 2)
+        self.assertEqual(list(rng.repeat(times=3)), list(rng) * 3)
+        self.assertRaises(ValueError, rng.repeat, 0)
+
+        repeated = self.chain.repeat(3)
+        items = self.items * 3
+        self.assertEqual(list(repeated), items)
+        self.assertEqual(len(repeated), len(items))
+        self.assertEqual(list(repeated.repeat(2)), items * 2)
+        for (i, item) in enumerate(items):
+            self.assertEqual(repeated[i], item)
+        self.assertEqual(repeated.count(20), 3)
+        self.assertEqual(repeated.index(20), self.items.index(20))
+
+        rand = random.Random(0)
+        for _ in range(200):
+            (start, stop) = (rand.randint(-50, 50), rand.randint(-50, 50))
+            step = rand.choice([1, 2, 5, -1, -3])
+            self.assertEqual(
+                list(repeated[start:stop:step]), items[start:stop:step])
+
+    def test_repeat_huge(self):
+        repeated = Range(1, 3).repeat(10 ** 18)
+        self.assertEqual(repeated.length, 3 * 10 ** 18)
+        self.assertEqual(repeated[-1], 3)
+        self.assertEqual(repeated[3 * 10 ** 17 + 1], 2)
+        self.assertEqual(list(repeated[-4:]), [3, 1, 2, 3])
+        self.assertTrue(repeated)
+        self.assertFalse(ChainRange())
+        self.assertFalse(ChainRange(Range(5, 1)).repeat(10 ** 18))
+
+    def test_repeat_slice_is_lazy(self):
+        sliced = Range(1, 3).repeat(10 ** 18)[::2]
+        self.assertEqual(sliced.length, 3 * 10 ** 18 // 2)
+        self.assertLessEqual(len(sliced.ranges), 2)
+        self.assertEqual(list(sliced[:6]), [1, 3, 2, 1, 3, 2])
+        self.assertEqual(sliced[-1], 2)
+
+        repeated = self.chain.repeat(50)
+        items = list(self.chain) * 50
+        for step in [1, 2, 3, 7, 11, -1, -4, -13]:
+            for start in [None, 0, 5, -3]:
+                for stop in [None, 17, -2]:
+                    sliced = repeated[start:stop:step]
+                    self.assertEqual(list(sliced), items[start:stop:step])
+                    self.assertEqual(len(sliced), len(items[start:stop:step]))
+
+    def test_dates(self):
+        start = date(2024, 1, 1)
+        chain = ChainRange(
+            DateRange(start, start + timedelta(days=2), timedelta(days=1)),
+            DateRange(start + timedelta(days=10), start + timedelta(days=30),
+                      timedelta(days=10)),
+        )
+        self.assertEqual(chain[4], start + timedelta(days=20))
+        self.assertEqual(chain.index(start + timedelta(days=10)), 3)
+        self.assertEqual(
+            list(chain[::2]),
+            [start, start + timedelta(days=2), start + timedelta(days=20)])
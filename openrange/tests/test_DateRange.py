@@ -85,11 +85,11 @@ class TestDateRange(unittest.TestCase):
         dr.reverse()
         dates = [d for d in dr]
         self.assertEqual(dates, [
-            date(2015, 3, 31),
-            date(2015, 3, 24),
-            date(2015, 3, 17),
-            date(2015, 3, 10),
-            date(2015, 3, 3)
+            date(2015, 3, 29),
+            date(2015, 3, 22),
+            date(2015, 3, 15),
+            date(2015, 3, 8),
+            date(2015, 3, 1)
         ])
     
     def test_properties_get(self):
@@ -1,7 +1,15 @@
 from datetime import datetime, timedelta
+import os
+import time
 import unittest
 
-from openrange.dt import DatetimeRange
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from openrange import dt
+from openrange.dt import DateRange, DatetimeRange
 
 class TestDatetimeRange(unittest.TestCase):
 
@@ -92,12 +100,12 @@ class TestDatetimeRange(unittest.TestCase):
         dtr.reverse()
         dates = [d for d in dtr]
         self.assertEqual(dates, [
-            datetime(2015, 3, 4, 7, 15),
-            datetime(2015, 3, 3, 19, 15),
-            datetime(2015, 3, 3, 7, 15),
-            datetime(2015, 3, 2, 19, 15),
-            datetime(2015, 3, 2, 7, 15),
-            datetime(2015, 3, 1, 19, 15)
+            datetime(2015, 3, 4, 4, 30),
+            datetime(2015, 3, 3, 16, 30),
+            datetime(2015, 3, 3, 4, 30),
+            datetime(2015, 3, 2, 16, 30),
+            datetime(2015, 3, 2, 4, 30),
+            datetime(2015, 3, 1, 16, 30)
         ])
     
     def test_properties_get(self):
@@ -132,3 +140,166 @@ class TestDatetimeRange(unittest.TestCase):
         dtr = DatetimeRange(self.dt1, self.dt2, self.delta)
         self.assertEqual(dtr.count(datetime(2015, 3, 4, 4, 30)), 1)
 
+    def test_slice(self):
+
+        dtr = DatetimeRange(self.dt1, self.dt2, self.delta)
+        sub = dtr[1::2]
+        self.assertTrue(isinstance(sub, DatetimeRange))
+        self.assertEqual(sub.step, timedelta(days=1))
+        self.assertEqual(list(sub), list(dtr)[1::2])
+
+    def test_floor_ceil(self):
+
+        dtr = DatetimeRange(self.dt1, self.dt2, self.delta)
+        event = datetime(2015, 3, 2, 9, 59, 59, 500000)
+        self.assertEqual(dtr.floor(event), datetime(2015, 3, 2, 4, 30))
+        self.assertEqual(dtr.ceil(event), datetime(2015, 3, 2, 16, 30))
+        self.assertEqual(dtr.nearest(event), datetime(2015, 3, 2, 4, 30))
+        self.assertEqual(dtr.floor_index(event), 1)
+
+    def test_subsecond_step(self):
+
+        dtr = DatetimeRange(self.dt1, self.dt1 + timedelta(seconds=1),
+            timedelta(milliseconds=250))
+        self.assertEqual(len(dtr), 5)
+        self.assertEqual(dtr[1], self.dt1 + timedelta(milliseconds=250))
+        self.assertEqual(dtr.step, timedelta(milliseconds=250))
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_bucketize(self):
+
+        dtr = DatetimeRange(self.dt1, self.dt2, self.delta)
+        events = [
+            datetime(2015, 3, 1, 16, 30),
+            datetime(2015, 3, 2, 4, 29, 59, 999999),
+            datetime(2015, 3, 4, 16, 29),
+            datetime(2015, 3, 4, 16, 30),
+            datetime(2015, 3, 1, 16, 29),
+        ]
+        expected = [0, 0, 5, -1, -1]
+        self.assertEqual(dtr.bucketize(events).tolist(), expected)
+        as_array = numpy.array(events, dtype='datetime64[us]')
+        self.assertEqual(dtr.bucketize(as_array).tolist(), expected)
+        self.assertEqual(dtr.histogram(as_array).tolist(), [2, 0, 0, 0, 0, 1])
+
+    def test_by_count(self):
+        rng = DatetimeRange.by_count(self.dt1, self.dt2, 7)
+        self.assertEqual(len(rng), 7)
+        self.assertEqual(rng[0], self.dt1)
+        self.assertEqual(rng[-1], self.dt2)
+        self.assertEqual(rng.step, (self.dt2 - self.dt1) / 6)
+
+    def test_by_count_uneven(self):
+        dt2 = self.dt1 + timedelta(seconds=1)
+        rng = DatetimeRange.by_count(self.dt1, dt2, 4)
+        self.assertEqual(len(rng), 4)
+        self.assertEqual(rng[1], self.dt1 + timedelta(microseconds=333333))
+        self.assertEqual(rng[-1], dt2)
+
+        # items are rounded to whole microseconds, off the exact grid
+        self.assertEqual([item in rng for item in rng], [True] * 4)
+        self.assertEqual([rng.index(item) for item in rng], [0, 1, 2, 3])
+        self.assertFalse(self.dt1 + timedelta(microseconds=333334) in rng)
+
+    def test_aggregates(self):
+        dtr = DatetimeRange(self.dt1, self.dt2, self.delta)
+        items = list(dtr)
+        self.assertEqual(dtr.min(), items[0])
+        self.assertEqual(dtr.max(), items[-1])
+        self.assertEqual(
+            dtr.mean(), items[0] + (items[-1] - items[0]) / 2)
+        self.assertEqual(dtr.median(), dtr.mean())
+        self.assertEqual(dtr.percentile(0), items[0])
+        self.assertEqual(dtr.percentile(100), items[-1])
+        self.assertTrue(isinstance(dtr.mean(), datetime))
+        self.assertRaises(TypeError, dtr.sum)
+
+        rev = DatetimeRange(self.dt2, self.dt1, -self.delta)
+        self.assertEqual(rev.min(), min(rev))
+        self.assertEqual(rev.max(), max(rev))
+
+    def test_shift_scale(self):
+        dtr = DatetimeRange(self.dt1, self.dt2, self.delta)
+        lag = timedelta(hours=-5)
+        shifted = dtr + lag
+        self.assertTrue(isinstance(shifted, DatetimeRange))
+        self.assertEqual(list(shifted), [d + lag for d in dtr])
+        self.assertEqual(shifted - lag, dtr)
+        self.assertEqual(dtr.shift(lag), shifted)
+
+        scaled = dtr.scale(2)
+        self.assertEqual(scaled.start, self.dt1)
+        self.assertEqual(scaled.step, self.delta * 2)
+        self.assertEqual(scaled[3], self.dt1 + self.delta * 6)
+
+        scaled = dtr.scale(0.5, origin=self.dt2)
+        self.assertEqual(scaled.start, self.dt2 - (self.dt2 - self.dt1) / 2)
+        self.assertEqual(scaled.stop, self.dt2)
+        self.assertEqual(scaled[1], scaled[0] + self.delta / 2)
+
+        self.assertRaises(TypeError, lambda: dtr + 1)
+
+    def test_sample(self):
+
+        dtr = DatetimeRange(self.dt1, self.dt2, self.delta)
+        dates = dtr.sample(4, seed=0)
+        self.assertEqual(len(set(dates)), 4)
+        self.assertTrue(all(isinstance(d, datetime) for d in dates))
+        self.assertTrue(all(d in dtr for d in dates))
+
+    def test_fingerprint_timezone(self):
+
+        def fingerprints():
+            return (
+                DatetimeRange(self.dt1, self.dt2, self.delta).fingerprint(),
+                DateRange(self.dt1.date(), self.dt2.date(),
+                          timedelta(days=1)).fingerprint(),
+                DatetimeRange.by_count(
+                    self.dt1, self.dt1 + timedelta(seconds=1), 4)[1:]
+                .fingerprint(),
+            )
+
+        local = fingerprints()
+
+        # the local time epoch differs between timezones
+        epoch = dt._epoch()
+        try:
+            dt._EPOCH = datetime(1970, 1, 1, 9)
+            self.assertEqual(fingerprints(), local)
+            dt._EPOCH = datetime(1969, 12, 31, 19)
+            self.assertEqual(fingerprints(), local)
+        finally:
+            dt._EPOCH = epoch
+
+        self.assertNotEqual(
+            DatetimeRange(self.dt1, self.dt2, self.delta).fingerprint(),
+            DatetimeRange(self.dt1, self.dt2, self.delta * 2).fingerprint())
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    @unittest.skipIf(not hasattr(time, 'tzset'), "requires time.tzset")
+    def test_dst(self):
+        expected = [datetime(2020, 3, 7, 1) + timedelta(hours=6) * i
+                    for i in range(12)]
+
+        tz = os.environ.get('TZ')
+        epoch = dt._epoch()
+        try:
+            # clocks go forward on 2020-03-08 in New York
+            os.environ['TZ'] = 'America/New_York'
+            time.tzset()
+            dt._EPOCH = None
+
+            dtr = DatetimeRange(datetime(2020, 3, 7, 1), datetime(2020, 3, 10),
+                                timedelta(hours=6))
+            self.assertEqual(list(dtr), expected)
+            self.assertEqual(dtr.to_array().tolist(), expected)
+            self.assertEqual([dtr[i] for i in range(dtr.length)], expected)
+            self.assertEqual(dtr.index(datetime(2020, 3, 9, 7)), 9)
+        finally:
+            if tz is None:
+                del os.environ['TZ']
+            else:
+                os.environ['TZ'] = tz
+            time.tzset()
+            dt._EPOCH = epoch
+
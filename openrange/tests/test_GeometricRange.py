@@ -0,0 +1,165 @@
+from fractions import Fraction
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from openrange.geom import GeometricRange
+
+class TestGeometricRange(unittest.TestCase):
+
+    def test_bad_args(self):
+        self.assertRaises(ValueError, GeometricRange, 0, 10, 2)
+        self.assertRaises(ValueError, GeometricRange, 1, 10, 1)
+        self.assertRaises(ValueError, GeometricRange, 1, 10, -2)
+        self.assertRaises(ValueError, GeometricRange, 1, 10, 0)
+
+    def test_by_count(self):
+        self.assertRaises(TypeError, GeometricRange.by_count, 1, 10, 3)
+
+    def test_iter_int(self):
+        rng = GeometricRange(1, 1024, 2)
+        self.assertEqual(list(rng), [2 ** i for i in range(11)])
+        self.assertTrue(all(isinstance(x, int) for x in rng))
+
+    def test_iter_descending(self):
+        rng = GeometricRange(1000, 1, Fraction(1, 10))
+        self.assertEqual(list(rng), [1000, 100, 10, 1])
+
+    def test_iter_float(self):
+        rng = GeometricRange(1e-4, 1e-1, 10.0)
+        self.assertEqual(len(rng), 4)
+        self.assertAlmostEqual(rng[3], 0.1)
+
+    def test_stop_not_reached(self):
+        self.assertEqual(list(GeometricRange(3, 100, 3)), [3, 9, 27, 81])
+        self.assertEqual(list(GeometricRange(3, 1, 3)), [])
+        self.assertEqual(list(GeometricRange(3, -9, 3)), [])
+
+    def test_negative_values(self):
+        self.assertEqual(list(GeometricRange(-1, -100, 10)), [-1, -10, -100])
+
+    def test_len_huge_exact(self):
+        rng = GeometricRange(3, 3 ** 500, 3)
+        self.assertEqual(len(rng), 500)
+        self.assertEqual(rng[499], 3 ** 500)
+        self.assertEqual(rng.index(3 ** 250), 249)
+
+    def test_indexing(self):
+        rng = GeometricRange(5, 5 * 7 ** 20, 7)
+        self.assertEqual(rng[0], 5)
+        self.assertEqual(rng[10], 5 * 7 ** 10)
+        self.assertEqual(rng[-1], 5 * 7 ** 20)
+        self.assertRaises(IndexError, rng.__getitem__, 21)
+
+    def test_contains_exact(self):
+        rng = GeometricRange(1, 2 ** 40, 2)
+        self.assertTrue(2 ** 33 in rng)
+        self.assertFalse(2 ** 33 + 1 in rng)
+        self.assertFalse(2 ** 41 in rng)
+        self.assertFalse(Fraction(1, 2) in rng)
+
+    def test_contains_tolerance(self):
+        rng = GeometricRange(0.001, 10.0, 10.0)
+        self.assertTrue(0.1 in rng)
+        self.assertTrue(0.30000000000000004 / 3 in rng)
+        self.assertFalse(0.2 in rng)
+        self.assertEqual(rng.index(1.0), 3)
+
+    def test_reverse(self):
+        rng = GeometricRange(1, 64, 4)
+        rng.reverse()
+        self.assertEqual(list(rng), [64, 16, 4, 1])
+        self.assertEqual(rng.ratio, Fraction(1, 4))
+
+    def test_reverse_off_grid(self):
+        # stop is not an item
+        rng = GeometricRange(1, 1000, 2)
+        self.assertEqual(list(reversed(rng)), list(rng)[::-1])
+        rng.reverse()
+        self.assertEqual(list(rng)[:3], [512, 256, 128])
+        self.assertEqual(rng[-1], 1)
+
+        rng = GeometricRange(1.0, 1500.0, 10.0)
+        rng.reverse()
+        self.assertEqual(len(rng), 4)
+        for (item, expected) in zip(rng, [1000.0, 100.0, 10.0, 1.0]):
+            self.assertAlmostEqual(item, expected)
+
+    def test_repr(self):
+        self.assertEqual(repr(GeometricRange(1, 64, 4)),
+            "GeometricRange(1, 64, 4)")
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_to_array(self):
+        self.assertEqual(GeometricRange(1, 1024, 2).to_array().tolist(),
+            [2 ** i for i in range(11)])
+        self.assertEqual(GeometricRange(2, 2 ** 70, 2).to_array()[-1],
+            2 ** 70)
+        floats = GeometricRange(1e-3, 1e3, 10.0).to_array()
+        self.assertEqual(floats.dtype, numpy.float64)
+        self.assertEqual(floats.tolist(), list(GeometricRange(1e-3, 1e3, 10.0)))
+
+    def test_slice(self):
+        rng = GeometricRange(1, 2 ** 20, 2)
+        sub = rng[3:12:4]
+        self.assertTrue(isinstance(sub, GeometricRange))
+        self.assertEqual(list(sub), [8, 128, 2048])
+        self.assertEqual(list(rng[::-5]), list(rng)[::-5])
+        self.assertEqual(list(rng[4:4]), [])
+
+    def test_floor_ceil(self):
+        rng = GeometricRange(1, 1024, 2)
+        self.assertEqual(rng.floor(100), 64)
+        self.assertEqual(rng.ceil(100), 128)
+        self.assertEqual(rng.floor(64), 64)
+        self.assertEqual(rng.nearest(90), 64)
+        self.assertEqual(rng.nearest(5000), 1024)
+        self.assertRaises(ValueError, rng.floor, Fraction(1, 2))
+        self.assertRaises(ValueError, rng.floor, -3)
+        self.assertEqual(rng.ceil(-3), 1)
+
+    def test_floor_ceil_descending(self):
+        rng = GeometricRange(1000, 1, Fraction(1, 10))
+        self.assertEqual(rng.floor(50), 10)
+        self.assertEqual(rng.floor_index(50), 2)
+        self.assertEqual(rng.ceil(50), 100)
+        self.assertEqual(rng.ceil(0), 1)
+        self.assertRaises(ValueError, rng.floor, 0)
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_bucketize(self):
+        rng = GeometricRange(1, 1024, 2)
+        values = [1, 3, 4, 1000, 1024, 2047, 2048, 0.5, -1]
+        self.assertEqual(rng.bucketize(values).tolist(),
+            [0, 1, 2, 9, 10, 10, -1, -1, -1])
+
+    def test_aggregates(self):
+        rng = GeometricRange(1, 1024, 2)
+        self.assertEqual(rng.sum(), 2047)
+        self.assertEqual(rng.mean(), Fraction(2047, 11))
+        self.assertEqual(rng.median(), 32)
+        self.assertEqual(rng.min(), 1)
+        self.assertEqual(rng.max(), 1024)
+        self.assertEqual(GeometricRange(1, 8, 2).median(), 3)
+
+        rng = GeometricRange(1000, 1, Fraction(1, 10))
+        self.assertEqual(rng.sum(), 1111)
+        self.assertEqual(rng.min(), 1)
+        self.assertEqual(rng.percentile(50), 55)
+
+        rng = GeometricRange(1.0, 1000.0, 10.0)
+        self.assertAlmostEqual(rng.sum(), 1111.0)
+        self.assertTrue(isinstance(rng.mean(), float))
+
+    def test_scale(self):
+        rng = GeometricRange(1, 1024, 2)
+        self.assertEqual(list(rng.scale(3)), [3 * i for i in rng])
+        self.assertEqual(list(rng.scale(Fraction(1, 2)))[:2], [Fraction(1, 2), 1])
+        self.assertEqual(list(rng.scale(0.5))[:2], [0.5, 1.0])
+        self.assertRaises(ValueError, rng.scale, 2, 1)
+        self.assertRaises(ValueError, rng.scale, 0)
+        self.assertRaises(TypeError, rng.shift, 1)
+        self.assertRaises(TypeError, lambda: rng + 1)
@@ -0,0 +1,35 @@
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from openrange.rng import Range
+from openrange.views import MappedRange
+
+@unittest.skipIf(numpy is None, "requires numpy")
+class TestMappedRangeBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+        def halve(items):
+            self.calls.append(len(items))
+            return items / 2.0
+        self.mapped = Range(0, 20, 2).map_batch(halve)
+
+    def test_batch_instance(self):
+        self.assertTrue(isinstance(self.mapped, MappedRange))
+
+    def test_batch_getitem(self):
+        self.assertEqual(self.mapped[3], 3.0)
+        self.assertEqual(self.calls, [1])
+
+    def test_batch_iter(self):
+        self.assertEqual(list(self.mapped[::3]), [0.0, 3.0, 6.0, 9.0])
+        self.assertEqual(self.calls, [4])
+
+    def test_batch_to_array(self):
+        values = self.mapped.to_array()
+        self.assertEqual(values.tolist(), [float(x) for x in range(11)])
+        self.assertEqual(self.calls, [11])
@@ -0,0 +1,124 @@
+
+import random
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from openrange.index import RangeIndex
+from openrange.merging import merge
+from openrange.paths import PathSequenceRange
+
+class TestPathSequenceRange(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = PathSequenceRange('shot_010.%04d.exr', 1001, 1100)
+
+    def test_templates(self):
+        self.assertEqual(self.rng[0], 'shot_010.1001.exr')
+        self.assertEqual(self.rng.padding, 4)
+        self.assertEqual(self.rng.template, 'shot_010.%04d.exr')
+        self.assertEqual(self.rng[::5].step, 5)
+        self.assertRaises(
+            TypeError, PathSequenceRange, 'f.%04d', 1, 9, 'f.0002')
+
+        rng = PathSequenceRange('shot_010.####.exr', 1, 3)
+        self.assertEqual(
+            list(rng), ['shot_010.0001.exr', 'shot_010.0002.exr',
+                        'shot_010.0003.exr'])
+        self.assertEqual(
+            list(PathSequenceRange('img%d.png', 8, 11)),
+            ['img8.png', 'img9.png', 'img10.png', 'img11.png'])
+        self.assertEqual(
+            list(PathSequenceRange('f.%03d', -2, 1)),
+            ['f.-02', 'f.-01', 'f.000', 'f.001'])
+
+        self.assertRaises(ValueError, PathSequenceRange, 'shot.exr', 1, 2)
+        self.assertRaises(ValueError, PathSequenceRange, '%04d.####', 1, 2)
+
+    def test_iteration_matches_formatting(self):
+        rand = random.Random(0)
+        for _ in range(500):
+            template = rand.choice(['a.%04d.exr', 'b_%d', '##', 'v%06d'])
+            start = rand.randint(-300, 20000)
+            step = rand.choice([1, 2, 7, 99, 100, 101, -1, -3, -250])
+            count = rand.randint(0, 400)
+            rng = PathSequenceRange(
+                template, start, start + step * (count - 1), step)
+            expected = [template.replace('##', '%02d') % n for n in
+                        range(start, start + step * count, step)]
+            self.assertEqual(list(rng), expected)
+
+    def test_parse(self):
+        self.assertEqual(self.rng.frame('shot_010.1050.exr'), 1050)
+        self.assertEqual(self.rng.index('shot_010.1050.exr'), 49)
+        self.assertTrue('shot_010.1050.exr' in self.rng)
+        self.assertTrue(1050 in self.rng)
+        self.assertFalse('shot_010.1050.dpx' in self.rng)
+        self.assertFalse('shot_010.01050.exr' in self.rng)
+        self.assertFalse('shot_010.2000.exr' in self.rng)
+        self.assertFalse(None in self.rng)
+        self.assertRaises(ValueError, self.rng.frame, 'shot_010.50.exr')
+
+        rng = PathSequenceRange('f.%03d', -20, 20)
+        self.assertEqual(rng.frame('f.-05'), -5)
+        self.assertEqual(rng.frame('f.1234'), 1234)
+        self.assertRaises(ValueError, rng.frame, 'f.-5')
+
+    def test_path_arguments(self):
+        rng = PathSequenceRange(
+            'shot_010.%04d.exr', 'shot_010.1001.exr', 'shot_010.1100.exr', 2)
+        self.assertEqual(rng, self.rng[::2])
+        self.assertEqual(len(rng), 50)
+
+    def test_key(self):
+        other = PathSequenceRange('shot_020.%04d.exr', 1001, 1100)
+        self.assertNotEqual(self.rng, other)
+        self.assertNotEqual(self.rng.fingerprint(), other.fingerprint())
+        self.assertEqual(
+            self.rng.fingerprint(),
+            PathSequenceRange('shot_010.####.exr', 1001, 1100).fingerprint())
+
+    def test_slicing(self):
+        sliced = self.rng[10:20:3]
+        self.assertTrue(isinstance(sliced, PathSequenceRange))
+        self.assertEqual(
+            list(sliced), ['shot_010.{n}.exr'.format(n=n)
+                           for n in range(1011, 1021, 3)])
+        self.assertEqual(list(reversed(self.rng))[0], 'shot_010.1100.exr')
+
+    def test_templates_do_not_mix(self):
+        other = PathSequenceRange('shot_020.%04d.exr', 1001, 1100)
+        index = RangeIndex([self.rng, other])
+        self.assertEqual(index.query('shot_020.1003.exr'), [1])
+        self.assertEqual(index.query('shot_010.1003.exr'), [0])
+        self.assertEqual(index.query(1003), [0, 1])
+        self.assertRaises(TypeError, list, merge(self.rng, other))
+        self.assertEqual(
+            list(merge(self.rng[:2], self.rng[1:3])),
+            ['shot_010.1001.exr', 'shot_010.1002.exr', 'shot_010.1003.exr'])
+
+    def test_whole_frames(self):
+        self.assertEqual(
+            list(self.rng[:3].scale(2, origin=0)),
+            ['shot_010.2002.exr', 'shot_010.2004.exr', 'shot_010.2006.exr'])
+        self.assertEqual(self.rng[:3].mean(), 'shot_010.1002.exr')
+        self.assertRaises(TypeError, self.rng.scale, 0.5)
+        self.assertRaises(ValueError, self.rng.mean)
+        self.assertRaises(ValueError, self.rng.percentile, 10)
+        self.assertRaises(TypeError, self.rng.sum)
+        self.assertRaises(TypeError, PathSequenceRange.by_count, 1, 9, 5)
+
+    def test_repr(self):
+        self.assertEqual(
+            repr(self.rng),
+            "PathSequenceRange('shot_010.%04d.exr', 1001, 1100, 1)")
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_to_array(self):
+        arr = self.rng[:3].to_array()
+        self.assertEqual(
+            arr.tolist(), ['shot_010.1001.exr', 'shot_010.1002.exr',
+                           'shot_010.1003.exr'])
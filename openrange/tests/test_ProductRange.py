@@ -0,0 +1,97 @@
+from datetime import time, timedelta
+import itertools
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from openrange.dt import TimeRange
+from openrange.product import ProductRange
+from openrange.rng import Range
+
+class TestProductRange(unittest.TestCase):
+
+    def setUp(self):
+        self.frames = Range(1, 4)
+        self.slots = TimeRange(time(9), time(11), timedelta(hours=1))
+        self.quality = Range(0, 1, .5)
+        self.grid = ProductRange(self.frames, self.slots, self.quality)
+        self.items = list(
+            itertools.product(self.frames, self.slots, self.quality))
+
+    def test_no_ranges(self):
+        self.assertRaises(TypeError, ProductRange)
+
+    def test_len(self):
+        self.assertEqual(len(self.grid), 36)
+        self.assertEqual(self.grid.shape, (4, 3, 3))
+
+    def test_bool(self):
+        self.assertTrue(self.grid)
+        self.assertTrue(ProductRange(Range(0, 10 ** 20), Range(0, 10 ** 20)))
+        self.assertFalse(ProductRange(Range(0, 3), Range(5, 1)))
+
+    def test_iter(self):
+        self.assertEqual(list(self.grid), self.items)
+
+    def test_indexing(self):
+        for (i, item) in enumerate(self.items):
+            self.assertEqual(self.grid[i], item)
+        self.assertEqual(self.grid[-1], self.items[-1])
+        self.assertRaises(IndexError, self.grid.__getitem__, 36)
+
+    def test_flat_slice(self):
+        self.assertEqual(self.grid[5:20:3], self.items[5:20:3])
+
+    def test_index(self):
+        for (i, item) in enumerate(self.items):
+            self.assertEqual(self.grid.index(item), i)
+        self.assertRaises(ValueError, self.grid.index, (5, time(9), 0))
+
+    def test_contains(self):
+        self.assertTrue((2, time(10), .5) in self.grid)
+        self.assertFalse((2, time(10), .25) in self.grid)
+        self.assertFalse((2, time(10)) in self.grid)
+
+    def test_axis_selection(self):
+        sub = self.grid[1:3, 0]
+        self.assertEqual(sub.shape, (2, 3))
+        self.assertEqual(list(sub),
+            list(itertools.product([2, 3], [0, .5, 1])))
+        self.assertEqual(self.grid[0, 1, 2], (1, time(10), 1))
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_to_arrays(self):
+        grid = ProductRange(Range(1, 4), Range(0, 1, .5))
+        (frames, quality) = grid.to_arrays(2, 7)
+        self.assertEqual(frames.tolist(), [1, 2, 2, 2, 3])
+        self.assertEqual(quality.tolist(), [1, 0, .5, 1, 0])
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_chunks(self):
+        grid = ProductRange(Range(1, 4), Range(0, 2))
+        rows = []
+        for (frames, others) in grid.chunks(5):
+            self.assertTrue(len(frames) <= 5)
+            rows.extend(zip(frames.tolist(), others.tolist()))
+        self.assertEqual(rows, list(grid))
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_to_arrays_huge(self):
+        # more grid points than fit in int64
+        grid = ProductRange(Range(0, 10 ** 10), Range(0, 10 ** 10))
+        (rows, cols) = grid.to_arrays(0, 3)
+        self.assertEqual(rows.tolist(), [0, 0, 0])
+        self.assertEqual(cols.tolist(), [0, 1, 2])
+        (rows, cols) = grid.to_arrays(grid.length - 2)
+        self.assertEqual(rows.tolist(), [10 ** 10, 10 ** 10])
+        self.assertEqual(cols.tolist(), [10 ** 10 - 1, 10 ** 10])
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_to_arrays_sequences(self):
+        grid = ProductRange(Range(1, 2), ['a', 'b'])
+        (frames, names) = grid.to_arrays()
+        self.assertEqual(frames.tolist(), [1, 1, 2, 2])
+        self.assertEqual(names.tolist(), ['a', 'b', 'a', 'b'])
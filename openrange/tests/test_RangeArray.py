@@ -0,0 +1,232 @@
+
+from datetime import datetime, time, timedelta
+import random
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from openrange.array import RangeArray
+from openrange.dt import DatetimeRange, TimeRange
+from openrange.geom import GeometricRange
+from openrange.paths import PathSequenceRange
+from openrange.rng import Range
+
+def _random_ranges(seed, count=300, span=100):
+    rand = random.Random(seed)
+    ranges = []
+    for _ in range(count):
+        start = rand.randint(-span, span)
+        step = rand.choice([-12, -6, -4, -1, 1, 2, 3, 8, 9, 15])
+        ranges.append(Range(start, start + step * rand.randint(-1, 30), step))
+    return ranges
+
+@unittest.skipIf(numpy is None, "requires numpy")
+class TestRangeArray(unittest.TestCase):
+
+    def setUp(self):
+        self.ranges = _random_ranges(0)
+        self.array = RangeArray.from_ranges(self.ranges)
+
+    def test_rows(self):
+        self.assertEqual(len(self.array), len(self.ranges))
+        self.assertEqual(self.array.range_type, Range)
+        self.assertEqual(
+            self.array.lengths.tolist(), [rng.length for rng in self.ranges])
+        self.assertEqual(list(self.array), self.ranges)
+        self.assertEqual(self.array[-1], self.ranges[-1])
+        self.assertRaises(IndexError, self.array.__getitem__, len(self.ranges))
+
+    def test_columns(self):
+        array = RangeArray(Range, [0, 10], [1, -2], [5, 3])
+        self.assertEqual(list(array), [Range(0, 4), Range(10, 6, -2)])
+        self.assertRaises(ValueError, RangeArray, Range, [0], [0], [1])
+        self.assertRaises(ValueError, RangeArray, Range, [0], [1], [-1])
+        self.assertRaises(ValueError, RangeArray, Range, [0, 1], [1], [1])
+        self.assertRaises(TypeError, RangeArray, GeometricRange, [1], [2], [3])
+        self.assertRaises(ValueError, RangeArray.from_ranges, [])
+        self.assertRaises(
+            TypeError, RangeArray.from_ranges, [Range(0, 1), GeometricRange(
+                1, 8, 2)])
+
+    def test_contains_index(self):
+        for item in range(-150, 150, 7):
+            self.assertEqual(
+                self.array.contains(item).tolist(),
+                [item in rng for rng in self.ranges])
+            self.assertEqual(
+                self.array.index(item).tolist(),
+                [rng.index(item) if item in rng else -1
+                 for rng in self.ranges])
+
+    def test_contains_float(self):
+        array = RangeArray.from_ranges([Range(0, 1, .1), Range(.05, 2, .1)])
+        self.assertEqual(array.contains(.3).tolist(), [True, False])
+        self.assertEqual(array.index(.35).tolist(), [-1, 3])
+        self.assertEqual(list(array)[0], Range(0, 1, .1))
+
+    def test_contains_large_magnitude(self):
+        ranges = [Range(0.0, 4e9, 1.0), Range(0, 4 * 10 ** 9),
+                  Range(1.6e9, 1.7e9, 0.25)]
+        for item in [1999999999.5, 1999999999.0, 1650000000.25, 1650000000.1]:
+            for rng in ranges:
+                array = RangeArray.from_ranges([rng])
+                self.assertEqual(
+                    array.index(item).tolist(),
+                    [rng.index(item) if item in rng else -1])
+
+    def test_getitem(self):
+        rows = numpy.arange(len(self.ranges))
+        nonempty = rows[self.array.lengths > 0]
+        self.assertEqual(
+            self.array.getitem(nonempty, -1).tolist(),
+            [self.ranges[r][-1] for r in nonempty])
+        self.assertEqual(
+            self.array.getitem(nonempty[3], [0, 1]).tolist(),
+            list(self.ranges[nonempty[3]][:2]))
+        empty = rows[self.array.lengths == 0]
+        self.assertRaises(IndexError, self.array.getitem, empty[:1], 0)
+
+    def test_filter(self):
+        mask = self.array.contains(5)
+        selected = self.array[mask]
+        self.assertTrue(isinstance(selected, RangeArray))
+        self.assertEqual(
+            list(selected), [rng for rng in self.ranges if 5 in rng])
+        self.assertEqual(list(self.array[10:20]), self.ranges[10:20])
+        self.assertEqual(list(self.array[[3, 1]]),
+                         [self.ranges[3], self.ranges[1]])
+
+    def test_intersect(self):
+        for other in [Range(-50, 80, 6), Range(90, -40, -4), Range(3, 3),
+                      Range(1, 0), Range(-1000, 1000, 35)]:
+            result = self.array.intersect(other)
+            expected = [sorted(set(rng) & set(other)) for rng in self.ranges]
+            self.assertEqual([list(rng) for rng in result], expected)
+
+    def test_intersect_large(self):
+        # large steps take the python int path
+        step = 2 ** 40 + 1
+        array = RangeArray.from_ranges(
+            [Range(0, step * 10, step), Range(5, 5 + step * 3 * 10, step * 3)])
+        other = Range(0, step * 2 ** 20, step * 7 + 2)
+        result = array.intersect(other)
+        self.assertEqual(
+            [list(rng) for rng in result],
+            [sorted(set(rng) & set(other)) for rng in array])
+
+        self.assertRaises(
+            TypeError, RangeArray.from_ranges([Range(0, 1, .5)]).intersect,
+            Range(0, 1))
+
+    def test_shift_scale(self):
+        shifted = self.array.shift(10)
+        self.assertEqual(list(shifted), [rng + 10 for rng in self.ranges])
+
+        scaled = self.array.scale(3)
+        self.assertEqual(list(scaled), [rng.scale(3) for rng in self.ranges])
+
+        scaled = self.array.scale(2, origin=0)
+        self.assertEqual(
+            list(scaled), [rng.scale(2, origin=0) for rng in self.ranges])
+
+        self.assertRaises(ValueError, self.array.scale, 0)
+        self.assertRaises(ValueError, self.array.scale, 0.5)
+
+@unittest.skipIf(numpy is None, "requires numpy")
+class TestRangeArrayDatetime(unittest.TestCase):
+
+    def setUp(self):
+        rand = random.Random(1)
+        base = datetime(2024, 3, 1)
+        self.ranges = []
+        for _ in range(200):
+            start = base + timedelta(minutes=rand.randint(0, 24 * 60))
+            step = timedelta(minutes=rand.choice([10, 15, 30, 45, 60, 90]))
+            self.ranges.append(
+                DatetimeRange(start, start + step * rand.randint(0, 40), step))
+        self.array = RangeArray.from_ranges(self.ranges)
+
+    def test_columns(self):
+        starts = numpy.array(
+            [rng.start for rng in self.ranges], dtype='M8[us]')
+        steps = numpy.array([rng.step for rng in self.ranges], dtype='m8[us]')
+        array = RangeArray(DatetimeRange, starts, steps, self.array.lengths)
+        self.assertEqual(list(array), self.ranges)
+
+    def test_contains(self):
+        item = datetime(2024, 3, 1, 18)
+        self.assertEqual(
+            self.array.contains(item).tolist(),
+            [item in rng for rng in self.ranges])
+
+    def test_getitem(self):
+        items = self.array.getitem(numpy.arange(len(self.ranges)), 0)
+        self.assertEqual(items.dtype, numpy.dtype('M8[us]'))
+        self.assertEqual(
+            items.astype(datetime).tolist(),
+            [rng.start for rng in self.ranges])
+
+    def test_intersect(self):
+        other = DatetimeRange(datetime(2024, 3, 1, 6), datetime(2024, 3, 3),
+                              timedelta(minutes=20))
+        result = self.array.intersect(other)
+        self.assertEqual(
+            [list(rng) for rng in result],
+            [sorted(set(rng) & set(other)) for rng in self.ranges])
+
+    def test_shift(self):
+        lag = timedelta(hours=-3)
+        self.assertEqual(
+            list(self.array.shift(lag)), [rng + lag for rng in self.ranges])
+        self.assertEqual(
+            list(self.array.scale(0.5)),
+            [rng.scale(0.5) for rng in self.ranges])
+
+    def test_time(self):
+        array = RangeArray.from_ranges([
+            TimeRange(time(9), time(17), timedelta(minutes=30)),
+            TimeRange(time(22), time(2), timedelta(hours=1)),
+        ])
+        self.assertEqual(array.contains(time(10)).tolist(), [True, False])
+        self.assertEqual(
+            array.getitem([0, 1], -1).tolist(), [time(17), time(2)])
+
+    def test_time_past_midnight(self):
+        ranges = [
+            TimeRange(time(22), time(2), timedelta(hours=1)),
+            TimeRange(time(0), time(3), timedelta(hours=1)),
+            TimeRange(time(1), time(23), -timedelta(minutes=30)),
+            TimeRange(time(22), time(2), timedelta(hours=1))[3:],
+        ]
+        array = RangeArray.from_ranges(ranges)
+        self.assertEqual(array.index(time(1)).tolist(), [3, 1, 0, 0])
+        for item in [time(h, m) for h in range(24) for m in (0, 30)]:
+            self.assertEqual(
+                array.contains(item).tolist(), [item in rng for rng in ranges])
+
+@unittest.skipIf(numpy is None, "requires numpy")
+class TestRangeArrayPaths(unittest.TestCase):
+
+    def test_from_ranges(self):
+        ranges = [PathSequenceRange('b.####.exr', 1, 5),
+                  PathSequenceRange('b.####.exr', 3, 9, 2)]
+        array = RangeArray.from_ranges(ranges)
+        self.assertEqual(list(array), ranges)
+        self.assertEqual(array.contains('b.0003.exr').tolist(), [True, True])
+
+    def test_templates_do_not_mix(self):
+        self.assertRaises(ValueError, RangeArray.from_ranges, [
+            PathSequenceRange('a.####.exr', 1, 5),
+            PathSequenceRange('b.####.exr', 1, 5)])
+
+    def test_prototype(self):
+        self.assertRaises(
+            TypeError, RangeArray, PathSequenceRange, [1], [1], [5])
+        array = RangeArray(
+            PathSequenceRange('b.####.exr', 1, 5), [1, 10], [2, 1], [3, 2])
+        self.assertEqual(list(array[0]), [
+            'b.0001.exr', 'b.0003.exr', 'b.0005.exr'])
+        self.assertEqual(list(array[1]), ['b.0010.exr', 'b.0011.exr'])
@@ -0,0 +1,154 @@
+
+from datetime import datetime, time, timedelta
+import random
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from openrange.dt import DatetimeRange, TimeRange
+from openrange.geom import GeometricRange
+from openrange.index import RangeIndex
+from openrange.rng import Range
+
+def _brute_force(ranges, item):
+    return [pos for (pos, rng) in enumerate(ranges) if item in rng]
+
+class TestRangeIndex(unittest.TestCase):
+
+    def setUp(self):
+        rand = random.Random(0)
+        self.ranges = []
+        for _ in range(300):
+            start = rand.randint(-100, 100)
+            step = rand.choice([-3, -2, -1, 1, 2, 5])
+            self.ranges.append(
+                Range(start, start + step * rand.randint(0, 30), step))
+        self.index = RangeIndex(self.ranges)
+
+    def test_len(self):
+        self.assertEqual(len(self.index), 300)
+        self.assertEqual(self.index.ranges, self.ranges)
+
+    def test_query_matches_scan(self):
+        for item in range(-200, 200):
+            self.assertEqual(
+                self.index.query(item), _brute_force(self.ranges, item))
+
+    def test_query_float(self):
+        ranges = [Range(0, 1, .1), Range(.05, 2, .1), Range(.3, .3)]
+        index = RangeIndex(ranges)
+        self.assertEqual(index.query(.3), [0, 2])
+        self.assertEqual(index.query(.35), [1])
+        self.assertEqual(index.query(5), [])
+
+    def test_empty(self):
+        index = RangeIndex([Range(5, 1), Range(1, 3)])
+        self.assertEqual(index.query(2), [1])
+        self.assertEqual(RangeIndex([]).query(2), [])
+
+    def test_mixed_types(self):
+        day = datetime(2024, 5, 1)
+        ranges = [
+            DatetimeRange(day, day + timedelta(days=1), timedelta(hours=1)),
+            TimeRange(time(9), time(17), timedelta(minutes=30)),
+            Range(0, 10),
+            DatetimeRange(day + timedelta(hours=12), day + timedelta(days=2),
+                          timedelta(minutes=15)),
+        ]
+        index = RangeIndex(ranges)
+
+        self.assertEqual(index.query(day + timedelta(hours=13)), [0, 1, 3])
+        self.assertEqual(
+            index.query(day + timedelta(hours=13, minutes=30)), [1, 3])
+        self.assertEqual(index.query(5), [2])
+
+    def test_query_past_midnight(self):
+        ranges = [
+            TimeRange(time(22), time(2), timedelta(hours=1)),
+            TimeRange(time(0), time(3), timedelta(hours=1)),
+            TimeRange(time(1), time(23), -timedelta(minutes=30)),
+        ]
+        index = RangeIndex(ranges)
+        self.assertEqual(index.query(time(1)), [0, 1, 2])
+        for item in [time(h, m) for h in range(24) for m in (0, 30)]:
+            self.assertEqual(index.query(item), _brute_force(ranges, item))
+
+    def test_geometric(self):
+        ranges = [GeometricRange(1, 1024, 2), GeometricRange(3, 300, 3)]
+        index = RangeIndex(ranges)
+        self.assertEqual(index.query(64), [0])
+        self.assertEqual(index.query(81), [1])
+        self.assertEqual(index.query(5), [])
+
+@unittest.skipIf(numpy is None, "requires numpy")
+class TestRangeIndexArray(unittest.TestCase):
+
+    def _expected(self, ranges, items):
+        pairs = [(v, r) for (v, item) in enumerate(items)
+                 for r in _brute_force(ranges, item)]
+        return ([v for (v, _) in pairs], [r for (_, r) in pairs])
+
+    def test_query_array_matches_scan(self):
+        rand = random.Random(1)
+        ranges = []
+        for _ in range(200):
+            start = rand.randint(-100, 100)
+            step = rand.choice([-3, -1, 1, 2, 7])
+            ranges.append(Range(start, start + step * rand.randint(0, 20), step))
+
+        values = numpy.arange(-250, 250)
+        (vals, rngs) = RangeIndex(ranges).query_array(values)
+        self.assertEqual(
+            (vals.tolist(), rngs.tolist()),
+            self._expected(ranges, values.tolist()))
+
+    def test_query_array_float(self):
+        ranges = [Range(0, 1, .1), Range(.05, 2, .1)]
+        values = [.3, .35, .301, 1.95, 3]
+        (vals, rngs) = RangeIndex(ranges).query_array(values)
+        self.assertEqual(vals.tolist(), [0, 1, 3])
+        self.assertEqual(rngs.tolist(), [0, 1, 1])
+
+    def test_query_array_large_magnitude(self):
+        ranges = [Range(0.0, 4e9, 1.0), Range(0, 4 * 10 ** 9),
+                  Range(1.6e9, 1.7e9, 0.25)]
+        values = [1999999999.5, 1999999999.0, 1650000000.25, 1650000000.1]
+        (vals, rngs) = RangeIndex(ranges).query_array(values)
+        self.assertEqual(
+            (vals.tolist(), rngs.tolist()), self._expected(ranges, values))
+
+    def test_query_array_datetime64(self):
+        day = datetime(2024, 5, 1)
+        ranges = [
+            DatetimeRange(day, day + timedelta(days=1), timedelta(hours=1)),
+            TimeRange(time(9), time(17), timedelta(minutes=30)),
+            DatetimeRange(day + timedelta(hours=12), day + timedelta(days=2),
+                          timedelta(minutes=15)),
+        ]
+        items = [day + timedelta(minutes=15 * i) for i in range(200)]
+        values = numpy.array(items, dtype='M8[us]')
+
+        (vals, rngs) = RangeIndex(ranges).query_array(values)
+        self.assertEqual(
+            (vals.tolist(), rngs.tolist()), self._expected(ranges, items))
+
+    def test_query_array_past_midnight(self):
+        ranges = [
+            TimeRange(time(22), time(2), timedelta(hours=1)),
+            TimeRange(time(0), time(3), timedelta(hours=1)),
+            TimeRange(time(1), time(23), -timedelta(minutes=30)),
+        ]
+        items = [time(h, m) for h in range(24) for m in (0, 30)]
+
+        (vals, rngs) = RangeIndex(ranges).query_array(items)
+        self.assertEqual(
+            (vals.tolist(), rngs.tolist()), self._expected(ranges, items))
+
+    def test_query_array_geometric(self):
+        ranges = [GeometricRange(1, 1024, 2), Range(0, 100, 10)]
+        (vals, rngs) = RangeIndex(ranges).query_array([8, 10, 20, 64, 3])
+        self.assertEqual(vals.tolist(), [0, 1, 2, 3])
+        self.assertEqual(rngs.tolist(), [0, 1, 1, 0])
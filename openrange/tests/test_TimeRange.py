@@ -1,6 +1,11 @@
 from datetime import time, timedelta
 import unittest
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from openrange.dt import TimeRange
 
 class TestTimeRange(unittest.TestCase):
@@ -85,11 +90,11 @@ class TestTimeRange(unittest.TestCase):
         tr.reverse()
         times = [t for t in tr]
         self.assertEqual(times, [
-            time(23, 45),
-            time(19, 15),
-            time(14, 45),
-            time(10, 15),
-            time(5, 45),
+            time(19, 30),
+            time(15, 0),
+            time(10, 30),
+            time(6, 0),
+            time(1, 30),
         ])
     
     def test_properties_get(self):
@@ -123,3 +128,48 @@ class TestTimeRange(unittest.TestCase):
         tr = TimeRange(self.time1, self.time2, self.delta)
         self.assertEqual(tr.count(time(15, 0)), 1)
 
+    def test_by_count(self):
+
+        tr = TimeRange.by_count(time(9), time(17), 5)
+        self.assertEqual(list(tr), [
+            time(9), time(11), time(13), time(15), time(17)])
+
+        # wraps forward past midnight, like the constructor
+        tr = TimeRange.by_count(time(23), time(1), 5)
+        self.assertEqual(list(tr), [
+            time(23), time(23, 30), time(0), time(0, 30), time(1)])
+        self.assertEqual(tr, TimeRange(time(23), time(1), timedelta(
+            minutes=30)))
+
+    def test_lookup_past_midnight(self):
+
+        tr = TimeRange(time(23), time(1), timedelta(minutes=30))
+        self.assertTrue(time(0) in tr)
+        self.assertEqual(tr.index(time(0, 30)), 3)
+        self.assertEqual(tr.floor(time(0, 10)), time(0))
+        self.assertEqual(tr.ceil(time(0, 10)), time(0, 30))
+        self.assertEqual(tr.nearest(time(23, 50)), time(0))
+        self.assertEqual(list(tr.excluding([time(0)])), [
+            time(23), time(23, 30), time(0, 30), time(1)])
+        # times before the start wrap to the following day
+        self.assertEqual(tr.floor(time(22)), time(1))
+        self.assertRaises(ValueError, tr.ceil, time(22))
+        self.assertEqual(tr[2:].index(time(1)), 2)
+
+        tr = TimeRange(time(1), time(23), -timedelta(minutes=30))
+        self.assertEqual(tr.index(time(0)), 2)
+        self.assertEqual(tr.floor(time(0, 10)), time(0))
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_bucketize_past_midnight(self):
+
+        tr = TimeRange(time(23), time(1), timedelta(minutes=30))
+        self.assertEqual(
+            tr.bucketize([time(0, 10), time(23, 40), time(1, 10)]).tolist(),
+            [2, 1, 4])
+        self.assertEqual(tr.bucketize([time(22)]).tolist(), [-1])
+        self.assertEqual(
+            tr.bucketize(tr.to_pandas().values).tolist(), [0, 1, 2, 3, 4])
+
+        tr = TimeRange(time(1), time(23), -timedelta(minutes=30))
+        self.assertEqual(tr.bucketize([time(0, 10)]).tolist(), [2])
@@ -0,0 +1,115 @@
+
+from datetime import datetime, timedelta
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from openrange.dt import DatetimeRange
+from openrange.rng import Range
+from openrange.views import WindowedRange
+
+def _window_lists(windows):
+    return [list(w) for w in windows]
+
+class TestWindowedRange(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = Range(0, 9)
+
+    def test_bad_args(self):
+        self.assertRaises(ValueError, self.rng.windows, 0)
+        self.assertRaises(ValueError, self.rng.windows, 2, 0)
+
+    def test_tumbling(self):
+        windows = self.rng.windows(4)
+        self.assertTrue(isinstance(windows, WindowedRange))
+        self.assertEqual(len(windows), 3)
+        self.assertEqual(
+            _window_lists(windows), [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]])
+        self.assertTrue(isinstance(windows[0], Range))
+
+    def test_no_partial(self):
+        windows = self.rng.windows(4, partial=False)
+        self.assertEqual(_window_lists(windows), [[0, 1, 2, 3], [4, 5, 6, 7]])
+
+    def test_exact_fit(self):
+        self.assertEqual(len(self.rng.windows(5)), 2)
+        self.assertEqual(len(self.rng.windows(10)), 1)
+        self.assertEqual(_window_lists(self.rng.windows(20)), [list(self.rng)])
+        self.assertEqual(len(self.rng.windows(20, partial=False)), 0)
+
+    def test_sliding(self):
+        windows = self.rng.windows(4, 3)
+        self.assertEqual(
+            _window_lists(windows),
+            [[0, 1, 2, 3], [3, 4, 5, 6], [6, 7, 8, 9]])
+
+        windows = self.rng.windows(4, 2)
+        self.assertEqual(
+            _window_lists(windows),
+            [[0, 1, 2, 3], [2, 3, 4, 5], [4, 5, 6, 7], [6, 7, 8, 9]])
+
+        windows = Range(0, 10).windows(4, 3)
+        self.assertEqual(_window_lists(windows)[-1], [9, 10])
+
+    def test_pairs(self):
+        pairs = [tuple(w) for w in self.rng.windows(2, 1)]
+        self.assertEqual(pairs, list(zip(self.rng, self.rng[1:])))
+
+    def test_hopping(self):
+        windows = self.rng.windows(2, 4)
+        self.assertEqual(_window_lists(windows), [[0, 1], [4, 5], [8, 9]])
+        self.assertEqual(len(Range(0, 10).windows(2, 4)), 3)
+
+    def test_indexing(self):
+        windows = self.rng.windows(3)
+        self.assertEqual(list(windows[-1]), [9])
+        self.assertEqual(list(windows[1]), [3, 4, 5])
+        self.assertRaises(IndexError, windows.__getitem__, 4)
+
+    def test_slice_is_lazy(self):
+        windows = self.rng.windows(2)[1::2]
+        self.assertTrue(isinstance(windows, WindowedRange))
+        self.assertEqual(_window_lists(windows), [[2, 3], [6, 7]])
+
+    def test_empty(self):
+        self.assertEqual(len(Range(5, 1).windows(3)), 0)
+
+    def test_huge(self):
+        windows = Range(0, 10 ** 20 - 1).windows(10 ** 3)
+        self.assertEqual(windows.length, 10 ** 17)
+        self.assertEqual(list(windows[-1][-2:]), [10 ** 20 - 2, 10 ** 20 - 1])
+
+    def test_datetime(self):
+        start = datetime(2024, 1, 1)
+        rng = DatetimeRange(start, start + timedelta(hours=10),
+                            timedelta(hours=1))
+        windows = rng.windows(4, 4)
+        self.assertEqual(windows[2].start, start + timedelta(hours=8))
+        self.assertEqual(windows[2].stop, start + timedelta(hours=10))
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_to_arrays(self):
+        (first, last) = self.rng.windows(4, 3).to_arrays()
+        self.assertEqual(first.tolist(), [0, 3, 6])
+        self.assertEqual(last.tolist(), [3, 6, 9])
+
+        (first, last) = self.rng.windows(4)[1:].to_arrays()
+        self.assertEqual(first.tolist(), [4, 8])
+        self.assertEqual(last.tolist(), [7, 9])
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_to_arrays_datetime(self):
+        start = datetime(2024, 1, 1)
+        rng = DatetimeRange(start, start + timedelta(days=1),
+                            timedelta(minutes=30))
+        windows = rng.windows(12)
+        (first, last) = windows.to_arrays()
+        self.assertEqual(first.dtype, numpy.dtype('M8[us]'))
+        self.assertEqual(
+            list(zip(first.astype(datetime).tolist(),
+                     last.astype(datetime).tolist())),
+            [(w.start, w.stop) for w in windows])
@@ -0,0 +1,120 @@
+
+from datetime import datetime, timedelta
+import itertools
+import random
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from openrange.compress import from_sequence
+from openrange.dt import DatetimeRange
+from openrange.rng import Range
+
+def _items(ranges):
+    return list(itertools.chain.from_iterable(ranges))
+
+class TestFromSequence(unittest.TestCase):
+
+    def test_runs(self):
+        self.assertEqual(
+            from_sequence([1, 2, 3, 4, 10, 20, 30, 31]),
+            [Range(1, 4), Range(10, 30, 10), Range(31, 31)])
+
+    def test_pair_joins_next_run(self):
+        self.assertEqual(
+            from_sequence([1, 5, 6, 7]), [Range(1, 1), Range(5, 7)])
+        self.assertEqual(from_sequence([1, 5]), [Range(1, 5, 4)])
+
+    def test_duplicates(self):
+        self.assertEqual(
+            from_sequence([3, 3, 4, 5, 5]),
+            [Range(3, 3), Range(3, 5), Range(5, 5)])
+
+    def test_descending(self):
+        self.assertEqual(
+            from_sequence([10, 8, 6, 7]), [Range(10, 6, -2), Range(7, 7)])
+
+    def test_floats(self):
+        ranges = from_sequence([.1, .2, .3, .5])
+        self.assertEqual(ranges, [Range(.1, .3, .1), Range(.5, .5)])
+        self.assertEqual(_items(ranges), [.1, .2, .3, .5])
+
+    def test_iterator(self):
+        values = itertools.chain(range(0, 100000, 3), range(100000, 100010))
+        self.assertEqual(
+            from_sequence(values),
+            [Range(0, 99999, 3), Range(100000, 100009)])
+
+    def test_empty(self):
+        self.assertEqual(from_sequence([]), [])
+
+    def test_datetimes(self):
+        start = datetime(2024, 1, 1)
+        hour = timedelta(hours=1)
+        values = [start + i * hour for i in range(5)] + [start + 10 * hour]
+
+        ranges = from_sequence(values, cls=DatetimeRange)
+        self.assertEqual(
+            ranges,
+            [DatetimeRange(start, start + 4 * hour, hour),
+             DatetimeRange(start + 10 * hour, start + 10 * hour, hour)])
+        self.assertEqual(_items(ranges), values)
+
+    def test_fuzz(self):
+        rand = random.Random(0)
+
+        for _ in range(300):
+            values = [rand.randint(-5, 5)]
+            for _ in range(rand.randint(0, 30)):
+                values.append(values[-1] + rand.choice([0, 1, 1, 1, 2, -3]))
+
+            ranges = from_sequence(values)
+            self.assertEqual(_items(ranges), values)
+            self.assertTrue(all(r.length for r in ranges))
+
+@unittest.skipIf(numpy is None, "requires numpy")
+class TestFromSequenceArray(unittest.TestCase):
+
+    def test_int_array(self):
+        values = numpy.concatenate(
+            (numpy.arange(0, 1000000, 4), [5, 6, 9, 9, 9]))
+
+        ranges = from_sequence(values)
+        self.assertEqual(
+            ranges,
+            [Range(0, 999996, 4), Range(5, 5), Range(6, 9, 3), Range(9, 9),
+             Range(9, 9)])
+        self.assertEqual(ranges, from_sequence(values.tolist()))
+
+    def test_datetime64_array(self):
+        values = numpy.concatenate((
+            numpy.arange('2024-01-01', '2024-01-02', 15, dtype='M8[m]'),
+            numpy.array(['2024-01-05T00:00:00.5'], dtype='M8[ms]'),
+        ))
+
+        ranges = from_sequence(values, cls=DatetimeRange)
+        self.assertEqual(len(ranges), 2)
+        self.assertEqual(ranges[0].step, timedelta(minutes=15))
+        self.assertEqual(
+            ranges, from_sequence(values.astype(datetime), DatetimeRange))
+        self.assertEqual(_items(ranges), values.astype(datetime).tolist())
+
+    def test_array_matches_streaming(self):
+        generator = numpy.random.default_rng(0)
+
+        for _ in range(300):
+            size = int(generator.integers(1, 60))
+            steps = generator.choice([0, 1, 1, 1, 2, -3], size=size - 1)
+            values = numpy.cumsum(numpy.concatenate(([3], steps)))
+
+            ranges = from_sequence(values)
+            self.assertEqual(ranges, from_sequence(values.tolist()))
+            self.assertEqual(_items(ranges), values.tolist())
+
+    def test_float_array(self):
+        values = numpy.array([.5, 1., 1.5, 4.])
+        self.assertEqual(
+            from_sequence(values), [Range(.5, 1.5, .5), Range(4., 4.)])
@@ -0,0 +1,95 @@
+
+import itertools
+import random
+import unittest
+
+from openrange.frames import format_frame_spec, parse_frame_spec
+from openrange.rng import Range
+
+def _frames(pieces):
+    return list(itertools.chain.from_iterable(
+        [p] if isinstance(p, int) else list(p) for p in pieces))
+
+class TestParseFrameSpec(unittest.TestCase):
+
+    def test_tokens(self):
+        ranges = parse_frame_spec("1-100x2,150,200-250")
+        self.assertEqual(
+            ranges, [Range(1, 99, 2), Range(150, 150), Range(200, 250)])
+        self.assertEqual(
+            _frames(ranges),
+            list(range(1, 101, 2)) + [150] + list(range(200, 251)))
+
+    def test_descending(self):
+        self.assertEqual(list(parse_frame_spec("10-1x3")[0]), [10, 7, 4, 1])
+        self.assertEqual(list(parse_frame_spec("3-1")[0]), [3, 2, 1])
+
+    def test_negative(self):
+        self.assertEqual(
+            _frames(parse_frame_spec("-5--3, -1")), [-5, -4, -3, -1])
+
+    def test_stop_off_step(self):
+        self.assertEqual(parse_frame_spec("1-10x4")[0].stop, 9)
+
+    def test_huge(self):
+        rng = parse_frame_spec("0-1000000000000x2")[0]
+        self.assertEqual(rng.length, 500000000001)
+
+    def test_empty(self):
+        self.assertEqual(parse_frame_spec(""), [])
+        self.assertEqual(parse_frame_spec("  "), [])
+
+    def test_invalid(self):
+        for spec in ("1-", "a", "1-5x", "1-5x0", "1,,2", "1-5x-2", "1.5"):
+            self.assertRaises(ValueError, parse_frame_spec, spec)
+
+class TestFormatFrameSpec(unittest.TestCase):
+
+    def test_ranges(self):
+        self.assertEqual(
+            format_frame_spec(
+                [Range(1, 100, 2), Range(150, 150), Range(200, 250)]),
+            "1-99x2,150,200-250")
+
+    def test_merge(self):
+        self.assertEqual(
+            format_frame_spec([Range(1, 10), Range(11, 20), 21]), "1-21")
+        self.assertEqual(format_frame_spec([1, 3, 5, Range(7, 11, 2)]),
+                         "1-11x2")
+        self.assertEqual(format_frame_spec([1, 5, 6, 7]), "1,5-7")
+
+    def test_frame_list(self):
+        self.assertEqual(
+            format_frame_spec(list(range(1, 101)) + [150, 152]),
+            "1-100,150,152")
+        self.assertEqual(format_frame_spec([10, 9, 8, 7]), "10-7")
+        self.assertEqual(format_frame_spec([4, 4]), "4,4")
+
+    def test_empty(self):
+        self.assertEqual(format_frame_spec([]), "")
+        self.assertEqual(format_frame_spec([Range(5, 1)]), "")
+
+    def test_non_integer(self):
+        self.assertRaises(ValueError, format_frame_spec, [Range(1, 2, .5)])
+
+    def test_round_trip_fuzz(self):
+        rand = random.Random(0)
+
+        for _ in range(500):
+            pieces = []
+            for _ in range(rand.randint(0, 8)):
+                if rand.random() < .5:
+                    pieces.append(rand.randint(-20, 20))
+                else:
+                    start = rand.randint(-20, 20)
+                    step = rand.choice([-3, -2, -1, 1, 2, 3])
+                    stop = start + step * rand.randint(0, 10)
+                    pieces.append(Range(start, stop, step))
+
+            spec = format_frame_spec(pieces)
+            ranges = parse_frame_spec(spec)
+            self.assertEqual(_frames(ranges), _frames(pieces), spec)
+            self.assertLessEqual(len(format_frame_spec(ranges)), len(spec))
+
+            flat = format_frame_spec(_frames(pieces))
+            self.assertEqual(_frames(parse_frame_spec(flat)), _frames(pieces))
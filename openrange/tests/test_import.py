@@ -0,0 +1,52 @@
+
+import subprocess
+import sys
+import unittest
+
+import openrange
+
+# generous upper bound (seconds) for a bare "import openrange"
+IMPORT_BUDGET = 0.05
+
+def _run(code):
+    """Run code in a fresh interpreter and return its stripped stdout."""
+    return subprocess.check_output([sys.executable, '-c', code]).decode(
+        'utf-8').strip()
+
+@unittest.skipIf(sys.version_info < (3, 7), "requires lazy module attributes")
+class TestImport(unittest.TestCase):
+
+    def test_import_is_lazy(self):
+        loaded = _run(
+            "import sys, openrange; "
+            "print(' '.join(sorted(m for m in ("
+            "'pkg_resources', 'openrange.base', 'openrange.dt', 'numpy', "
+            "'concurrent.futures') if m in sys.modules)))"
+        )
+        self.assertEqual(loaded, "")
+
+    def test_import_budget(self):
+        seconds = float(_run(
+            "import time; start = time.perf_counter(); import openrange; "
+            "print(time.perf_counter() - start)"
+        ))
+        self.assertLess(seconds, IMPORT_BUDGET)
+
+    def test_epoch_is_deferred(self):
+        self.assertEqual(
+            _run("import openrange.dt as dt; print(dt._EPOCH)"), "None")
+
+    def test_lazy_attributes(self):
+        from openrange.dt import DatetimeRange
+        from openrange.rng import Range
+
+        self.assertIs(openrange.Range, Range)
+        self.assertIs(openrange.DatetimeRange, DatetimeRange)
+        self.assertIn('Range', dir(openrange))
+        self.assertTrue(isinstance(openrange.__version__, str))
+        self.assertRaises(AttributeError, getattr, openrange, 'NoSuchRange')
+
+    def test_epoch(self):
+        import openrange.dt as dt
+        self.assertEqual(dt.EPOCH, dt._epoch())
+        self.assertRaises(AttributeError, getattr, dt, 'NO_SUCH_NAME')
@@ -0,0 +1,115 @@
+
+from datetime import date, datetime, timedelta
+import random
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from openrange.dt import DateRange, DatetimeRange
+from openrange.geom import GeometricRange
+from openrange.merging import merge, merge_arrays
+from openrange.rng import Range
+
+def _random_ranges(seed, count=50):
+    rand = random.Random(seed)
+    ranges = []
+    for _ in range(count):
+        start = rand.randint(-200, 200)
+        step = rand.choice([-7, -3, -1, 1, 2, 5, 11])
+        ranges.append(Range(start, start + step * rand.randint(0, 60), step))
+    return ranges
+
+def _expected(ranges, dedup=True):
+    items = sorted(item for rng in ranges for item in rng)
+    if dedup:
+        items = sorted(set(items))
+    return items
+
+class TestMerge(unittest.TestCase):
+
+    def test_merge(self):
+        ranges = _random_ranges(0)
+        self.assertEqual(list(merge(*ranges)), _expected(ranges))
+        self.assertEqual(
+            list(merge(*ranges, dedup=False)), _expected(ranges, dedup=False))
+
+    def test_empty(self):
+        self.assertEqual(list(merge()), [])
+        self.assertEqual(list(merge(Range(5, 1), Range(3, 2))), [])
+        self.assertEqual(list(merge(Range(5, 1), Range(1, 3))), [1, 2, 3])
+
+    def test_lazy(self):
+        stream = merge(Range(0, 10 ** 20, 3), Range(10 ** 20, 0, -2))
+        self.assertEqual([next(stream) for _ in range(6)], [0, 2, 3, 4, 6, 8])
+
+    def test_dedup_skips_conversion(self):
+        converted = []
+
+        class _Counting(Range):
+            def _num_to_item(self, num):
+                converted.append(num)
+                return super(_Counting, self)._num_to_item(num)
+
+        ranges = [_Counting(0, 10), _Counting(0, 10, 2), _Counting(10, 0, -5)]
+        self.assertEqual(list(merge(*ranges)), list(range(11)))
+        self.assertEqual(sorted(converted), list(range(11)))
+
+    def test_datetimes(self):
+        start = datetime(2024, 1, 1)
+        ranges = [
+            DatetimeRange(start, start + timedelta(hours=6),
+                          timedelta(minutes=45)),
+            DatetimeRange(start + timedelta(hours=6), start,
+                          -timedelta(hours=1)),
+            DatetimeRange(start + timedelta(minutes=10),
+                          start + timedelta(hours=2), timedelta(minutes=20)),
+        ]
+        self.assertEqual(list(merge(*ranges)), _expected(ranges))
+
+    def test_geometric(self):
+        ranges = [GeometricRange(1, 1024, 2), GeometricRange(729, 1, 1 / 3.0),
+                  GeometricRange(4, 4096, 4)]
+        self.assertEqual(list(merge(*ranges)), _expected(ranges))
+
+    def test_bad_args(self):
+        self.assertRaises(
+            TypeError, list, merge(Range(0, 3), DateRange(
+                date(2024, 1, 1), date(2024, 1, 3), timedelta(days=1))))
+        self.assertRaises(TypeError, list, merge(Range(0, 3), foo=True))
+
+@unittest.skipIf(numpy is None, "requires numpy")
+class TestMergeArrays(unittest.TestCase):
+
+    def test_matches_merge(self):
+        ranges = _random_ranges(1)
+        for chunk_size in [1, 7, 64, 10 ** 4]:
+            for dedup in [True, False]:
+                chunks = list(merge_arrays(
+                    *ranges, dedup=dedup, chunk_size=chunk_size))
+                self.assertTrue(all(len(c) <= chunk_size for c in chunks))
+                self.assertEqual(
+                    numpy.concatenate(chunks).tolist(),
+                    list(merge(*ranges, dedup=dedup)))
+
+    def test_datetimes(self):
+        start = datetime(2024, 1, 1)
+        ranges = [
+            DatetimeRange(start, start + timedelta(days=2),
+                          timedelta(minutes=45)),
+            DatetimeRange(start + timedelta(days=1), start,
+                          -timedelta(hours=1)),
+        ]
+        chunks = list(merge_arrays(*ranges, chunk_size=10))
+        self.assertEqual(chunks[0].dtype, numpy.dtype('M8[us]'))
+        self.assertEqual(
+            numpy.concatenate(chunks).astype(datetime).tolist(),
+            list(merge(*ranges)))
+
+    def test_empty(self):
+        self.assertEqual(list(merge_arrays()), [])
+        self.assertEqual(list(merge_arrays(Range(5, 1))), [])
+        self.assertRaises(
+            ValueError, list, merge_arrays(Range(0, 5), chunk_size=0))
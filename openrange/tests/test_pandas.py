@@ -0,0 +1,122 @@
+
+from datetime import date, datetime, time, timedelta
+import unittest
+
+try:
+    import numpy
+    import pandas
+except ImportError:
+    numpy = pandas = None
+
+from openrange.dt import DateRange, DatetimeRange, TimeRange
+from openrange.rng import Range
+
+@unittest.skipIf(pandas is None, "requires numpy and pandas")
+class TestToPandas(unittest.TestCase):
+
+    def test_range_index(self):
+        index = Range(1, 100, 3).to_pandas()
+        self.assertTrue(isinstance(index, pandas.RangeIndex))
+        self.assertEqual(index.tolist(), list(Range(1, 100, 3)))
+
+        index = Range(10, 1, -2).to_pandas()
+        self.assertEqual(index.tolist(), [10, 8, 6, 4, 2])
+
+        self.assertEqual(len(Range(5, 1).to_pandas()), 0)
+
+    def test_float_index(self):
+        index = Range(0, 1, .25).to_pandas()
+        self.assertFalse(isinstance(index, pandas.RangeIndex))
+        self.assertEqual(index.dtype, numpy.float64)
+        self.assertEqual(index.tolist(), [0, .25, .5, .75, 1])
+
+    def test_huge_range(self):
+        index = Range(2 ** 64, 2 ** 64 + 2).to_pandas()
+        self.assertEqual(index.tolist(), [2 ** 64, 2 ** 64 + 1, 2 ** 64 + 2])
+
+    def test_datetime_index(self):
+        rng = DatetimeRange(
+            datetime(2024, 3, 1), datetime(2024, 3, 2), timedelta(minutes=90))
+        index = rng.to_pandas()
+        self.assertTrue(isinstance(index, pandas.DatetimeIndex))
+        self.assertEqual(index.freq, pandas.Timedelta(minutes=90))
+        self.assertEqual(index.to_pydatetime().tolist(), list(rng))
+
+    def test_datetime_index_inexact_step(self):
+        rng = DatetimeRange.by_count(
+            datetime(2024, 3, 1), datetime(2024, 3, 1, 0, 0, 1), 4)
+        index = rng.to_pandas()
+        self.assertTrue(isinstance(index, pandas.DatetimeIndex))
+        self.assertEqual(index.to_pydatetime().tolist(), list(rng))
+
+    def test_date_index(self):
+        rng = DateRange(date(2024, 1, 30), date(2024, 3, 1), timedelta(days=7))
+        index = rng.to_pandas()
+        self.assertTrue(isinstance(index, pandas.DatetimeIndex))
+        self.assertEqual([d.date() for d in index], list(rng))
+
+        rng = DateRange(date(2024, 1, 1), date(2024, 1, 3), timedelta(hours=12))
+        self.assertEqual([d.date() for d in rng.to_pandas()], list(rng))
+
+    def test_timedelta_index(self):
+        rng = TimeRange(time(9), time(17), timedelta(hours=2))
+        index = rng.to_pandas()
+        self.assertTrue(isinstance(index, pandas.TimedeltaIndex))
+        self.assertEqual(
+            [(datetime.min + d).time() for d in index.to_pytimedelta()],
+            list(rng))
+
+    def test_timedelta_index_midnight(self):
+        rng = TimeRange(time(22), time(2), timedelta(hours=1))
+        index = rng.to_pandas()
+        self.assertEqual(
+            [(datetime.min + d).time() for d in index.to_pytimedelta()],
+            list(rng))
+
+    def test_to_array_datetime64(self):
+        rng = DatetimeRange(
+            datetime(2024, 3, 1), datetime(2024, 3, 2), timedelta(hours=6))
+        values = rng.to_array()
+        self.assertEqual(values.dtype, numpy.dtype('M8[us]'))
+        self.assertEqual(values.astype(datetime).tolist(), list(rng))
+
+        rng = TimeRange(time(22), time(2), timedelta(minutes=45))
+        self.assertEqual(rng.to_array().tolist(), list(rng))
+
+@unittest.skipIf(pandas is None, "requires numpy and pandas")
+class TestFromPandas(unittest.TestCase):
+
+    def test_range_index(self):
+        self.assertEqual(
+            Range.from_pandas(pandas.RangeIndex(3, 30, 4)), Range(3, 27, 4))
+        self.assertEqual(
+            len(Range.from_pandas(pandas.RangeIndex(0))), 0)
+
+    def test_numeric_index(self):
+        self.assertEqual(
+            Range.from_pandas(pandas.Index([1, 3, 5, 7])), Range(1, 7, 2))
+        self.assertEqual(
+            Range.from_pandas(pandas.Index([0, .5, 1.])), Range(0, 1, .5))
+
+    def test_irregular(self):
+        self.assertRaises(
+            ValueError, Range.from_pandas, pandas.Index([1, 2, 4]))
+        self.assertRaises(
+            ValueError, DatetimeRange.from_pandas, pandas.DatetimeIndex([]))
+
+    def test_timezone_aware(self):
+        index = pandas.date_range('2024-01-01', periods=3, freq='h', tz='UTC')
+        self.assertRaises(ValueError, DatetimeRange.from_pandas, index)
+
+    def test_round_trip(self):
+        ranges = [
+            DatetimeRange(datetime(2024, 3, 1), datetime(2024, 3, 2),
+                          timedelta(minutes=90)),
+            DateRange(date(2024, 1, 1), date(2024, 12, 31),
+                      timedelta(days=7)),
+            TimeRange(time(9), time(17), timedelta(minutes=30)),
+            Range(0, 1000, 10),
+        ]
+
+        for rng in ranges:
+            self.assertEqual(type(rng).from_pandas(rng.to_pandas()), rng)
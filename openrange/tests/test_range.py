@@ -1,5 +1,14 @@
+from fractions import Fraction
+import itertools
 import unittest
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from six import integer_types
+
 from openrange.rng import Range
 
 class TestRange(unittest.TestCase):
@@ -192,6 +201,17 @@ class TestRange(unittest.TestCase):
         self.assertEqual(rng.stop, 1.0)
         self.assertEqual(rng.step, .2)
 
+    def test_reverse_off_step(self):
+        rng = Range(0, 10, 3)
+        rng.reverse()
+        self.assertEqual(list(rng), [9, 6, 3, 0])
+        self.assertEqual(list(rng), list(reversed(Range(0, 10, 3))))
+
+        for rng in (Range(10, 0, -4), Range(0.5, 2.0, 0.4), Range(5, 1)):
+            items = list(rng)
+            rng.reverse()
+            self.assertEqual(list(rng), items[::-1])
+
     # property getter tests
 
     def test_int_range_properties_get(self):
@@ -230,7 +250,28 @@ class TestRange(unittest.TestCase):
         self.assertEqual(rng[3], .7)
         self.assertEqual(rng[4], .9)
 
-    # TODO: negative indexes, slice objects
+    def test_negative_index(self):
+        rng = Range(1, 10, 2)
+        self.assertEqual(rng[-1], 9)
+        self.assertEqual(rng[-5], 1)
+
+    # slicing tests
+
+    def test_slice_returns_range(self):
+        rng = Range(0, 20, 2)
+        sub = rng[2:8:2]
+        self.assertTrue(isinstance(sub, Range))
+        self.assertEqual(list(sub), [4, 8, 12])
+        self.assertEqual(sub.step, 4)
+
+    def test_slice_matches_list(self):
+        rng = Range(.5, 9.5, .75)
+        items = list(rng)
+        for slc in (slice(None), slice(3, None), slice(None, -2),
+                    slice(None, None, -1), slice(10, 2, -3), slice(5, 5),
+                    slice(-4, None, 2), slice(20, 30)):
+            self.assertEqual(list(rng[slc]), items[slc])
+            self.assertEqual(len(rng[slc]), len(items[slc]))
 
     # __len__ tests
 
@@ -250,6 +291,49 @@ class TestRange(unittest.TestCase):
         rng = Range(.9, .27, -.08)
         self.assertEqual(len(rng), 8)
 
+    def test_len_empty_fractional(self):
+        rng = Range(0, .5, -1)
+        self.assertEqual(len(rng), 0)
+        self.assertEqual(list(rng), [])
+
+    # huge range tests
+
+    def test_huge_length(self):
+        rng = Range(0, 10 ** 30, 3)
+        self.assertEqual(rng.length, 10 ** 30 // 3 + 1)
+        self.assertRaises(OverflowError, len, rng)
+
+    def test_huge_bool(self):
+        rng = Range(0, 10 ** 22, 3)
+        self.assertTrue(rng)
+        self.assertTrue(rng.map(str))
+        self.assertTrue(rng.windows(2))
+        self.assertTrue(rng.repeat(10 ** 4))
+        self.assertFalse(Range(5, 1))
+        self.assertFalse(rng.map(str)[:0])
+        self.assertFalse(Range(5, 1).windows(2))
+
+    def test_huge_indexing(self):
+        rng = Range(7, 10 ** 25 + 7, 1)
+        self.assertEqual(rng[10 ** 24], 10 ** 24 + 7)
+        self.assertEqual(rng[-1], 10 ** 25 + 7)
+        self.assertEqual(rng.index(10 ** 22 + 8), 10 ** 22 + 1)
+        self.assertTrue(10 ** 25 in rng)
+        self.assertRaises(IndexError, rng.__getitem__, 10 ** 25 + 1)
+        self.assertRaises(IndexError, rng.__getitem__, -(10 ** 25 + 2))
+
+    def test_huge_slice(self):
+        rng = Range(0, 10 ** 21)
+        sub = rng[10 ** 20::10 ** 19]
+        self.assertEqual(sub.length, 91)
+        self.assertEqual(sub[-1], 10 ** 21)
+
+    def test_huge_random(self):
+        rng = Range(0, 10 ** 20)
+        items = list(itertools.islice(rng.random(), 100))
+        self.assertEqual(len(set(items)), 100)
+        self.assertTrue(all(i in rng for i in items))
+
     # index tests
 
     def test_index_int(self):
@@ -276,3 +360,448 @@ class TestRange(unittest.TestCase):
         rng = Range(0, 10, 2)
         self.assertEqual(rng.count(4), 1)
 
+
+    # map tests
+
+    def test_map(self):
+        calls = []
+        def double(x):
+            calls.append(x)
+            return x * 2
+        mapped = Range(0, 10, 2).map(double)
+        self.assertEqual(len(mapped), 6)
+        self.assertEqual(mapped[2], 8)
+        self.assertEqual(calls, [4])
+        self.assertEqual(list(mapped), [0, 4, 8, 12, 16, 20])
+
+    def test_map_slice_is_lazy(self):
+        calls = []
+        def path(x):
+            calls.append(x)
+            return "frame.{0:04d}.exr".format(x)
+        mapped = Range(1, 100).map(path)
+        sub = mapped[10:20:3]
+        self.assertEqual(calls, [])
+        self.assertEqual(len(sub), 4)
+        self.assertEqual(sub[-1], "frame.0020.exr")
+        self.assertEqual(list(sub[1:3]), ["frame.0014.exr", "frame.0017.exr"])
+
+    def test_map_cache(self):
+        calls = []
+        def square(x):
+            calls.append(x)
+            return x * x
+        mapped = Range(10).map(square, cache=2)
+        mapped[3], mapped[3], mapped[4]
+        self.assertEqual(calls, [3, 4])
+        mapped[5], mapped[3]
+        self.assertEqual(calls, [3, 4, 5, 3])
+        self.assertRaises(ValueError, Range(10).map, square, cache=0)
+
+    def test_map_cache_recency(self):
+        calls = []
+        def square(x):
+            calls.append(x)
+            return x * x
+        mapped = Range(10).map(square, cache=2)
+        mapped[3], mapped[4], mapped[3], mapped[5]
+        self.assertEqual(calls, [3, 4, 5])
+        mapped[3], mapped[4]
+        self.assertEqual(calls, [3, 4, 5, 4])
+
+    def test_map_slices(self):
+        mapped = Range(100).map(str)
+        items = [str(x) for x in range(101)]
+        for (outer, inner) in [
+                (slice(10, 90, 3), slice(2, -2, 2)),
+                (slice(None, None, -1), slice(5, 50, 7)),
+                (slice(90, 10, -4), slice(None, None, -1)),
+                (slice(3, 3), slice(None))]:
+            sliced = mapped[outer][inner]
+            self.assertEqual(list(sliced), items[outer][inner])
+            self.assertEqual(len(sliced), len(items[outer][inner]))
+        self.assertEqual(mapped[::-1][-1], "0")
+        self.assertRaises(IndexError, mapped[::2].__getitem__, 51)
+
+        huge = Range(0, 10 ** 20).map(str)[::-2]
+        self.assertEqual(huge.length, 5 * 10 ** 19 + 1)
+        self.assertEqual(list(huge[:2]), [str(10 ** 20), str(10 ** 20 - 2)])
+
+    # freeze / __hash__ tests
+
+    def test_unfrozen_unhashable(self):
+        self.assertRaises(TypeError, hash, Range(0, 10, 2))
+
+    def test_frozen_hash(self):
+        rng1 = Range(0, 10, 2).freeze()
+        rng2 = Range(0.0, 11, 2.0).freeze()
+        self.assertTrue(rng1.frozen)
+        self.assertEqual(rng1, rng2)
+        self.assertEqual(hash(rng1), hash(rng2))
+        cache = {rng1: "result"}
+        self.assertEqual(cache[rng2], "result")
+        self.assertFalse(Range(0, 10, 3).freeze() in cache)
+
+    def test_frozen_reverse(self):
+        rng = Range(0, 10, 2).freeze()
+        self.assertRaises(TypeError, rng.reverse)
+        self.assertEqual(list(reversed(rng)), [10, 8, 6, 4, 2, 0])
+        self.assertEqual(list(rng), [0, 2, 4, 6, 8, 10])
+
+    def test_reversed_off_grid(self):
+        # stop is not an item
+        rng = Range(0, 10, 3)
+        self.assertEqual(list(reversed(rng)), [9, 6, 3, 0])
+        self.assertEqual(reversed(rng), rng[::-1])
+        self.assertEqual(list(reversed(Range(5, 1))), [])
+
+    # fingerprint tests
+
+    def test_fingerprint(self):
+        self.assertEqual(Range(0, 10, 2).fingerprint(),
+            Range(0.0, 11.0, 2.0).fingerprint())
+        self.assertNotEqual(Range(0, 10, 2).fingerprint(),
+            Range(0, 12, 2).fingerprint())
+        self.assertEqual(Range(0, 10, 2).fingerprint(),
+            "fd12ab950524c0eb9679d82f27cbdb3f"
+            "0bec8139b24b81e8047abd39ad025ee4")
+
+    # floor / ceil / nearest tests
+
+    def test_floor_ceil(self):
+        rng = Range(0, 20, 5)
+        self.assertEqual(rng.floor(12), 10)
+        self.assertEqual(rng.ceil(12), 15)
+        self.assertEqual(rng.floor(15), 15)
+        self.assertEqual(rng.ceil(15), 15)
+        self.assertEqual(rng.floor_index(12), 2)
+        self.assertEqual(rng.ceil_index(12), 3)
+
+    def test_floor_ceil_bounds(self):
+        rng = Range(0, 20, 5)
+        self.assertEqual(rng.floor(100), 20)
+        self.assertEqual(rng.ceil(-100), 0)
+        self.assertRaises(ValueError, rng.floor, -1)
+        self.assertRaises(ValueError, rng.ceil, 21)
+
+    def test_floor_ceil_float(self):
+        rng = Range(.1, 1.0, .2)
+        self.assertEqual(rng.floor(.35), .3)
+        self.assertEqual(rng.ceil(.35), .5)
+        self.assertEqual(rng.floor(.5), .5)
+
+    def test_floor_ceil_negative_step(self):
+        rng = Range(20, 0, -5)
+        self.assertEqual(rng.floor(12), 10)
+        self.assertEqual(rng.floor_index(12), 2)
+        self.assertEqual(rng.ceil(12), 15)
+        self.assertEqual(rng.ceil_index(12), 1)
+        self.assertEqual(rng.floor(100), 20)
+        self.assertRaises(ValueError, rng.floor, -1)
+
+    def test_nearest(self):
+        rng = Range(0, 20, 5)
+        self.assertEqual(rng.nearest(6), 5)
+        self.assertEqual(rng.nearest(9), 10)
+        self.assertEqual(rng.nearest(-7), 0)
+        self.assertEqual(rng.nearest(70), 20)
+        self.assertEqual(rng.nearest_index(7.5), 1)
+        self.assertEqual(Range(20, 0, -5).nearest_index(7.5), 2)
+        self.assertRaises(ValueError, Range(0, 1, -1).nearest, 0)
+
+    # bucketize / histogram tests
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_bucketize(self):
+        rng = Range(0, 20, 5)
+        values = numpy.array([0, 4, 5, 12, 24, 25, -1])
+        self.assertEqual(rng.bucketize(values).tolist(),
+            [0, 0, 1, 2, 4, -1, -1])
+        self.assertEqual(rng.bucketize(values, out_of_range='clip').tolist(),
+            [0, 0, 1, 2, 4, 4, 0])
+        self.assertRaises(ValueError, rng.bucketize, values,
+            out_of_range='raise')
+        self.assertRaises(ValueError, rng.bucketize, values,
+            out_of_range='ignore')
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_bucketize_matches_floor_index(self):
+        for rng in (Range(.1, 1.1, .2), Range(1.1, .1, -.2)):
+            values = [.1, .25, .3, .5, .69, .7, .9, 1.1, 1.25]
+            expected = [rng.floor_index(v) for v in values]
+            self.assertEqual(rng.bucketize(values).tolist(), expected)
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_bucketize_large_magnitude(self):
+        rngs = (
+            Range(1600000000, 1700000000, 300),
+            Range(1700000000, 1600000000, -300),
+            Range(0, 4 * 10 ** 9),
+            Range(0.0, 4e9, 1.0),
+            Range(1.6e9, 1.7e9, 0.25),
+        )
+        for rng in rngs:
+            values = [1690000000 - 0.05, 1690000000, 1690000000 + 0.05,
+                      1690000000.5, 1999999999.5 - 3e8, 1650000000.25]
+            expected = [rng.floor_index(v) for v in values]
+            self.assertEqual(rng.bucketize(values).tolist(), expected)
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_histogram(self):
+        rng = Range(0, 20, 5)
+        counts = rng.histogram(iter([1, 2, 3, 7, 19, 21, 30, -3]))
+        self.assertEqual(counts.tolist(), [3, 1, 0, 1, 1])
+
+    # sample / choice tests
+
+    def test_sample(self):
+        rng = Range(0, 10 ** 7, 3)
+        items = rng.sample(1000, seed=1)
+        self.assertEqual(len(items), 1000)
+        self.assertEqual(len(set(items)), 1000)
+        self.assertTrue(all(i in rng for i in items))
+        self.assertEqual(items, rng.sample(1000, seed=1))
+
+    def test_sample_dense(self):
+        rng = Range(1, 10)
+        items = rng.sample(10, seed=3)
+        self.assertEqual(sorted(items), list(rng))
+        self.assertEqual(len(set(rng.sample(7))), 7)
+        self.assertEqual(rng.sample(0), [])
+        self.assertRaises(ValueError, rng.sample, 11)
+        self.assertRaises(ValueError, rng.sample, -1)
+
+    def test_sample_huge(self):
+        rng = Range(0, 10 ** 20)
+        self.assertEqual(len(set(rng.sample(50))), 50)
+
+    def test_choice(self):
+        rng = Range(0, 1, .25)
+        self.assertTrue(rng.choice() in rng)
+        self.assertEqual(rng.choice(seed=5), rng.choice(seed=5))
+        self.assertRaises(IndexError, Range(0, 1, -1).choice)
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_sample_array(self):
+        rng = Range(0, 10 ** 7, 3)
+        items = rng.sample_array(1000, seed=2)
+        self.assertEqual(items.dtype, numpy.int64)
+        self.assertEqual(len(numpy.unique(items)), 1000)
+        self.assertTrue(all(i in rng for i in items.tolist()))
+        self.assertEqual(items.tolist(), rng.sample_array(1000, seed=2).tolist())
+
+    # shard tests
+
+    def test_shard_contiguous(self):
+        rng = Range(0, 100, 7)
+        shards = [rng.shard(i, 4) for i in range(4)]
+        self.assertTrue(all(isinstance(s, Range) for s in shards))
+        self.assertEqual([len(s) for s in shards], [4, 4, 4, 3])
+        self.assertEqual(sum([list(s) for s in shards], []), list(rng))
+
+    def test_shard_strided(self):
+        rng = Range(0, 100, 7)
+        shards = [rng.shard(i, 4, mode='strided') for i in range(4)]
+        self.assertEqual([len(s) for s in shards], [4, 4, 4, 3])
+        self.assertEqual(sorted(sum([list(s) for s in shards], [])), list(rng))
+        self.assertEqual(list(shards[1]), [7, 35, 63, 91])
+
+    def test_shard_more_shards_than_items(self):
+        rng = Range(1, 3)
+        self.assertEqual([list(rng.shard(i, 5)) for i in range(5)],
+            [[1], [2], [3], [], []])
+
+    def test_shard_huge(self):
+        rng = Range(0, 10 ** 20 - 1)
+        shard = rng.shard(999, 1000)
+        self.assertEqual(shard.length, 10 ** 17)
+        self.assertEqual(shard[0], 999 * 10 ** 17)
+
+    def test_shard_bad_args(self):
+        rng = Range(10)
+        self.assertRaises(ValueError, rng.shard, 0, 0)
+        self.assertRaises(ValueError, rng.shard, 3, 3)
+        self.assertRaises(ValueError, rng.shard, -1, 3)
+        self.assertRaises(ValueError, rng.shard, 0, 3, mode='random')
+
+    def test_by_count(self):
+        rng = Range.by_count(0.0, 1.0, 11)
+        self.assertEqual(len(rng), 11)
+        self.assertEqual(list(rng), [i / 10.0 for i in range(11)])
+        self.assertEqual(rng[-1], 1)
+        self.assertEqual(Range.by_count(0, 10, 5), [0, 2.5, 5, 7.5, 10])
+        self.assertEqual(list(Range.by_count(1, 0, 3)), [1, .5, 0])
+
+    def test_by_count_exact_endpoint(self):
+        # a rounded step falls short of the endpoint
+        rng = Range(0, 1, 1 / 3.0)
+        self.assertNotEqual(rng[-1], 1)
+
+        rng = Range.by_count(0, 1, 4)
+        self.assertEqual(len(rng), 4)
+        self.assertEqual(rng[-1], 1)
+        self.assertEqual(rng.stop, 1)
+        self.assertEqual(rng[::3][-1], 1)
+
+    def test_by_count_lookup(self):
+        rng = Range.by_count(0, 1, 5)
+        self.assertTrue(.25 in rng)
+        self.assertFalse(.3 in rng)
+        self.assertEqual(rng.index(.75), 3)
+        self.assertEqual(rng.floor(.3), .25)
+
+    def test_by_count_lookup_inexact(self):
+        # a step of 1/6 has no exact float or decimal representation
+        rng = Range.by_count(0, 1, 7)
+        items = list(rng)
+        self.assertEqual([item in rng for item in items], [True] * 7)
+        self.assertEqual([rng.index(item) for item in items], list(range(7)))
+        self.assertEqual([rng.floor(item) for item in items], items)
+        self.assertEqual([rng.ceil(item) for item in items], items)
+        self.assertFalse(.16 in rng)
+        self.assertFalse(-1 / 6.0 in rng)
+        self.assertFalse(7 / 6.0 in rng)
+        self.assertEqual(rng.floor(.2), items[1])
+
+    def test_by_count_huge(self):
+        rng = Range.by_count(0, 1, 10 ** 20)
+        self.assertEqual(rng.length, 10 ** 20)
+        self.assertEqual(rng[-1], 1)
+
+    def test_by_count_equality(self):
+        self.assertEqual(Range.by_count(0, 10, 11), Range(0, 10))
+        self.assertEqual(
+            Range.by_count(0, 10, 11).fingerprint(), Range(0, 10).fingerprint())
+
+    def test_by_count_small(self):
+        self.assertEqual(list(Range.by_count(5, 10, 1)), [5])
+        self.assertEqual(list(Range.by_count(5, 10, 0)), [])
+        self.assertRaises(ValueError, Range.by_count, 0, 1, -1)
+        self.assertRaises(ValueError, Range.by_count, 1, 1, 3)
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_by_count_to_array(self):
+        arr = Range.by_count(0, 1, 7).to_array()
+        self.assertEqual(arr.dtype, numpy.float64)
+        self.assertTrue(numpy.allclose(arr, numpy.linspace(0, 1, 7)))
+        self.assertEqual(arr[-1], 1.0)
+
+    def test_aggregates(self):
+        for rng in [Range(3, 100, 7), Range(100, 3, -7), Range(-5, 5),
+                    Range(4, 4)]:
+            items = list(rng)
+            self.assertEqual(rng.sum(), sum(items))
+            self.assertEqual(rng.min(), min(items))
+            self.assertEqual(rng.max(), max(items))
+            self.assertEqual(rng.mean(), sum(items) / float(len(items)))
+            middle = sorted(items)[(len(items) - 1) // 2:len(items) // 2 + 1]
+            self.assertEqual(rng.median(), sum(middle) / float(len(middle)))
+
+        self.assertEqual(Range(1, 4).mean(), 2.5)
+        self.assertEqual(Range(1, 5).median(), 3)
+        self.assertTrue(isinstance(Range(1, 5).median(), int))
+        self.assertEqual(Range(5, 1).sum(), 0)
+        self.assertRaises(ValueError, Range(5, 1).mean)
+        self.assertRaises(ValueError, Range(5, 1).max)
+
+    def test_aggregates_exact(self):
+        rng = Range(0.1, 1.0, 0.1)
+        self.assertEqual(rng.sum(), 5.5)
+        self.assertEqual(rng.mean(), 0.55)
+        self.assertEqual(rng.max(), 1.0)
+
+        huge = Range(1, 10 ** 20)
+        self.assertEqual(huge.sum(), 10 ** 20 * (10 ** 20 + 1) // 2)
+        self.assertEqual(huge.max(), 10 ** 20)
+
+        # ints beyond float precision stay exact
+        huge = Range(10 ** 20 + 1, 10 ** 20 + 3)
+        self.assertEqual(huge.mean(), 10 ** 20 + 2)
+        self.assertTrue(isinstance(huge.mean(), integer_types))
+        self.assertEqual(huge.median(), 10 ** 20 + 2)
+        self.assertEqual(Range(10 ** 20, 10 ** 20 + 3).percentile(0), 10 ** 20)
+
+    def test_aggregates_float(self):
+        rng = Range(0.0, 2.0, 1.0)
+        for value in [rng.mean(), rng.median(), rng.percentile(50),
+                      rng.percentile(0), rng.sum(), rng.min()]:
+            self.assertTrue(isinstance(value, float))
+        self.assertEqual(rng.mean(), 1.0)
+        self.assertEqual(rng.sum(), 3.0)
+        self.assertEqual(rng.percentile(25), 0.5)
+
+        rng = Range(0.5, 4.5, 1.0)
+        self.assertTrue(isinstance(rng.median(), float))
+        self.assertEqual(rng.median(), 2.5)
+        self.assertTrue(isinstance(Range(0, 4).median(), int))
+
+    def test_percentile(self):
+        rng = Range(10, 0, -2)
+        self.assertEqual(rng.percentile(0), 0)
+        self.assertEqual(rng.percentile(100), 10)
+        self.assertEqual(rng.percentile(50), 5)
+        self.assertEqual(rng.percentile(10), 1)
+        self.assertEqual(rng.percentile(12.5), 1.25)
+        self.assertRaises(ValueError, rng.percentile, 101)
+        self.assertRaises(ValueError, rng.percentile, -1)
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_percentile_numpy(self):
+        rng = Range(-7, 50, 3)
+        items = list(rng)
+        for q in [0, 1, 12.5, 33, 50, 87.25, 99, 100]:
+            self.assertAlmostEqual(
+                rng.percentile(q), numpy.percentile(items, q))
+
+    def test_shift(self):
+        rng = Range(1001, 1100)
+        shifted = rng.shift(-8)
+        self.assertEqual(list(shifted), [i - 8 for i in rng])
+        self.assertEqual(rng + 10, Range(1011, 1110))
+        self.assertEqual(10 + rng, Range(1011, 1110))
+        self.assertEqual(rng - 1000, Range(1, 100))
+        self.assertEqual(list(rng), list(range(1001, 1101)))
+
+        rng = Range(0, 1, .1) + .05
+        self.assertTrue(.35 in rng)
+        self.assertEqual(rng[-1], 1.05)
+
+        self.assertRaises(TypeError, lambda: rng + 'a')
+        self.assertRaises(TypeError, lambda: rng - None)
+
+    def test_shift_huge(self):
+        rng = Range(0, 10 ** 20).shift(10 ** 20)
+        self.assertEqual(rng.length, 10 ** 20 + 1)
+        self.assertEqual(rng[-1], 2 * 10 ** 20)
+
+    def test_scale(self):
+        rng = Range(1001, 1100)
+        self.assertEqual(rng.scale(2, origin=0), Range(2002, 2200, 2))
+        self.assertEqual(rng.scale(2), Range(1001, 1199, 2))
+        self.assertEqual(rng.scale(-1), Range(1001, 902, -1))
+        self.assertRaises(ValueError, rng.scale, 0)
+
+        rng = Range(0, 10).scale(.1)
+        self.assertEqual(rng[3], .3)
+        self.assertTrue(.3 in rng)
+        self.assertEqual(rng.index(.7), 7)
+        self.assertEqual(rng[-1], 1)
+
+        rng = Range(0, 24).scale(Fraction(25, 24), origin=0)
+        self.assertEqual(rng[-1], 25)
+        self.assertEqual(rng[12], 12.5)
+
+    def test_scale_float(self):
+        rng = Range(0.0, 2.0, 1.0).scale(2)
+        self.assertEqual(list(rng), [0.0, 2.0, 4.0])
+        self.assertTrue(all(isinstance(x, float) for x in rng))
+        self.assertTrue(isinstance(rng.step, float))
+
+        rng = Range(0.0, 2.0, 1.0).scale(0.5, origin=1.0)
+        self.assertEqual(list(rng), [0.5, 1.0, 1.5])
+        self.assertTrue(all(isinstance(x, float) for x in rng))
+
+    def test_transforms_frozen(self):
+        rng = Range(0, 10).freeze()
+        self.assertFalse((rng + 1).frozen)
+        self.assertFalse(rng.scale(2).frozen)
@@ -0,0 +1,420 @@
+
+"""Lazy sequence views over progressions."""
+
+# ----------------------------------------------------------------------------
+
+from collections import OrderedDict
+import copy
+
+from six import integer_types
+
+from ._compat import import_numpy
+from ._util import range_length, seq_length
+
+# ----------------------------------------------------------------------------
+
+try:
+    from collections.abc import Sequence
+except ImportError:
+    # python 2
+    from collections import Sequence
+
+try:
+    built_in_range = xrange
+except NameError:
+    built_in_range = range
+
+# ----------------------------------------------------------------------------
+
+__all__ = [
+    'MappedRange',
+    'WindowedRange',
+]
+
+# number of items converted per call to a batch function while iterating
+BATCH_SIZE = 4096
+
+# ----------------------------------------------------------------------------
+class MappedRange(Sequence):
+    """Lazy view of a function applied to each item of a progression.
+
+    Nothing is computed up front: indexing evaluates the function for the
+    requested item only and slicing returns another lazy view. Computed
+    values can optionally be kept in a bounded least-recently-used cache,
+    which is shared by all views sliced from the same mapping.
+
+    In batch mode, the function receives a numpy array of items and must
+    return a sequence of results of the same length. Iteration and
+    to_array() then evaluate the function over whole blocks of items.
+    """
+
+    # ------------------------------------------------------------------------
+    def __bool__(self):
+        """Returns True if the view has items, even beyond sys.maxsize."""
+
+        return self.length > 0
+
+    # python 2
+    __nonzero__ = __bool__
+
+    # ------------------------------------------------------------------------
+    def __getitem__(self, index):
+        """Retrieves value(s) from the view for a given index or slice."""
+
+        if isinstance(index, slice):
+            view = copy.copy(self)
+            view._indices = _slice_indices(self._indices, index)
+            return view
+
+        elif isinstance(index, integer_types):
+            return self._compute([_index_at(self._indices, index)])[0]
+
+        else:
+            raise TypeError(
+                "Invalid index type: {t}".format(t=str(type(index))))
+
+    # ------------------------------------------------------------------------
+    def __init__(self, rng, func, cache=None, batch=False):
+        """Constructor.
+
+        Args:
+            rng: the progression to map over.
+            func: function applied to each item, or to an array of items in
+                batch mode.
+            cache: maximum number of computed values to keep. None disables
+                caching.
+            batch: if True, func is called with a numpy array of items.
+
+        Raises:
+            ValueError: if cache is less than 1.
+        """
+
+        if cache is not None and cache < 1:
+            raise ValueError("Cache size must be >= 1.")
+
+        self._range = rng
+        self._func = func
+        self._batch = batch
+        self._cache = _LRUCache(cache) if cache is not None else None
+        self._indices = (0, seq_length(rng), 1)
+
+    # ------------------------------------------------------------------------
+    def __iter__(self):
+        """Generates the mapped value of each item in the view."""
+
+        if not self._batch:
+            for i in built_in_range(*self._indices):
+                yield self._compute([i])[0]
+            return
+
+        for start in built_in_range(0, self.length, BATCH_SIZE):
+            block = built_in_range(*_slice_indices(
+                self._indices, slice(start, start + BATCH_SIZE)))
+            for value in self._compute(block):
+                yield value
+
+    # ------------------------------------------------------------------------
+    def __len__(self):
+        """Returns the length of the view."""
+
+        return self.length
+
+    # ------------------------------------------------------------------------
+    def __repr__(self):
+        """Official string representation of the view."""
+
+        return "{c}({r!r}, {f})".format(
+            c=self.__class__.__name__,
+            r=self._range,
+            f=getattr(self._func, '__name__', repr(self._func)),
+        )
+
+    # ------------------------------------------------------------------------
+    def to_array(self):
+        """Returns a numpy array of all mapped values in the view.
+
+        In batch mode the function is called once for the whole view.
+        Requires numpy.
+        """
+
+        numpy = import_numpy()
+
+        if self._batch:
+            return numpy.asarray(
+                self._func(self._items(built_in_range(*self._indices))))
+
+        return numpy.array(list(self))
+
+    # ------------------------------------------------------------------------
+    @property
+    def length(self):
+        """The length of the view, which may exceed sys.maxsize."""
+        return range_length(*self._indices)
+
+    # ------------------------------------------------------------------------
+    @property
+    def range(self):
+        """The underlying progression."""
+        return self._range
+
+    # ------------------------------------------------------------------------
+    def _compute(self, indices):
+        """Returns the mapped values for the supplied progression indices."""
+
+        cache = self._cache
+
+        if cache is None:
+            return self._evaluate(indices)
+
+        values = [cache.get(i, _MISSING) for i in indices]
+        missing = [n for (n, v) in enumerate(values) if v is _MISSING]
+
+        if missing:
+            computed = self._evaluate([indices[n] for n in missing])
+            for (n, value) in zip(missing, computed):
+                values[n] = value
+                cache.put(indices[n], value)
+
+        return values
+
+    # ------------------------------------------------------------------------
+    def _evaluate(self, indices):
+        """Apply the function to the items at the supplied indices."""
+
+        if self._batch:
+            return list(self._func(self._items(indices)))
+
+        rng = self._range
+        func = self._func
+        return [func(rng[i]) for i in indices]
+
+    # ------------------------------------------------------------------------
+    def _items(self, indices):
+        """Returns a numpy array of the items at the supplied indices."""
+
+        numpy = import_numpy()
+        rng = self._range
+
+        nums = rng._num_array(numpy.asarray(indices, dtype=numpy.int64))
+        return rng._num_array_to_items(nums)
+
+# ----------------------------------------------------------------------------
+class WindowedRange(Sequence):
+    """Lazy sequence of fixed size windows over a progression.
+
+    Window n holds size consecutive items starting at item n * stride, as a
+    sub-progression of the same type. A stride equal to the size gives
+    tumbling windows, a smaller stride gives overlapping sliding windows.
+    If the last window does not fit, it is kept with fewer items when
+    partial is True and dropped otherwise. Windows are only built when
+    indexed, so len() and indexing are O(1).
+    """
+
+    # ------------------------------------------------------------------------
+    def __bool__(self):
+        """Returns True if the view has items, even beyond sys.maxsize."""
+
+        return self.length > 0
+
+    # python 2
+    __nonzero__ = __bool__
+
+    # ------------------------------------------------------------------------
+    def __getitem__(self, index):
+        """Retrieves window(s) for a given index or slice.
+
+        Slicing returns another lazy view.
+        """
+
+        if isinstance(index, slice):
+            view = copy.copy(self)
+            view._indices = _slice_indices(self._indices, index)
+            return view
+
+        elif isinstance(index, integer_types):
+            first = _index_at(self._indices, index) * self._stride
+            last = min(first + self._size, seq_length(self._range))
+            return self._range[first:last]
+
+        else:
+            raise TypeError(
+                "Invalid index type: {t}".format(t=str(type(index))))
+
+    # ------------------------------------------------------------------------
+    def __init__(self, rng, size, stride=None, partial=True):
+        """Constructor.
+
+        Args:
+            rng: the progression to split into windows.
+            size: the number of items in each window.
+            stride: the number of items between the starts of consecutive
+                windows. Defaults to size.
+            partial: if True, keep a final window with fewer than size
+                items.
+
+        Raises:
+            ValueError: if size or stride is less than 1.
+        """
+
+        if stride is None:
+            stride = size
+
+        if size < 1:
+            raise ValueError("Window size must be >= 1.")
+
+        if stride < 1:
+            raise ValueError("Window stride must be >= 1.")
+
+        self._range = rng
+        self._size = size
+        self._stride = stride
+        self._partial = partial
+        self._indices = (
+            0, _window_count(seq_length(rng), size, stride, partial), 1)
+
+    # ------------------------------------------------------------------------
+    def __iter__(self):
+        """Generates each window in the view."""
+
+        for i in built_in_range(self.length):
+            yield self[i]
+
+    # ------------------------------------------------------------------------
+    def __len__(self):
+        """Returns the number of windows in the view."""
+
+        return self.length
+
+    # ------------------------------------------------------------------------
+    def __repr__(self):
+        """Official string representation of the view."""
+
+        return "{c}({r!r}, {s}, stride={t})".format(
+            c=self.__class__.__name__,
+            r=self._range,
+            s=self._size,
+            t=self._stride,
+        )
+
+    # ------------------------------------------------------------------------
+    def to_arrays(self):
+        """Returns numpy arrays of the first and last item of each window.
+
+        The bounds of all windows are computed in a single vectorized pass.
+        Requires numpy.
+        """
+
+        numpy = import_numpy()
+        rng = self._range
+
+        windows = numpy.arange(*self._indices)
+
+        first = windows * self._stride
+        last = numpy.minimum(first + self._size, seq_length(rng)) - 1
+
+        return (
+            rng._num_array_to_items(rng._num_array(first)),
+            rng._num_array_to_items(rng._num_array(last)),
+        )
+
+    # ------------------------------------------------------------------------
+    @property
+    def length(self):
+        """The number of windows, which may exceed sys.maxsize."""
+        return range_length(*self._indices)
+
+    # ------------------------------------------------------------------------
+    @property
+    def range(self):
+        """The underlying progression."""
+        return self._range
+
+    # ------------------------------------------------------------------------
+    @property
+    def size(self):
+        """The number of items in each full window."""
+        return self._size
+
+    # ------------------------------------------------------------------------
+    @property
+    def stride(self):
+        """The number of items between the starts of consecutive windows."""
+        return self._stride
+
+# ----------------------------------------------------------------------------
+_MISSING = object()
+
+# ----------------------------------------------------------------------------
+class _LRUCache(object):
+    """Minimal bounded least-recently-used mapping.
+
+    Entries are moved to the end by reinsertion, as python 2's OrderedDict
+    has no move_to_end().
+    """
+
+    # ------------------------------------------------------------------------
+    def __init__(self, maxsize):
+        self._data = OrderedDict()
+        self._maxsize = maxsize
+
+    # ------------------------------------------------------------------------
+    def get(self, key, default=None):
+        try:
+            value = self._data.pop(key)
+        except KeyError:
+            return default
+        self._data[key] = value
+        return value
+
+    # ------------------------------------------------------------------------
+    def put(self, key, value):
+        self._data.pop(key, None)
+        self._data[key] = value
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+# ----------------------------------------------------------------------------
+def _index_at(indices, index):
+    """Returns the progression index of a view index.
+
+    The view holds the progression indices range(*indices).
+
+    Raises:
+        IndexError: if the index is out of range.
+    """
+
+    (start, stop, step) = indices
+    length = range_length(start, stop, step)
+
+    if index < 0:
+        index += length
+    if index < 0 or index >= length:
+        raise IndexError("Index '{i}' is out of range.".format(i=index))
+
+    return start + index * step
+
+# ----------------------------------------------------------------------------
+def _slice_indices(indices, index):
+    """Returns the (start, stop, step) progression indices of a sliced view."""
+
+    (start, stop, step) = indices
+    (lo, hi, incr) = index.indices(range_length(start, stop, step))
+
+    return (start + lo * step, start + hi * step, step * incr)
+
+# ----------------------------------------------------------------------------
+def _window_count(length, size, stride, partial):
+    """Returns the number of windows over a progression of length items."""
+
+    if length >= size:
+        full = (length - size) // stride + 1
+        covered = (full - 1) * stride + size
+    else:
+        (full, covered) = (0, 0)
+
+    # at most one partial window: the next one, if it reaches items that no
+    # full window covers
+    if partial and covered < length and full * stride < length:
+        return full + 1
+
+    return full
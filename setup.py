@@ -36,7 +36,7 @@ setup(
         "Topic :: Software Development :: Libraries :: Python Modules",
     ],
     description=DESCRIPTION,
-    install_requires=['six>=1.9'],
+    install_requires=['six>=1.9', 'futures>=3.0; python_version < "3"'],
     keywords="openrange range interval progression",
     license='MIT',
     long_description=LONG_DESCRIPTION,